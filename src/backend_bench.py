@@ -0,0 +1,480 @@
+# ----------------------------------------------------------------------------
+# -- Benchmark and parity of the FreeCAD and CadQuery versions of the parts
+# ----------------------------------------------------------------------------
+# -- (c) Felipe Machado
+# -- Area of Electronic Technology. Rey Juan Carlos University (urjc.es)
+# -- https://github.com/felipe-m/freecad_filter_stage
+# -- October-2026
+# ----------------------------------------------------------------------------
+# --- LGPL Licence
+# ----------------------------------------------------------------------------
+#
+# Some parts are made in 2 versions (backends):
+#  - freecad: FreeCAD Part, this directory (src)
+#  - cadquery: CadQuery, directory src_cq
+#
+#   part              freecad                       cadquery
+#   filter_holder     filter_holder_clss.py         cq_filter_holder.py
+#   idler_tensioner   idler_tensioner.py            cq_idler_tensioner.py
+#   tensioner_holder  tensioner_holder.py           cq_tensioner_holder.py
+#   nema_bracket      nemamotor_bracket.py          cq_nemamotor_bracket.py
+#
+# Each part is built in both backends with the same parameters: the filter
+# holder with the arguments of part_bench.args_filter_holder, the tensioner
+# parts with the constants of kidler, and the nema bracket with the
+# constants at the beginning of its files (they are checked to be equal).
+# For each backend and part it measures (in seconds), as part_bench does:
+#  - shape: construction of the part
+#  - mesh: MeshPart.meshFromShape with the deflections of kparts
+#  - total: shape + mesh
+# And it checks that both shapes are the same (parity): volume, area,
+# bounding box and number of facets of the mesh. Then, for each part the
+# faster backend is reported, only if the parity is ok.
+#
+# The files of the parts build the part when they are executed, so only
+# their definitions (until the document is created) are executed here, and
+# the function that makes the part is called for each run.
+# These files set the colors of the objects, so FreeCAD has to be executed
+# with the GUI, from this directory (src). In the python console:
+#   exec(open("backend_bench.py").read())
+# or:
+#   freecad backend_bench.py
+# To choose the parts and the backends, and to save the results in a JSON
+# file, call main from the python console:
+#   import backend_bench
+#   backend_bench.main(['--parts', 'idler_tensioner', '--runs', '10',
+#                       '--output', 'backend.json'])
+#
+# If CadQuery is not installed, only the freecad backend is measured
+
+import os
+import sys
+import ast
+import argparse
+import logging
+from datetime import datetime
+
+import FreeCAD
+import MeshPart
+
+# to get the current directory. Freecad has to be executed from the same
+# directory this file is
+filepath = os.getcwd()
+# to get the components
+sys.path.append(filepath)
+sys.path.append(filepath + '/' + 'comps')
+
+# directory of the CadQuery version
+cq_path = filepath + '/../src_cq/'
+
+try:
+    import cadquery
+except ImportError:
+    cadquery = None
+
+import kparts  # default values for exporting to STL
+import fcprof  # timing of the construction stages
+import part_bench # arguments of the parts, statistics
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# stages that are measured for each part and backend
+STAGE_LIST = ['shape', 'mesh', 'total']
+
+BACKEND_LIST = ['freecad', 'cadquery']
+
+# files and functions that make the parts:
+# part: {backend : (file, function)}
+# file None: the part is made by a class of the project, see get_builder
+BACKEND_PART_DICT = {
+    'filter_holder'    : {'freecad'  : (None, 'ShpFilterHolder'),
+                          'cadquery' : (cq_path + 'cq_filter_holder.py',
+                                        'cq_filter_hoder')},
+    'idler_tensioner'  : {'freecad'  : (filepath + '/idler_tensioner.py',
+                                        'idler_tens'),
+                          'cadquery' : (cq_path + 'cq_idler_tensioner.py',
+                                        'idler_tens')},
+    'tensioner_holder' : {'freecad'  : (filepath + '/tensioner_holder.py',
+                                        'tensioner_holder'),
+                          'cadquery' : (cq_path + 'cq_tensioner_holder.py',
+                                        'tensioner_holder')},
+    'nema_bracket'     : {'freecad'  : (filepath + '/nemamotor_bracket.py',
+                                        'nemamotor_holder'),
+                          'cadquery' : (cq_path + 'cq_nemamotor_bracket.py',
+                                        'nemamotor_holder')},
+    }
+
+# the parts in the order they are benchmarked
+BACKEND_PART_LIST = ['filter_holder', 'idler_tensioner', 'tensioner_holder',
+                     'nema_bracket']
+
+# parity tolerances:
+# relative difference of the volume and the area
+PARITY_REL_TOL = 1e-3
+# difference of the bounding box dimensions, in mm
+PARITY_BBOX_TOL = 0.01
+# relative difference of the number of facets. Both backends make their
+# own faces, so the meshes are not expected to be the same
+PARITY_FACET_TOL = 0.1
+
+
+def load_script_defs (script_file):
+    """ executes the definitions of a file of a part (imports, constants
+    and functions), but not the creation of the part: the statements from
+    the one that creates the document (doc = FreeCAD.newDocument()) are
+    not executed
+
+    Parameters:
+    -----------
+    script_file : str
+        path of the file
+
+    Returns:
+    --------
+    Dictionary with the namespace of the executed definitions
+    """
+    with open(script_file) as py_file:
+        source = py_file.read()
+    module = ast.parse(source, filename = script_file)
+    for ind, stmt in enumerate(module.body):
+        if (    isinstance(stmt, ast.Assign)
+            and isinstance(stmt.value, ast.Call)
+            and isinstance(stmt.value.func, ast.Attribute)
+            and stmt.value.func.attr == 'newDocument'):
+            module.body = module.body[:ind]
+            break
+    namespace = {'__name__' : os.path.splitext(
+                                    os.path.basename(script_file))[0],
+                 '__file__' : script_file}
+    exec(compile(module, script_file, 'exec'), namespace)
+    return namespace
+
+
+def get_shape (built):
+    """ returns the FreeCAD shape of what the function of a part returns:
+    a CadQuery object, a FreeCAD object or an Obj3D
+    """
+    if hasattr(built, 'toFreecad'):
+        return built.toFreecad()
+    if hasattr(built, 'Shape'):
+        return built.Shape
+    return built.shp
+
+
+def get_builder (name, backend):
+    """ returns the function that builds the part name in the backend
+
+    Parameters:
+    -----------
+    name : str
+        name of the part, one of BACKEND_PART_LIST
+    backend : str
+        'freecad' or 'cadquery'
+
+    Returns:
+    --------
+    Tuple of the function, that has the document as argument and returns
+    the FreeCAD shape, and the namespace of the file of the part (None if
+    the part is a class of the project)
+    """
+    script_file, func_name = BACKEND_PART_DICT[name][backend]
+    if script_file is None:
+        part_class = part_bench.get_part_dict()[name][0]
+        part_args = part_bench.args_filter_holder()
+        return (lambda doc: get_shape(part_class(**part_args))), None
+    namespace = load_script_defs(script_file)
+    part_func = namespace[func_name]
+    if name == 'filter_holder':
+        part_args = part_bench.args_filter_holder()
+        def build (doc):
+            namespace['doc'] = doc
+            return get_shape(part_func(**part_args))
+    else:
+        def build (doc):
+            namespace['doc'] = doc
+            return get_shape(part_func())
+    return build, namespace
+
+
+def check_params (namespace_a, namespace_b):
+    """ returns the list of the names of the numeric constants defined in
+    both namespaces with a different value
+    """
+    diff_list = []
+    for key in sorted(set(namespace_a) & set(namespace_b)):
+        val_a = namespace_a[key]
+        val_b = namespace_b[key]
+        if (    not key.startswith('_')
+            and isinstance(val_a, (int, float))
+            and isinstance(val_b, (int, float))
+            and val_a != val_b):
+            diff_list.append(key)
+    return diff_list
+
+
+def get_geometry (shp, mesh_shp):
+    """ returns a dictionary with the values of the shape that are compared
+    """
+    bbox = shp.BoundBox
+    return {'volume' : shp.Volume,
+            'area'   : shp.Area,
+            'bbox'   : [bbox.XLength, bbox.YLength, bbox.ZLength],
+            'points' : mesh_shp.CountPoints,
+            'facets' : mesh_shp.CountFacets}
+
+
+def bench_run (build):
+    """ builds the part once, in a new document, and meshes it
+
+    Returns:
+    --------
+    Tuple with a dictionary of the time of each stage in seconds,
+    and a dictionary with its geometry (see get_geometry)
+    """
+    doc = FreeCAD.newDocument()
+    time_0 = fcprof.clock()
+    shp = build(doc)
+    time_shape = fcprof.clock()
+    mesh_shp = MeshPart.meshFromShape(shp,
+                                      LinearDeflection=kparts.LIN_DEFL,
+                                      AngularDeflection=kparts.ANG_DEFL)
+    time_mesh = fcprof.clock()
+    geometry = get_geometry(shp, mesh_shp)
+    del mesh_shp
+    FreeCAD.closeDocument(doc.Name)
+    run_times = {'shape' : time_shape - time_0,
+                 'mesh'  : time_mesh - time_shape,
+                 'total' : time_mesh - time_0}
+    return run_times, geometry
+
+
+def bench_backend (build, runs = 5, warmup = 1):
+    """ benchmarks the function build of a part in a backend
+
+    Returns:
+    --------
+    Dictionary with the statistics of each stage and the geometry
+    """
+    for run_i in range(warmup):
+        bench_run(build)
+    stage_samples = dict((stage, []) for stage in STAGE_LIST)
+    for run_i in range(runs):
+        run_times, geometry = bench_run(build)
+        for stage in STAGE_LIST:
+            stage_samples[stage].append(run_times[stage])
+    backend_result = {'runs'     : runs,
+                      'stages'   : {},
+                      'geometry' : geometry}
+    for stage in STAGE_LIST:
+        backend_result['stages'][stage] = part_bench.get_stats(
+                                                        stage_samples[stage])
+    return backend_result
+
+
+def rel_diff (val_a, val_b):
+    """ relative difference of 2 values, relative to the largest
+    """
+    max_val = max(abs(val_a), abs(val_b))
+    if max_val == 0:
+        return 0.
+    return abs(val_a - val_b) / max_val
+
+
+def check_parity (geom_a, geom_b,
+                  rel_tol = PARITY_REL_TOL,
+                  bbox_tol = PARITY_BBOX_TOL,
+                  facet_tol = PARITY_FACET_TOL):
+    """ compares the geometry of a part made by 2 backends
+
+    Parameters:
+    -----------
+    geom_a, geom_b : dict
+        geometry of the part, see get_geometry
+    rel_tol : float
+        relative tolerance of the volume and the area
+    bbox_tol : float
+        tolerance of the dimensions of the bounding box (mm)
+    facet_tol : float
+        relative tolerance of the number of facets
+
+    Returns:
+    --------
+    Dictionary: {item : {'freecad', 'cadquery', 'diff', 'ok'}} for the items
+    volume, area, bbox and facets, and 'ok' : True if all are ok
+    """
+    bbox_diff = max(abs(len_a - len_b)
+                    for len_a, len_b in zip(geom_a['bbox'], geom_b['bbox']))
+    diff_dict = {'volume' : (rel_diff(geom_a['volume'], geom_b['volume']),
+                             rel_tol),
+                 'area'   : (rel_diff(geom_a['area'], geom_b['area']),
+                             rel_tol),
+                 'bbox'   : (bbox_diff, bbox_tol),
+                 'facets' : (rel_diff(geom_a['facets'], geom_b['facets']),
+                             facet_tol)}
+    parity = {'ok' : True}
+    for item, (diff, tol) in diff_dict.items():
+        item_ok = diff <= tol
+        parity[item] = {'freecad'  : geom_a[item],
+                        'cadquery' : geom_b[item],
+                        'diff'     : diff,
+                        'ok'       : item_ok}
+        parity['ok'] = parity['ok'] and item_ok
+    return parity
+
+
+def bench_parts (part_list = None, backend_list = None,
+                 runs = 5, warmup = 1):
+    """ benchmarks the parts in the backends and checks their parity
+
+    Parameters:
+    -----------
+    part_list : list of str
+        names of the parts, if None, all the parts of BACKEND_PART_LIST
+    backend_list : list of str
+        backends, if None, all the backends of BACKEND_LIST
+    runs : int
+        number of times each part is built and meshed
+    warmup : int
+        number of runs that are done before, and are not measured
+
+    Returns:
+    --------
+    Dictionary that can be saved as JSON:
+    {'meta'  : {information of the benchmark},
+     'parts' : {name : {'backends' : {backend : {'runs', 'stages',
+                                                 'geometry'}},
+                        'params'   : list of the different constants,
+                        'parity'   : see check_parity,
+                        'faster'   : backend, None if no parity}}}
+    """
+    if not part_list:
+        part_list = BACKEND_PART_LIST
+    if not backend_list:
+        backend_list = BACKEND_LIST
+    if cadquery is None and 'cadquery' in backend_list:
+        logger.warning('CadQuery not installed, only freecad backend')
+        backend_list = [backend for backend in backend_list
+                        if backend != 'cadquery']
+    result = {'meta' : {'date'     : datetime.now().isoformat(),
+                        'freecad'  : '.'.join(FreeCAD.Version()[:3]),
+                        'runs'     : runs,
+                        'warmup'   : warmup,
+                        'lin_defl' : kparts.LIN_DEFL,
+                        'ang_defl' : kparts.ANG_DEFL,
+                        'backends' : backend_list},
+              'parts' : {}}
+    if cadquery is not None:
+        result['meta']['cadquery'] = getattr(cadquery, '__version__', '')
+    # the shapes are built in each run, not read from the cache
+    with part_bench.bench_caches():
+        for name in part_list:
+            part_result = {'backends' : {}, 'params' : [],
+                           'parity' : None, 'faster' : None}
+            namespace_list = []
+            for backend in backend_list:
+                logger.info('benchmarking: ' + name + ' ' + backend)
+                build, namespace = get_builder(name, backend)
+                if namespace is not None:
+                    namespace_list.append(namespace)
+                part_result['backends'][backend] = bench_backend(
+                                                           build,
+                                                           runs = runs,
+                                                           warmup = warmup)
+            if len(namespace_list) == 2:
+                part_result['params'] = check_params(*namespace_list)
+                if part_result['params']:
+                    logger.warning(name + ' different parameters: '
+                                   + ', '.join(part_result['params']))
+            if len(part_result['backends']) == 2:
+                fc_result = part_result['backends']['freecad']
+                cq_result = part_result['backends']['cadquery']
+                parity = check_parity(fc_result['geometry'],
+                                      cq_result['geometry'])
+                part_result['parity'] = parity
+                if parity['ok']:
+                    if (  fc_result['stages']['total']['median']
+                        <= cq_result['stages']['total']['median']):
+                        part_result['faster'] = 'freecad'
+                    else:
+                        part_result['faster'] = 'cadquery'
+                else:
+                    logger.warning(name + ': the backends dont make the '
+                                   + 'same shape')
+            result['parts'][name] = part_result
+    return result
+
+
+def print_result (result):
+    """ prints a table with the median and p95 of each part, backend and
+    stage, and the parity of the backends
+    """
+    header = '%-18s%-10s' % ('part', 'backend')
+    for stage in STAGE_LIST:
+        header += '%12s%10s' % (stage + ' med', 'p95')
+    header += '%14s%14s%10s' % ('volume', 'area', 'facets')
+    print (header)
+    for name in sorted(result['parts']):
+        part_result = result['parts'][name]
+        for backend in sorted(part_result['backends']):
+            backend_result = part_result['backends'][backend]
+            line = '%-18s%-10s' % (name, backend)
+            for stage in STAGE_LIST:
+                stats = backend_result['stages'][stage]
+                line += '%12.4f%10.4f' % (stats['median'], stats['p95'])
+            geometry = backend_result['geometry']
+            line += '%14.3f%14.3f%10d' % (geometry['volume'],
+                                          geometry['area'],
+                                          geometry['facets'])
+            print (line)
+    print ('%-18s%10s%10s%10s%10s%12s' % ('part', 'volume', 'area', 'bbox',
+                                          'facets', 'faster'))
+    for name in sorted(result['parts']):
+        part_result = result['parts'][name]
+        parity = part_result['parity']
+        if parity is None:
+            continue
+        line = '%-18s' % name
+        for item in ['volume', 'area', 'bbox', 'facets']:
+            if parity[item]['ok']:
+                line += '%10s' % 'ok'
+            else:
+                line += '%10.4g' % parity[item]['diff']
+        line += '%12s' % str(part_result['faster'])
+        print (line)
+
+
+def get_arg_parser ():
+    parser = argparse.ArgumentParser(
+                description = 'Benchmark and parity of the FreeCAD and '
+                              'CadQuery versions of the parts')
+    parser.add_argument('-n', '--runs', type = int, default = 5,
+                        help = 'number of measured runs per part')
+    parser.add_argument('-w', '--warmup', type = int, default = 1,
+                        help = 'number of runs not measured per part')
+    parser.add_argument('-p', '--parts', nargs = '+',
+                        choices = BACKEND_PART_LIST,
+                        help = 'parts to benchmark, all if not given')
+    parser.add_argument('-b', '--backends', nargs = '+',
+                        choices = BACKEND_LIST,
+                        help = 'backends to benchmark, all if not given')
+    parser.add_argument('-o', '--output',
+                        help = 'JSON file to save the results')
+    return parser
+
+
+def main (argv = None):
+    if argv is None:
+        argv = sys.argv[1:]
+    # parse_known_args: FreeCAD may pass its own arguments
+    args, _ = get_arg_parser().parse_known_args(argv)
+    result = bench_parts(args.parts, args.backends,
+                         runs = args.runs, warmup = args.warmup)
+    print_result(result)
+    if args.output:
+        part_bench.save_result(result, args.output)
+    return result
+
+
+if __name__ == '__main__':
+    main()
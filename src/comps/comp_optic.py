@@ -2230,6 +2230,13 @@ class PrizLed (object):
        
 
 
+# Breadboard with counterbored holes on the corners (and center) and an array
+# of tapped holes.
+#   drill: 1: the holes are cut in the board
+#          0: drilled texture, the holes are not cut, only their circles are
+#             drawn on the top face. Much faster, for visualization of large
+#             boards
+
 class BreadBoard (object):
 
 
@@ -2250,6 +2257,7 @@ class BreadBoard (object):
                         fc_dir_h = VZ,
                         fc_dir_w = VY,
                         pos = V0,
+                        drill = 1,
                         name = 'breadboard'):
 
         doc = FreeCAD.ActiveDocument
@@ -2300,100 +2308,73 @@ class BreadBoard (object):
 
         extra_headcbore = DraftVecUtils.scaleTo(axis_h, thick-cbored_head_l)
 
-        cbshank1 = fcfun.shp_cylcenxtr(r=cbored_hole_d/2., h=thick,
+        # the counterbore tool is made once, on the first counterbored hole.
+        # The other holes are translated copies of it
+        cbshank = fcfun.shp_cylcenxtr(r=cbored_hole_d/2., h=thick,
                                       normal=fc_dir_h,
                                       ch = 0,
                                       xtr_top=1., xtr_bot=1., 
                                       pos=pos_1cbored)
-        cbholehead1 = fcfun.shp_cylcenxtr(r=cbored_head_d/2.,
+        cbholehead = fcfun.shp_cylcenxtr(r=cbored_head_d/2.,
                                       h=cbored_head_l,
                                       normal=fc_dir_h,
                                       ch = 0,
                                       xtr_top=1., xtr_bot=0., 
                                       pos=pos_1cbored +extra_headcbore)
-        cbore1 = cbshank1.fuse(cbholehead1)
-
-        cbshank2 = fcfun.shp_cylcenxtr(r=cbored_hole_d/2., h=thick,
-                                      normal=fc_dir_h,
-                                      ch = 0,
-                                      xtr_top=1., xtr_bot=1., 
-                                      pos=pos_2cbored)
-        cbholehead2 = fcfun.shp_cylcenxtr(r=cbored_head_d/2.,
-                                      h=cbored_head_l,
-                                      normal=fc_dir_h,
-                                      ch = 0,
-                                      xtr_top=1., xtr_bot=0., 
-                                      pos=pos_2cbored +extra_headcbore)
-        cbore2 = cbshank2.fuse(cbholehead2)
-
-        cbshank3 = fcfun.shp_cylcenxtr(r=cbored_hole_d/2., h=thick,
-                                      normal=fc_dir_h,
-                                      ch = 0,
-                                      xtr_top=1., xtr_bot=1., 
-                                      pos=pos_3cbored)
-        cbholehead3 = fcfun.shp_cylcenxtr(r=cbored_head_d/2.,
-                                      h=cbored_head_l,
-                                      normal=fc_dir_h,
-                                      ch = 0,
-                                      xtr_top=1., xtr_bot=0., 
-                                      pos=pos_3cbored +extra_headcbore)
-        cbore3 = cbshank3.fuse(cbholehead3)
+        cbore_tool = cbshank.fuse(cbholehead)
 
-        cbshank4 = fcfun.shp_cylcenxtr(r=cbored_hole_d/2., h=thick,
-                                      normal=fc_dir_h,
-                                      ch = 0,
-                                      xtr_top=1., xtr_bot=1., 
-                                      pos=pos_4cbored)
-        cbholehead4 = fcfun.shp_cylcenxtr(r=cbored_head_d/2.,
-                                      h=cbored_head_l,
-                                      normal=fc_dir_h,
-                                      ch = 0,
-                                      xtr_top=1., xtr_bot=0., 
-                                      pos=pos_4cbored +extra_headcbore)
-        cbore4 = cbshank4.fuse(cbholehead4)
-
-        cboreholes_list = [cbore2, cbore3, cbore4]
+        cbore_vec_list = [V0,
+                          pos_2cbored - pos_1cbored,
+                          pos_3cbored - pos_1cbored,
+                          pos_4cbored - pos_1cbored]
         if central_cbore == 1:
             poscentral = (  pos_corner
                           + DraftVecUtils.scaleTo(axis_l, length/2.)
                           + DraftVecUtils.scaleTo(axis_w, width/2.))
-            cbshankcentral = fcfun.shp_cylcenxtr(r=cbored_hole_d/2., h=thick,
-                                      normal=fc_dir_h,
-                                      ch = 0,
-                                      xtr_top=1., xtr_bot=1., 
-                                      pos=poscentral)
-            cbholeheadcentral = fcfun.shp_cylcenxtr(r=cbored_head_d/2.,
-                                      h=cbored_head_l,
-                                      normal=fc_dir_h,
-                                      ch = 0,
-                                      xtr_top=1., xtr_bot=0., 
-                                      pos=poscentral +extra_headcbore)
-            cbholecentral = cbshankcentral.fuse(cbholeheadcentral)
-            cboreholes_list.append(cbholecentral)
-
-        cboresholes = cbore1.multiFuse(cboreholes_list)
+            cbore_vec_list.append(poscentral - pos_1cbored)
 
         pos_1st_tap = (   pos_corner
                         + DraftVecUtils.scaleTo(axis_l, hole_sep_edge)
                         + DraftVecUtils.scaleTo(axis_w, hole_sep_edge)
                       )
 
-        tapholes = []
+        # the same with the tapped holes
+        tap_tool = fcfun.shp_cylcenxtr(r=hole_d/2., h=thick,
+                                       normal=fc_dir_h,
+                                       ch = 0,
+                                       xtr_top=1., xtr_bot=1.,
+                                       pos=pos_1st_tap)
+        tap_vec_list = []
         for li in range (int(length)//int(hole_sep)):
             for wi in range (int(width)//int(hole_sep)):
                 # if 50/25 -> range 0,1, will make on 12,5 and 37,5
-                pos_tap = (   pos_1st_tap
-                           +  DraftVecUtils.scaleTo(axis_l, li * hole_sep)
-                           +  DraftVecUtils.scaleTo(axis_w, wi * hole_sep))
-                hole = fcfun.shp_cylcenxtr(r=hole_d/2., h=thick,
-                                           normal=fc_dir_h,
-                                           ch = 0,
-                                           xtr_top=1., xtr_bot=1., 
-                                           pos=pos_tap)
-                tapholes.append(hole)
-
-        allholes = cboresholes.multiFuse(tapholes)
-        shp_breadboard = shp_box.cut(allholes)
+                tap_vec_list.append(
+                                DraftVecUtils.scaleTo(axis_l, li * hole_sep)
+                              + DraftVecUtils.scaleTo(axis_w, wi * hole_sep))
+
+        self.cbore_vec_list = cbore_vec_list
+        self.tap_vec_list = tap_vec_list
+        self.drill = drill
+
+        if drill == 1:
+            shp_cbores = fcfun.shp_array_translate(cbore_tool, cbore_vec_list)
+            shp_taps = fcfun.shp_array_translate(tap_tool, tap_vec_list)
+            # a single boolean operation with both compounds as tools.
+            # They are given as different arguments, because a counterbored
+            # hole may intersect a tapped hole
+            shp_breadboard = shp_box.cut([shp_cbores, shp_taps])
+        else:
+            # drilled texture: no cut, the board is the box with the circles
+            # of the holes on its top face. To see the holes, much faster
+            top_h = DraftVecUtils.scaleTo(axis_h, thick)
+            cir_cbore = Part.makeCircle(cbored_head_d/2.,
+                                        pos_1cbored + top_h,
+                                        axis_h)
+            cir_tap = Part.makeCircle(hole_d/2., pos_1st_tap + top_h, axis_h)
+            shp_breadboard = Part.makeCompound([
+                          shp_box,
+                          fcfun.shp_array_translate(cir_cbore, cbore_vec_list),
+                          fcfun.shp_array_translate(cir_tap, tap_vec_list)])
         doc.recompute()
         fco_breadboard = doc.addObject("Part::Feature", name )
         fco_breadboard.Shape = shp_breadboard
@@ -2413,6 +2394,7 @@ def f_breadboard (d_breadboard,
                   fc_dir_h = VZ,
                   fc_dir_w = VY,
                   pos = V0,
+                  drill = 1,
                   name = 'breadboard'
                    ):
 
@@ -2441,6 +2423,7 @@ def f_breadboard (d_breadboard,
                         fc_dir_h = fc_dir_h,
                         fc_dir_w = fc_dir_w,
                         pos = pos,
+                        drill = drill,
                         name = 'breadboard')
 
 
@@ -1411,6 +1411,9 @@ class ShpAluProf (shp_clss.Obj3D):
         Same as pos_w 
     pos : FreeCAD.Vector
         position of point defined by pos_d, pos_w, pos_h
+    lod : int
+        level of detail, see shp_clss.LOD
+        LOD_SIMPLE, LOD_BOX: a box with the outline of the profile
    
     Attributes:
     -----------
@@ -1462,7 +1465,8 @@ class ShpAluProf (shp_clss.Obj3D):
                   xtr_d=0, xtr_nd=0,
                   axis_d = VX, axis_w = VY, axis_h = V0,
                   pos_d = 0, pos_w = 0, pos_h = 0,
-                  pos = V0):
+                  pos = V0,
+                  lod = shp_clss.LOD_FULL):
 
 
         # either axis_w or axis_h can be V0, but not both
@@ -1520,6 +1524,17 @@ class ShpAluProf (shp_clss.Obj3D):
         # calculates the position of the origin, and keeps it in attribute pos_o
         self.set_pos_o()
 
+        if lod != shp_clss.LOD_FULL:
+            self.shp = fcfun.shp_box_dir(box_w = width,
+                                         box_d = self.tot_d,
+                                         box_h = width,
+                                         fc_axis_w = self.axis_w,
+                                         fc_axis_d = self.axis_d,
+                                         fc_axis_h = self.axis_h,
+                                         cw = 1, cd = 0, ch = 1,
+                                         pos = self.pos_o)
+            return
+
         shp_alu_wire = fcfun.shp_aluwire_dir (width, thick, slot, insquare,
                                               fc_axis_x = self.axis_w,
                                               fc_axis_y = self.axis_h,
@@ -1627,7 +1642,9 @@ class PartAluProf (fc_clss.SinglePart, ShpAluProf):
                             axis_w   = axis_w,
                             axis_h   = axis_h,
                             pos_d    = pos_d, pos_w = pos_w, pos_h = pos_h,
-                            pos      = pos) 
+                            pos      = pos,
+                            # level of detail of the purchased parts
+                            lod      = shp_clss.LOD)
 
         # creation of the part
         fc_clss.SinglePart.__init__(self)
@@ -2072,6 +2089,10 @@ class ShpNemaMotor (shp_clss.Obj3D):
            the same as pos_h = 4
     pos : FreeCAD.Vector
         Position of the motor, at the point defined by pos_d, pos_w, pos_h
+    lod : int
+        level of detail, see shp_clss.LOD
+        LOD_SIMPLE, LOD_BOX: compound of the base, the circle and the
+                    shafts, no chamfer, no bolt holes and no booleans
 
     Attributes:
     ----------
@@ -2095,7 +2116,8 @@ class ShpNemaMotor (shp_clss.Obj3D):
                   pos_d = 0,
                   pos_w = 0,
                   pos_h = 1,
-                  pos = V0):
+                  pos = V0,
+                  lod = shp_clss.LOD_FULL):
 
         if (axis_w is None) or (axis_w == V0):
             axis_w = axis_h.cross(axis_d)
@@ -2176,6 +2198,26 @@ class ShpNemaMotor (shp_clss.Obj3D):
                                      cw = 1, cd = 1, ch = 0,
                                      pos = self.get_pos_h(4))
 
+        if lod in (shp_clss.LOD_SIMPLE, shp_clss.LOD_BOX):
+            # the shapes are not fused, just put in a compound
+            shp_motor_list = [shp_base]
+            if circle_r > 0 and circle_h > 0:
+                shp_motor_list.append(fcfun.shp_cyl(r = circle_r,
+                                                    h = circle_h,
+                                                    normal = self.axis_h,
+                                                    pos = self.pos_o))
+            shp_motor_list.append(fcfun.shp_cyl(r = self.shaft_r,
+                                                h = self.shaft_l,
+                                                normal = self.axis_h,
+                                                pos = self.pos_o))
+            if rear_shaft_l > 0:
+                shp_motor_list.append(fcfun.shp_cyl(r = self.shaft_r,
+                                                    h = self.rear_shaft_l,
+                                                    normal = self.axis_h,
+                                                    pos = self.get_pos_h(5)))
+            self.shp = Part.makeCompound(shp_motor_list)
+            return
+
         shp_base = fcfun.shp_filletchamfer_dir (shp_base, self.axis_h,
                                                 fillet = 0, radius = chmf_r)
         shp_base = shp_base.removeSplitter()
@@ -2312,7 +2354,9 @@ class PartNemaMotor (fc_clss.SinglePart, ShpNemaMotor):
                     pos_d = pos_d,
                     pos_w = pos_w,
                     pos_h = pos_h,
-                    pos = pos)
+                    pos = pos,
+                    # level of detail of the purchased parts
+                    lod = shp_clss.LOD)
 
         # Second, the part is created
         fc_clss.SinglePart.__init__(self)
@@ -3403,6 +3447,10 @@ class ShpLinGuideRail (shp_clss.Obj3D):
         3: at the top end
     pos : FreeCAD.Vector
         Position at the point defined by pos_d, pos_w, pos_h
+    lod : int
+        level of detail, see shp_clss.LOD
+        LOD_SIMPLE: the rail without the bolt holes
+        LOD_BOX: a box with the width and the height of the rail
 
     """
 
@@ -3411,7 +3459,8 @@ class ShpLinGuideRail (shp_clss.Obj3D):
                   bolth_d, bolth_h, boltend_sep = 0,
                   axis_d = VX, axis_w = V0, axis_h = VZ,
                   pos_d = 0, pos_w = 0, pos_h = 0,
-                  pos = V0):
+                  pos = V0,
+                  lod = shp_clss.LOD_FULL):
 
 
         if (axis_w is None) or (axis_w == V0):
@@ -3475,6 +3524,17 @@ class ShpLinGuideRail (shp_clss.Obj3D):
         # calculates the position of the origin, and keeps it in attribute pos_o
         self.set_pos_o()
 
+        if lod == shp_clss.LOD_BOX:
+            self.shp = fcfun.shp_box_dir(box_w = rail_w,
+                                         box_d = rail_d,
+                                         box_h = rail_h,
+                                         fc_axis_w = self.axis_w,
+                                         fc_axis_d = self.axis_d,
+                                         fc_axis_h = self.axis_h,
+                                         cw = 1, cd = 0, ch = 0,
+                                         pos = self.pos_o)
+            return
+
         wire_rail = fcfun.wire_lgrail( rail_w = rail_w,
                                        rail_h = rail_h,
                                        axis_w = self.axis_w,
@@ -3485,6 +3545,9 @@ class ShpLinGuideRail (shp_clss.Obj3D):
         # make a face of the wire 
         shp_face_rail = Part.Face(wire_rail)
         shp_plainrail = shp_face_rail.extrude(self.vec_d(rail_d))
+        if lod == shp_clss.LOD_SIMPLE:
+            self.shp = shp_plainrail
+            return
 
         holes_list = []
         # bolt holes
@@ -3616,7 +3679,9 @@ class PartLinGuideRail (fc_clss.SinglePart, ShpLinGuideRail):
                                  pos_d      = pos_d,
                                  pos_w      = pos_w,
                                  pos_h      = pos_h,
-                                 pos        = pos)
+                                 pos        = pos,
+                                 # level of detail of the purchased parts
+                                 lod        = shp_clss.LOD)
 
         # creation of the part
         fc_clss.SinglePart.__init__(self)
@@ -4065,6 +4130,10 @@ class ShpLinGuideBlock (shp_clss.Obj3D):
            defined
     pos : FreeCAD.Vector
         Position at the point defined by pos_d, pos_w, pos_h
+    lod : int
+        level of detail, see shp_clss.LOD
+        LOD_SIMPLE: compound of the 2 blocks, no rail and bolt holes
+        LOD_BOX: a box with the outer dimensions of the block
 
 
                       axis_h
@@ -4107,7 +4176,8 @@ class ShpLinGuideBlock (shp_clss.Obj3D):
                   pos_d = 0,
                   pos_w = 0,
                   pos_h = 0,
-                  pos = V0):
+                  pos = V0,
+                  lod = shp_clss.LOD_FULL):
 
         if (axis_w is None) or (axis_w == V0):
             axis_w = axis_h.cross(axis_d)
@@ -4165,6 +4235,19 @@ class ShpLinGuideBlock (shp_clss.Obj3D):
         # calculates the position of the origin, and keeps it in attribute pos_o
         self.set_pos_o()
 
+        if lod == shp_clss.LOD_BOX:
+            self.shp = fcfun.shp_box_dir (box_w = max(self.block_w,
+                                                      self.block_ws),
+                                          box_d = max(self.block_d,
+                                                      self.block_ds),
+                                          box_h = self.block_h,
+                                          fc_axis_w = self.axis_w,
+                                          fc_axis_d = self.axis_d,
+                                          fc_axis_h = self.axis_h,
+                                          cw = 1, cd = 1, ch = 0,
+                                          pos = self.pos_o)
+            return
+
         # the main block
         shp_mblock = fcfun.shp_box_dir (box_w = self.block_w,
                                         box_d = self.block_ds,
@@ -4185,6 +4268,10 @@ class ShpLinGuideBlock (shp_clss.Obj3D):
                                         cw = 1, cd = 1, ch = 0,
                                         pos = self.pos_o)
 
+        if lod == shp_clss.LOD_SIMPLE:
+            self.shp = Part.makeCompound([shp_mblock, shp_exblock])
+            return
+
         # fusion of these blocks
         shp_block = shp_mblock.fuse(shp_exblock)
 
@@ -4345,7 +4432,9 @@ class PartLinGuideBlock (fc_clss.SinglePart, ShpLinGuideBlock):
                   pos_d = pos_d,
                   pos_w = pos_w,
                   pos_h = pos_h,
-                  pos = pos)
+                  pos = pos,
+                  # level of detail of the purchased parts
+                  lod = shp_clss.LOD)
 
 
         # creation of the part
@@ -4455,6 +4544,24 @@ class ShpGtPulley (shp_clss.Obj3D):
         same as pos_d
     pos : FreeCAD.Vector
         position of the piece
+    fast : int
+        0: the pulley is made fusing cylinders with holes
+        1: the section of the pulley is revolved around axis_h, without
+           3D booleans (unless it has teeth)
+    teeth : int
+        only if fast == 1
+        0: the toothed part is a cylinder
+        1: the grooves of the teeth are made: the profile of a tooth is
+           repeated around the axis in a single face that is extruded,
+           see get_toothed_face
+    proxy : int
+        1: low detail model, just a cylinder with the outer diameter and
+           the total height, for a pulley that is only a visual component
+           The rest of the attributes are the same, but the shape
+    lod : int
+        level of detail, see shp_clss.LOD
+        LOD_SIMPLE: as fast == 1
+        LOD_BOX: as proxy == 1
 
 
     The toothed part of the pulley has 2 diameters, besides there also is
@@ -4539,7 +4646,11 @@ class ShpGtPulley (shp_clss.Obj3D):
                  pos_d = 0,
                  pos_w = 0,
                  pos_h = 0,
-                 pos = V0):
+                 pos = V0,
+                 fast = 0,
+                 teeth = 0,
+                 proxy = 0,
+                 lod = shp_clss.LOD_FULL):
 
 
         if (((axis_d is None) or (axis_d == V0)) and
@@ -4625,6 +4736,21 @@ class ShpGtPulley (shp_clss.Obj3D):
         # calculates the position of the origin, and keeps it in attribute pos_o
         self.set_pos_o()
 
+        # normal axes to print without support
+        self.prnt_ax = self.axis_h
+
+        if proxy == 1 or lod == shp_clss.LOD_BOX:
+            # just a cylinder with the largest radius
+            self.shp = fcfun.shp_cyl(r = max(self.base_r, self.flange_r,
+                                             self.tooth_out_r),
+                                     h = self.tot_h,
+                                     normal = self.axis_h,
+                                     pos = self.pos_o)
+            return
+        elif fast == 1 or lod == shp_clss.LOD_SIMPLE:
+            self.shp = self.get_revolved_shp(teeth)
+            return
+
         shp_fuse_list = []
         # Cilynder with a hole, with an extra for the fusion
         # calculation of the extra at the bottom to make the fusion
@@ -4692,8 +4818,106 @@ class ShpGtPulley (shp_clss.Obj3D):
 
         self.shp = shp_pulley
 
-        # normal axes to print without support
-        self.prnt_ax = self.axis_h
+    def get_revolved_shp (self, teeth = 0):
+        """ Returns the shape of the pulley, made revolving its section
+        around axis_h, so there are no 3D booleans.
+        If teeth, the toothed part is made extruding the face with the
+        teeth (see get_toothed_face) and fused with the rest
+
+        Section of the pulley on the plane of axis_d and axis_h, from the
+        shaft. The points are in order:
+
+                   axis_h
+                     :
+                     :  9_______8
+                     :  |       |  top flange
+                     :  |   6___|7
+                     :  |   |      toothed part (tooth_out_r, or
+                     :  |   |       tooth_in_r if teeth)
+                     :  |   |5__4
+                     :  |      _|3  bottom flange
+                     :  |     |2
+                     :  |     |    base
+                     :..0_____|1.......axis_d
+                      shaft
+        """
+        shaft_r = self.shaft_r + self.tol
+        if teeth == 1:
+            # the core, the teeth will be extruded
+            toothed_r = self.tooth_in_r
+        else:
+            toothed_r = self.tooth_out_r
+        base_h = self.base_h
+        toothed_h0 = base_h + self.bot_flange_h
+        toothed_h1 = self.tot_h - self.top_flange_h
+        if self.bot_flange_h > 0:
+            bot_flange_r = self.flange_r
+        else:
+            bot_flange_r = self.base_r
+        if self.top_flange_h > 0:
+            top_flange_r = self.flange_r
+        else:
+            top_flange_r = toothed_r
+        # (r, h) of the section
+        rh_list = [(shaft_r, 0), (self.base_r, 0),
+                   (self.base_r, base_h), (bot_flange_r, base_h),
+                   (bot_flange_r, toothed_h0), (toothed_r, toothed_h0),
+                   (toothed_r, toothed_h1), (top_flange_r, toothed_h1),
+                   (top_flange_r, self.tot_h), (shaft_r, self.tot_h)]
+        pt_list = []
+        for r, h in rh_list:
+            pt = self.pos_o + self.vec_d(r) + self.vec_h(h)
+            # the flanges and the base may have no height or the same
+            # radius
+            if not pt_list or not DraftVecUtils.equals(pt, pt_list[-1]):
+                pt_list.append(pt)
+        pt_list.append(pt_list[0])
+        face_section = Part.Face(Part.makePolygon(pt_list))
+        shp_pulley = face_section.revolve(self.pos_o, self.axis_h, 360)
+        if teeth == 1:
+            face_teeth = self.get_toothed_face(self.get_pos_h(2))
+            shp_teeth = face_teeth.extrude(self.vec_h(self.toothed_h))
+            shp_pulley = shp_pulley.fuse(shp_teeth)
+            shp_pulley = shp_pulley.removeSplitter()
+        return shp_pulley
+
+    def get_toothed_face (self, pos):
+        """ Returns the face of the toothed part, perpendicular to axis_h
+        at pos. It has the grooves of the teeth outside, and inside a
+        circle smaller than the core (tooth_in_r), so it can be fused with
+        it.
+        The profile of a groove is calculated once, and repeated around the
+        axis (polar pattern) in a single wire, not exact, just for the
+        model:
+
+                  ____     ____ ...... tooth_out_r
+                      \___/ ......... tooth_in_r
+                      : : :
+                      : : :
+                     -G 0 G  angle of the groove: half of it is G at
+                                 tooth_out_r, and G/2 at tooth_in_r
+        """
+        tooth_ang = 2 * math.pi / self.n_teeth
+        groove_ang = tooth_ang / 4.
+        # profile of a groove: (radius, angle)
+        groove_prof = [(self.tooth_out_r, -groove_ang),
+                       (self.tooth_in_r, -groove_ang/2.),
+                       (self.tooth_in_r, groove_ang/2.),
+                       (self.tooth_out_r, groove_ang)]
+        pt_list = []
+        for tooth_i in range(self.n_teeth):
+            tooth_i_ang = tooth_i * tooth_ang
+            for r, ang in groove_prof:
+                pt_list.append(pos
+                               + self.vec_d(r * math.cos(tooth_i_ang + ang))
+                               + self.vec_w(r * math.sin(tooth_i_ang + ang)))
+        pt_list.append(pt_list[0])
+        wire_teeth = Part.makePolygon(pt_list)
+        # inner circle, smaller to be fused with the core, but not
+        # getting into the shaft hole
+        core_r = (self.shaft_r + self.tol + self.tooth_in_r) / 2.
+        wire_core = Part.Wire(Part.makeCircle(core_r, pos, self.axis_h))
+        return Part.Face([wire_teeth, wire_core], 'Part::FaceMakerBullseye')
 
 
 #shpObjPulley = ShpGtPulley()
@@ -4744,6 +4968,9 @@ class PartGtPulley (fc_clss.SinglePart, ShpGtPulley):
                  pos_w = 0,
                  pos_h = 0,
                  pos = V0,
+                 fast = 0,
+                 teeth = 0,
+                 proxy = 0,
                  model_type = 1, # dimensional model
                  name = ''):
 
@@ -4767,7 +4994,12 @@ class PartGtPulley (fc_clss.SinglePart, ShpGtPulley):
                  pos_d = pos_d,
                  pos_w = pos_w,
                  pos_h = pos_h,
-                 pos = pos)
+                 pos = pos,
+                 fast = fast,
+                 teeth = teeth,
+                 proxy = proxy,
+                 # level of detail of the purchased parts
+                 lod = shp_clss.LOD)
 
         # Then the Part
         fc_clss.SinglePart.__init__(self)
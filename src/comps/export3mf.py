@@ -0,0 +1,244 @@
+# ----------------------------------------------------------------------------
+# -- Export to a 3MF file of the pieces to print
+# -- comps library
+# ----------------------------------------------------------------------------
+# -- (c) Felipe Machado
+# -- Area of Electronic Technology. Rey Juan Carlos University (urjc.es)
+# -- https://github.com/felipe-m/fcad-comps
+# -- October-2026
+# ----------------------------------------------------------------------------
+# --- LGPL Licence
+# ----------------------------------------------------------------------------
+
+# All the pieces to print are saved in one 3MF file, instead of one STL
+# file for each piece. Each piece is an object of the 3MF file, with its
+# name and its color, in its print position (see SinglePart.get_print_shp),
+# and the pieces are placed one next to the other along X:
+#
+#        export3mf.export_3mf([filter_holder,
+#                              tensioner.get_tensioner_holder()],
+#                             filename = stl_path + 'filter_stage.3mf')
+#
+# Each piece has to have its print axis (prnt_ax), the pieces without it
+# are not exported
+#
+# The 3MF file is a zip archive. The model (XML) is written into the
+# archive piece by piece: each piece is meshed, written and discarded
+# before the next one, so the meshes of all the pieces are not in memory.
+# The points shared by the triangles are written once (the vertexes of the
+# mesh are deduplicated)
+
+import zipfile
+import logging
+from xml.sax.saxutils import quoteattr
+
+import MeshPart
+# NumPy is optional, it is used to deduplicate the vertexes
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+import stlexport
+import fcprof
+
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+# separation (mm) between the pieces on the build plate
+PLATE_SEP = 5.
+# color of the pieces that have no color
+DEFAULT_COLOR = (0.8, 0.8, 0.8)
+# the vertexes closer than this (mm) are the same
+VERTEX_TOL = 1e-6
+
+CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/'
+    'content-types">\n'
+    ' <Default Extension="rels" ContentType="application/'
+    'vnd.openxmlformats-package.relationships+xml"/>\n'
+    ' <Default Extension="model" ContentType="application/'
+    'vnd.ms-package.3dmanufacturing-3dmodel+xml"/>\n'
+    '</Types>\n')
+
+RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/'
+    'relationships">\n'
+    ' <Relationship Target="/3D/3dmodel.model" Id="rel0" '
+    'Type="http://schemas.microsoft.com/3dmanufacturing/2013/01/'
+    '3dmodel"/>\n'
+    '</Relationships>\n')
+
+MODEL_NAMESPACE = 'http://schemas.microsoft.com/3dmanufacturing/core/2015/02'
+
+
+def get_hex_color (color):
+    """ returns the 3MF string of a RGB color tuple of floats from 0. to 1.:
+    #RRGGBB
+    """
+    return '#' + ''.join('%02X' % int(round(255 * max(0., min(1., comp))))
+                         for comp in color[:3])
+
+
+def dedup_vertices (pt_list, tri_list, tol = VERTEX_TOL):
+    """ merges the vertexes that are at the same position
+
+    Parameters:
+    -----------
+    pt_list : list of FreeCAD.Vector or tuples
+        vertexes of the mesh
+    tri_list : list of tuples of 3 int
+        triangles, indexes of pt_list
+    tol : float
+        vertexes closer than tol are merged
+
+    Returns:
+    --------
+    Tuple of the list of the vertexes (tuples of 3 floats) and the list of
+    the triangles (tuples of 3 int) with the new indexes. The triangles that
+    have lost their area (2 vertexes merged) are discarded
+    """
+    if numpy is not None:
+        pt_arr = numpy.array([(pt[0], pt[1], pt[2]) for pt in pt_list],
+                             dtype = float).reshape(-1,3)
+        key_arr = numpy.round(pt_arr / tol).astype(numpy.int64)
+        _, first_arr, inv_arr = numpy.unique(key_arr, axis = 0,
+                                             return_index = True,
+                                             return_inverse = True)
+        tri_arr = inv_arr.reshape(-1)[numpy.array(tri_list,
+                                                  dtype = numpy.int64)]
+        tri_arr = tri_arr.reshape(-1,3)
+        valid_arr = (  (tri_arr[:,0] != tri_arr[:,1])
+                     & (tri_arr[:,1] != tri_arr[:,2])
+                     & (tri_arr[:,0] != tri_arr[:,2]))
+        return (pt_arr[first_arr].tolist(),
+                [tuple(tri) for tri in tri_arr[valid_arr].tolist()])
+    vtx_list = []
+    ind_dict = {}
+    new_ind_list = []
+    for pt in pt_list:
+        key = (int(round(pt[0] / tol)), int(round(pt[1] / tol)),
+               int(round(pt[2] / tol)))
+        if key not in ind_dict:
+            ind_dict[key] = len(vtx_list)
+            vtx_list.append((pt[0], pt[1], pt[2]))
+        new_ind_list.append(ind_dict[key])
+    new_tri_list = []
+    for tri in tri_list:
+        new_tri = tuple(new_ind_list[ind] for ind in tri)
+        if len(set(new_tri)) == 3:
+            new_tri_list.append(new_tri)
+    return vtx_list, new_tri_list
+
+
+def get_mesh_lists (shp):
+    """ meshes the shape with the deflections of stlexport.get_defl
+    (the same as the STL files)
+
+    Returns:
+    --------
+    Tuple of the list of the vertexes and the list of the triangles,
+    see dedup_vertices
+    """
+    lin_defl, ang_defl = stlexport.get_defl(shp)
+    mesh_shp = MeshPart.meshFromShape(shp,
+                                      LinearDeflection = lin_defl,
+                                      AngularDeflection = ang_defl)
+    pt_list, tri_list = mesh_shp.Topology
+    del mesh_shp
+    return dedup_vertices(pt_list, tri_list)
+
+
+def write_object (model_file, obj_id, name, mat_ind, vtx_list, tri_list):
+    """ writes an object (a mesh) in the 3MF model file
+    """
+    model_file.write((' <object id="%d" type="model" name=%s pid="1"'
+                      ' pindex="%d">\n  <mesh>\n   <vertices>\n'
+                      % (obj_id, quoteattr(name), mat_ind)).encode('utf-8'))
+    model_file.write(''.join('    <vertex x="%.9g" y="%.9g" z="%.9g"/>\n'
+                             % tuple(vtx) for vtx in vtx_list).encode('utf-8'))
+    model_file.write(b'   </vertices>\n   <triangles>\n')
+    model_file.write(''.join('    <triangle v1="%d" v2="%d" v3="%d"/>\n'
+                             % tri for tri in tri_list).encode('utf-8'))
+    model_file.write(b'   </triangles>\n  </mesh>\n </object>\n')
+
+
+def export_3mf (part_list, filename, plate_sep = PLATE_SEP):
+    """ Exports a list of pieces to print to a 3MF file
+
+    Parameters:
+    -----------
+    part_list : list of fc_clss.SinglePart
+        pieces to print, each one is an object in the file, with its name
+        and color. The parts without print axis (prnt_ax) are skipped
+    filename : str
+        name of the 3MF file
+    plate_sep : float
+        separation of the pieces on the build plate, along X
+
+    Returns:
+    --------
+    Dictionary:
+    {'file' : name of the file,
+     'time' : total time (seconds),
+     'parts': [ {'name', 'vertices', 'triangles'} ]}
+    """
+    time_0 = fcprof.clock()
+    print_list = []
+    for part in part_list:
+        # a piece to print has a print axis (see SinglePart.get_print_shp)
+        if (not hasattr(part, 'get_print_shp')
+                or getattr(part, 'prnt_ax', None) is None):
+            logger.error('not a piece to print: ' + str(part))
+            continue
+        print_list.append(part)
+    result_list = []
+    item_list = []
+    with zipfile.ZipFile(filename, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        zip_file.writestr('[Content_Types].xml', CONTENT_TYPES_XML)
+        zip_file.writestr('_rels/.rels', RELS_XML)
+        with zip_file.open('3D/3dmodel.model', 'w') as model_file:
+            model_file.write(('<?xml version="1.0" encoding="UTF-8"?>\n'
+                              '<model unit="millimeter" xml:lang="en-US"'
+                              ' xmlns="' + MODEL_NAMESPACE + '">\n'
+                              '<resources>\n'
+                              ' <basematerials id="1">\n').encode('utf-8'))
+            # a material for each piece, to have its color
+            for part in print_list:
+                color = getattr(part, 'color', DEFAULT_COLOR)
+                model_file.write(('  <base name=%s displaycolor="%s"/>\n'
+                                  % (quoteattr(part.name),
+                                     get_hex_color(color))).encode('utf-8'))
+            model_file.write(b' </basematerials>\n')
+            pos_x = 0.
+            for part_i, part in enumerate(print_list):
+                obj_id = part_i + 2 # id 1 is the basematerials
+                shp = part.get_print_shp()
+                bbox = shp.BoundBox
+                vtx_list, tri_list = get_mesh_lists(shp)
+                del shp
+                write_object(model_file, obj_id, part.name, part_i,
+                             vtx_list, tri_list)
+                result_list.append({'name'      : part.name,
+                                    'vertices'  : len(vtx_list),
+                                    'triangles' : len(tri_list)})
+                del vtx_list, tri_list
+                # on the build plate: next to the previous piece, and on Z=0
+                item_list.append((obj_id, pos_x - bbox.XMin, - bbox.YMin,
+                                  - bbox.ZMin))
+                pos_x += bbox.XLength + plate_sep
+                logger.debug(part.name + ': '
+                             + str(result_list[-1]['triangles'])
+                             + ' triangles')
+            model_file.write(b'</resources>\n<build>\n')
+            for obj_id, pos_x, pos_y, pos_z in item_list:
+                model_file.write((' <item objectid="%d" transform="1 0 0'
+                                  ' 0 1 0 0 0 1 %.6g %.6g %.6g"/>\n'
+                                  % (obj_id, pos_x, pos_y, pos_z)
+                                 ).encode('utf-8'))
+            model_file.write(b'</build>\n</model>\n')
+    return {'file'  : filename,
+            'time'  : fcprof.clock() - time_0,
+            'parts' : result_list}
@@ -0,0 +1,377 @@
+# ----------------------------------------------------------------------------
+# -- Export of assemblies to glTF binary (GLB) files
+# -- comps library
+# ----------------------------------------------------------------------------
+# -- (c) Felipe Machado
+# -- Area of Electronic Technology. Rey Juan Carlos University (urjc.es)
+# -- https://github.com/felipe-m/fcad-comps
+# -- October-2026
+# ----------------------------------------------------------------------------
+# --- LGPL Licence
+# ----------------------------------------------------------------------------
+
+# Saves an assembly (parts and sets of parts) in a GLB file, to be seen
+# outside FreeCAD (web browsers, viewers of 3D models...):
+#
+#        exportglb.export_glb([filter_holder, tensioner, nemaholder_w_motor],
+#                             filename = 'filter_stage.glb')
+#
+# The sets (fc_clss.PartsSet) are nodes with their parts as children.
+# Each single part (fc_clss.SinglePart) is a node that refers to a mesh.
+# The parts that are the same shape in another position (bolts, nuts,
+# washers, aluminum profiles of the same length...) and have the same
+# color share the mesh: it is tessellated and saved once, and each part is
+# a node with its translation. The shapes are considered the same if their
+# number of faces, edges and vertexes, their area, the dimensions of their
+# bounding box, the center of their vertexes and their center of mass
+# (relative to the bounding box) and their matrix of inertia are the same
+# (see get_shp_key)
+#
+# FreeCAD units are mm and the axis up is Z, glTF units are m and the
+# axis up is Y, so the root node scales and rotates the assembly
+
+import sys
+import json
+import array
+import struct
+import logging
+
+import kparts
+import fcprof
+
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+# color of the parts that have no color
+DEFAULT_COLOR = (0.8, 0.8, 0.8)
+# decimals of the values that are compared to know if 2 shapes are the same
+KEY_DECIMALS = 4
+
+# glTF constants
+GLTF_FLOAT = 5126
+GLTF_UINT = 5125
+GLTF_ARRAY_BUFFER = 34962
+GLTF_ELEMENT_ARRAY_BUFFER = 34963
+GLB_MAGIC = 0x46546C67 # glTF
+GLB_JSON = 0x4E4F534A  # JSON
+GLB_BIN = 0x004E4942   # BIN
+# root node: from mm to m, and from Z up to Y up (-90 degrees on X)
+ROOT_SCALE = [0.001, 0.001, 0.001]
+ROOT_ROTATION = [-0.7071068, 0., 0., 0.7071068]
+
+
+def get_mass_props (shp):
+    """ returns the center of mass and the matrix of inertia (relative to
+    the center of mass) of the solids of a shape, adding the solids with
+    the parallel axis theorem. The density is 1
+
+    Returns:
+    --------
+    Tuple of the center of mass (tuple of 3 floats) and the 6 values of
+    the symmetric matrix of inertia (Ixx, Ixy, Ixz, Iyy, Iyz, Izz).
+    None if the shape has no solids
+    """
+    solid_list = [solid for solid in shp.Solids if solid.Volume > 0]
+    if not solid_list:
+        return None
+    vol = sum(solid.Volume for solid in solid_list)
+    cen = [sum(solid.Volume * solid.CenterOfMass[i] for solid in solid_list)
+           / vol for i in range(3)]
+    inertia = [0.] * 6
+    for solid in solid_list:
+        mat = solid.MatrixOfInertia
+        dist = [solid.CenterOfMass[i] - cen[i] for i in range(3)]
+        dist2 = sum(comp * comp for comp in dist)
+        solid_vol = solid.Volume
+        # I_c = I_solid + V * (|d|^2 * E - d * d^T)
+        inertia[0] += mat.A11 + solid_vol * (dist2 - dist[0] * dist[0])
+        inertia[1] += mat.A12 - solid_vol * dist[0] * dist[1]
+        inertia[2] += mat.A13 - solid_vol * dist[0] * dist[2]
+        inertia[3] += mat.A22 + solid_vol * (dist2 - dist[1] * dist[1])
+        inertia[4] += mat.A23 - solid_vol * dist[1] * dist[2]
+        inertia[5] += mat.A33 + solid_vol * (dist2 - dist[2] * dist[2])
+    return tuple(cen), tuple(inertia)
+
+
+def get_shp_key (shp, color, decimals = KEY_DECIMALS):
+    """ returns a tuple that is the same for the shapes that are the same
+    shape with the same color, although they are in different positions
+    (only translated). Besides the size and the center of the vertexes,
+    it has the center of mass (relative to the bounding box) and the
+    matrix of inertia, that change if the shape is rotated or mirrored
+    """
+    bbox = shp.BoundBox
+    vtx_list = shp.Vertexes
+    vtx_num = max(len(vtx_list), 1)
+    value_list = [shp.Area, bbox.XLength, bbox.YLength, bbox.ZLength,
+                  sum(vtx.X for vtx in vtx_list) / vtx_num - bbox.XMin,
+                  sum(vtx.Y for vtx in vtx_list) / vtx_num - bbox.YMin,
+                  sum(vtx.Z for vtx in vtx_list) / vtx_num - bbox.ZMin]
+    mass_props = get_mass_props(shp)
+    if mass_props is not None:
+        cen, inertia = mass_props
+        value_list.extend([cen[0] - bbox.XMin, cen[1] - bbox.YMin,
+                           cen[2] - bbox.ZMin])
+        # the inertia relative to its largest value, they are large numbers
+        # and the translated copies have rounding differences
+        inertia_max = max(abs(value) for value in inertia) or 1.
+        value_list.extend(value / inertia_max * 1000. for value in inertia)
+    return ((len(shp.Faces), len(shp.Edges), len(vtx_list))
+            + tuple(round(value, decimals) for value in value_list)
+            + tuple(round(comp, 3) for comp in color[:3]))
+
+
+def get_le_bytes (typecode, value_list):
+    """ returns the little endian bytes of a list of numbers,
+    typecode of the module array: 'f' float32, 'I' uint32
+    """
+    arr = array.array(typecode, value_list)
+    if sys.byteorder == 'big':
+        arr.byteswap()
+    return arr.tobytes()
+
+
+class GlbScene (object):
+    """ glTF scene of an assembly, the meshes of the shapes that are the same
+    are saved once
+
+    Parameters:
+    -----------
+    lin_defl : float
+        linear deflection of the tessellation of the shapes
+
+    Attributes:
+    -----------
+    gltf : dict
+        glTF JSON
+    bin_data : bytearray
+        binary buffer with the vertexes and triangles of the meshes
+    mesh_dict : dict
+        key: see get_shp_key, value: index of the mesh
+    material_dict : dict
+        key: color, value: index of the material
+    stats : dict
+        number of meshes, instances (nodes of single parts) and triangles
+        of the meshes
+    """
+    def __init__(self, lin_defl = kparts.LIN_DEFL):
+        self.lin_defl = lin_defl
+        self.gltf = {'asset'       : {'version'   : '2.0',
+                                      'generator' : 'fcad-comps exportglb'},
+                     'scene'       : 0,
+                     'scenes'      : [{'nodes' : [0]}],
+                     'nodes'       : [{'name'     : 'assembly',
+                                       'scale'    : ROOT_SCALE,
+                                       'rotation' : ROOT_ROTATION,
+                                       'children' : []}],
+                     'meshes'      : [],
+                     'materials'   : [],
+                     'accessors'   : [],
+                     'bufferViews' : [],
+                     'buffers'     : []}
+        self.bin_data = bytearray()
+        self.mesh_dict = {}
+        self.material_dict = {}
+        self.stats = {'meshes' : 0, 'instances' : 0, 'triangles' : 0}
+
+    def add_buffer_view (self, data, target):
+        """ adds the bytes to the binary buffer, returns the index of its
+        buffer view
+        """
+        # the data of the accessors has to be aligned to 4 bytes
+        self.bin_data.extend(b'\0' * (-len(self.bin_data) % 4))
+        self.gltf['bufferViews'].append({'buffer'     : 0,
+                                         'byteOffset' : len(self.bin_data),
+                                         'byteLength' : len(data),
+                                         'target'     : target})
+        self.bin_data.extend(data)
+        return len(self.gltf['bufferViews']) - 1
+
+    def add_accessor (self, accessor):
+        self.gltf['accessors'].append(accessor)
+        return len(self.gltf['accessors']) - 1
+
+    def get_material (self, color):
+        """ returns the index of the material of the color, adding it if
+        it is new
+        """
+        color = tuple(float(comp) for comp in color[:3])
+        try:
+            return self.material_dict[color]
+        except KeyError:
+            pass
+        self.gltf['materials'].append(
+                 {'pbrMetallicRoughness' : {'baseColorFactor' : list(color)
+                                                                + [1.],
+                                            'metallicFactor'  : 0.,
+                                            'roughnessFactor' : 0.8}})
+        material_i = len(self.gltf['materials']) - 1
+        self.material_dict[color] = material_i
+        return material_i
+
+    def get_mesh (self, shp, color, name = ''):
+        """ returns the index of the mesh of the shape with the color.
+        If a shape that is the same (see get_shp_key) has already been
+        tessellated, its mesh is returned. The vertexes of the mesh are
+        relative to the minimum of the bounding box of the shape
+
+        Returns:
+        --------
+        Index of the mesh, None if the shape has no triangles
+        """
+        key = get_shp_key(shp, color)
+        try:
+            return self.mesh_dict[key]
+        except KeyError:
+            pass
+        pt_list, tri_list = shp.tessellate(self.lin_defl)
+        if not tri_list:
+            logger.warning('shape with no triangles: ' + name)
+            self.mesh_dict[key] = None
+            return None
+        bbox = shp.BoundBox
+        pos_list = []
+        for pt in pt_list:
+            pos_list.extend((pt.x - bbox.XMin, pt.y - bbox.YMin,
+                             pt.z - bbox.ZMin))
+        ind_list = [ind for tri in tri_list for ind in tri]
+        pos_view = self.add_buffer_view(get_le_bytes('f', pos_list),
+                                        GLTF_ARRAY_BUFFER)
+        ind_view = self.add_buffer_view(get_le_bytes('I', ind_list),
+                                        GLTF_ELEMENT_ARRAY_BUFFER)
+        pos_acc = self.add_accessor({'bufferView'    : pos_view,
+                                     'componentType' : GLTF_FLOAT,
+                                     'count'         : len(pt_list),
+                                     'type'          : 'VEC3',
+                                     'min' : [min(pos_list[0::3]),
+                                              min(pos_list[1::3]),
+                                              min(pos_list[2::3])],
+                                     'max' : [max(pos_list[0::3]),
+                                              max(pos_list[1::3]),
+                                              max(pos_list[2::3])]})
+        ind_acc = self.add_accessor({'bufferView'    : ind_view,
+                                     'componentType' : GLTF_UINT,
+                                     'count'         : len(ind_list),
+                                     'type'          : 'SCALAR'})
+        # no normals: the viewers calculate flat normals
+        self.gltf['meshes'].append(
+                       {'name'       : name,
+                        'primitives' : [{'attributes' : {'POSITION' : pos_acc},
+                                         'indices'    : ind_acc,
+                                         'material'   : self.get_material(
+                                                                      color)}]})
+        mesh_i = len(self.gltf['meshes']) - 1
+        self.mesh_dict[key] = mesh_i
+        self.stats['meshes'] += 1
+        self.stats['triangles'] += len(tri_list)
+        return mesh_i
+
+    def add_node (self, node, children_list):
+        """ adds the node to the scene, as a child of the node that has
+        children_list
+        """
+        self.gltf['nodes'].append(node)
+        children_list.append(len(self.gltf['nodes']) - 1)
+
+    def add_parts (self, part_list, children_list = None):
+        """ adds the parts and the sets of parts (recursively) to the scene
+
+        Parameters:
+        -----------
+        part_list : list of fc_clss.SinglePart or fc_clss.PartsSet
+            parts of the assembly
+        children_list : list
+            children of the node the parts are added to, if None, the root
+        """
+        if children_list is None:
+            children_list = self.gltf['nodes'][0]['children']
+        for part in part_list:
+            try:
+                child_list = part.get_parts()
+            except AttributeError:
+                logger.error('not a part or a set of parts: ' + str(part))
+                continue
+            name = getattr(part, 'name', '')
+            fco = getattr(part, 'fco', None)
+            if child_list:
+                # a set of parts, if it has been grouped, its FreeCAD object
+                # moves its children
+                node = {'name' : name, 'children' : []}
+                if fco is not None:
+                    placement = fco.Placement
+                    if not placement.isIdentity():
+                        node['translation'] = list(placement.Base)
+                        node['rotation'] = list(placement.Rotation.Q)
+                self.add_node(node, children_list)
+                self.add_parts(child_list, node['children'])
+                continue
+            if fco is not None:
+                # the shape of the object has its placement
+                shp = fco.Shape
+            else:
+                shp = part.shp
+            if shp is None or shp.isNull():
+                logger.warning('part with no shape: ' + name)
+                continue
+            mesh_i = self.get_mesh(shp, getattr(part, 'color', DEFAULT_COLOR),
+                                   name = name)
+            if mesh_i is None:
+                continue
+            bbox = shp.BoundBox
+            self.add_node({'name'        : name,
+                           'mesh'        : mesh_i,
+                           'translation' : [bbox.XMin, bbox.YMin, bbox.ZMin]},
+                          children_list)
+            self.stats['instances'] += 1
+
+    def save (self, filename):
+        """ saves the scene in a GLB file
+
+        Returns:
+        --------
+        Size of the file in bytes
+        """
+        self.bin_data.extend(b'\0' * (-len(self.bin_data) % 4))
+        self.gltf['buffers'] = [{'byteLength' : len(self.bin_data)}]
+        json_data = json.dumps(self.gltf, separators = (',', ':'))
+        json_data = json_data.encode('utf-8')
+        # the chunks have to be aligned to 4 bytes, JSON with spaces
+        json_data += b' ' * (-len(json_data) % 4)
+        glb_len = 12 + 8 + len(json_data) + 8 + len(self.bin_data)
+        with open(filename, 'wb') as glb_file:
+            glb_file.write(struct.pack('<III', GLB_MAGIC, 2, glb_len))
+            glb_file.write(struct.pack('<II', len(json_data), GLB_JSON))
+            glb_file.write(json_data)
+            glb_file.write(struct.pack('<II', len(self.bin_data), GLB_BIN))
+            glb_file.write(self.bin_data)
+        return glb_len
+
+
+def export_glb (part_list, filename, lin_defl = kparts.LIN_DEFL):
+    """ Exports an assembly to a GLB file
+
+    Parameters:
+    -----------
+    part_list : list of fc_clss.SinglePart or fc_clss.PartsSet
+        parts of the assembly, the sets are exported with their parts
+    filename : str
+        name of the GLB file
+    lin_defl : float
+        linear deflection of the tessellation of the shapes
+
+    Returns:
+    --------
+    Dictionary with the file, its size in bytes, the number of meshes
+    (unique shapes), instances (single parts) and triangles of the meshes,
+    and the time (seconds)
+    """
+    time_0 = fcprof.clock()
+    scene = GlbScene(lin_defl = lin_defl)
+    scene.add_parts(part_list)
+    result = dict(scene.stats)
+    result['size'] = scene.save(filename)
+    result['file'] = filename
+    result['time'] = fcprof.clock() - time_0
+    logger.debug(filename + ': ' + str(result['meshes']) + ' meshes, '
+                 + str(result['instances']) + ' instances')
+    return result
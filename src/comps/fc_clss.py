@@ -34,9 +34,10 @@ sys.path.append(filepath + '/../../' + 'comps')
 import kcomp   # import material constants and other constants
 import fcfun   # import my functions for freecad. FreeCad Functions
 import shp_clss
-import kparts
+import interference
+import stlexport
 
-from fcfun import V0, VX, VY, VZ, V0ROT
+from fcfun import V0, VX, VY, VZ
 from fcfun import VXN, VYN, VZN
 
 
@@ -248,8 +249,8 @@ class SinglePart (object):
             self.place = place
 
     # ----- Export to STL method
-    def export_stl(self, prefix = "", name = "", stl_path = ""):
-        """ exports to stl the piece to print 
+    def get_stl_filename(self, prefix = "", name = "", stl_path = ""):
+        """ returns the name of the STL file of the piece
 
         Parameters:
         -----------
@@ -263,6 +264,8 @@ class SinglePart (object):
         """
         if not name:
             filename = self.name
+        else:
+            filename = name
         if prefix:
             filename = prefix + '_' + filename
 
@@ -270,44 +273,60 @@ class SinglePart (object):
             stl_filename = filename + '.stl'
         else:
             stl_filename = stl_path + filename + '.stl'
-        
-        # I think this is a bug, before it may be called pos0, but
-        # now should be pos_o
-        pos_o = self.pos_o
+        return stl_filename
+
+    def get_print_shp(self):
+        """ returns a copy of the shape of the piece in the position to
+        print it: prnt_ax pointing up (VZ) and pos_o at the origin
+        The FreeCAD object and the document are not changed
+        """
         rotation = FreeCAD.Rotation(self.prnt_ax, VZ)
-        shp = self.shp
-        # ----------- moving the shape doesnt work:
-        # I think that is because it is bound to a FreeCAD object
-        #shp.Placement.Base = self.pos.negative() + self.place.negative()
-        #shp.translate (self.pos.negative() + self.place.negative())
-        #shp.rotate (V0, rotation.Axis, math.degrees(rotation.Angle))
-        #shp.Placement.Base = self.place
-        #shp.Placement.Rotation = fcfun.V0ROT
-        # ----------- option 1. making a copy of the shape
-        # and then deleting it (nullify)
-        #shp_cpy = shp.copy()
-        #shp_cpy.translate (pos_o.negative() + self.place.negative())
-        #shp_cpy.rotate (V0, rotation.Axis, math.degrees(rotation.Angle))
-        #shp_cpy.exportStl(stl_path + filename + 'stl')
-        #shp_cpy.nullify()
-        # ----------- option 2. moving the freecad object
-        
-        # place is no longer used, it should be rel_place or abs_place
-        self.fco.Placement.Base = pos_o.negative() + self.place.negative()
-        self.fco.Placement.Rotation = rotation
-        self.doc.recompute()
+        # the same placement that the FreeCAD object would have to be
+        # printed. place is no longer used, it should be rel_place or
+        # abs_place
+        print_place = FreeCAD.Placement(
+                              self.pos_o.negative() + self.place.negative(),
+                              rotation)
+        # moving self.shp doesnt work because it is bound to the FreeCAD
+        # object, so a copy is moved
+        shp = self.shp.copy()
+        shp.Placement = print_place
+        return shp
 
-        # exportStl is not working well with FreeCAD 0.17
-        #self.fco.Shape.exportStl(self.stl_path + filename + '.stl')
-        mesh_shp = MeshPart.meshFromShape(self.fco.Shape,
-                                          LinearDeflection=kparts.LIN_DEFL, 
-                                          AngularDeflection=kparts.ANG_DEFL)
-        mesh_shp.write(stl_filename)
-        del mesh_shp
+    def export_stl(self, prefix = "", name = "", stl_path = ""):
+        """ exports to stl the piece to print
+        The shape is moved to the print position (see get_print_shp), without
+        moving the FreeCAD object, so the document is not recomputed
 
-        self.fco.Placement.Base = self.place
-        self.fco.Placement.Rotation = V0ROT
-        self.doc.recompute()
+        Parameters:
+        -----------
+        prefix : str
+            Prefix to the piece, may be useful if name is not given
+            and want to add a prefix to the self.name
+            an underscore will be added between prefix and name
+        name : str
+            Name of the piece, if not given, it will take self.name
+        stl_path : the path to save the stl files
+        """
+        stl_filename = self.get_stl_filename(prefix = prefix, name = name,
+                                             stl_path = stl_path)
+        shp = self.get_print_shp()
+        # kparts.LIN_DEFL and ANG_DEFL, or adapted to the piece
+        lin_defl, ang_defl = stlexport.get_defl(shp)
+
+        if stlexport.NUMPY_STL:
+            # binary STL written with NumPy, without the Mesh writer
+            stlexport.write_stl_binary(shp, stl_filename,
+                                       lin_defl = lin_defl,
+                                       ang_defl = ang_defl,
+                                       name = self.name)
+        else:
+            # exportStl is not working well with FreeCAD 0.17
+            mesh_shp = MeshPart.meshFromShape(shp,
+                                              LinearDeflection=lin_defl,
+                                              AngularDeflection=ang_defl)
+            mesh_shp.write(stl_filename)
+            del mesh_shp
 
     def save_fcad(self, prefix = "", name = ""):
         """ Save the FreeCAD document, actually, it may not be a class method
@@ -379,6 +398,28 @@ class PartsSet (shp_clss.Obj3D):
         """ get a list of the parts, 
         """
         return self.parts_lst
+
+    def get_interferences (self, min_volume = interference.MIN_VOLUME,
+                           processes = 1):
+        """ Finds the parts of the set (and of its sets) that intersect
+        each other, see interference.find_interferences
+
+        Parameters:
+        -----------
+        min_volume : float
+            minimum volume of the common to be an interference
+        processes : int
+            number of processes of the pool to make the commons.
+            1: no pool. None: the number of CPUs
+
+        Returns:
+        --------
+        List of dictionaries, one for each pair of parts that intersect:
+        {'part_a', 'part_b', 'name_a', 'name_b', 'volume'}
+        """
+        return interference.find_interferences(self.parts_lst,
+                                               min_volume = min_volume,
+                                               processes = processes)
         
     def make_group (self):
         self.fco = self.doc.addObject("Part::Compound", self.name)
@@ -624,7 +665,9 @@ class Washer (SinglePart, shp_clss.ShpCylHole):
                                      xtr_r_in = tol_r,
                                      # outside tolerance is less
                                      xtr_r_out = - tol_r,
-                                     pos = pos)
+                                     pos = pos,
+                                     # level of detail of the purchased parts
+                                     lod = shp_clss.LOD)
 
         # Then the Part
         SinglePart.__init__(self)
@@ -956,7 +999,8 @@ class Nut (SinglePart, shp_clss.ShpPrismHole):
                                        pos_h = pos_h,
                                        pos_d = pos_d,
                                        pos_w = pos_w,
-                                       pos   = pos)
+                                       pos   = pos,
+                                       lod   = shp_clss.LOD)
 
 
         # Then the Part
@@ -1246,7 +1290,8 @@ class Bolt (SinglePart, shp_clss.ShpBolt):
                                   axis_d = axis_d,
                                   axis_w = axis_w,
                                   pos_h = pos_h, pos_d = pos_d, pos_w = pos_w,
-                                  pos = pos)
+                                  pos = pos,
+                                  lod = shp_clss.LOD)
 
         # Then the Part
         SinglePart.__init__(self)
@@ -14,7 +14,16 @@ import FreeCAD
 import Part
 import math
 import logging
+import inspect
+import functools
+import contextlib
+import collections
 import DraftVecUtils
+# NumPy is optional, it is used to classify the edges, see EdgeIndex
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 #from FreeCAD import Base
 
@@ -100,6 +109,193 @@ COS30 = 0.86603
 COS45 = 0.707   
 
 
+# -------------------- document recompute of the shape functions
+# The functions that make TopoShapes (shp_*) used to recompute the active
+# document before and after, although they dont use the document.
+# If RECOMPUTE_SHP is 0 (pure shape mode) they dont use the document at all,
+# and the document is recomputed once at the end, see pure_shp
+
+# 1: the shape functions recompute the active document
+# 0: pure shape mode, they dont
+RECOMPUTE_SHP = 1
+# 1: a shape function has been called in pure shape mode, and the document
+#    has not been recomputed after
+_recompute_pending = 0
+
+
+def shp_recompute ():
+    """ Called by the shape functions where they used to recompute the
+    active document. In pure shape mode it only takes note that the document
+    has to be recomputed at the end
+    """
+    global _recompute_pending
+    if RECOMPUTE_SHP:
+        doc = FreeCAD.ActiveDocument
+        if doc is not None:
+            doc.recompute()
+    else:
+        _recompute_pending = 1
+
+
+def set_recompute_shp (recompute = 1):
+    """ Sets if the shape functions recompute the active document,
+    see RECOMPUTE_SHP. When it is set again to 1, the document is recomputed
+    if it is pending
+    """
+    global RECOMPUTE_SHP, _recompute_pending
+    RECOMPUTE_SHP = recompute
+    if recompute and _recompute_pending:
+        _recompute_pending = 0
+        shp_recompute()
+
+
+@contextlib.contextmanager
+def pure_shp ():
+    """ Context manager to build shapes in pure shape mode, without
+    recomputing the document. At the end, the active document is recomputed
+    once, if a shape function has been called and it was not in pure shape
+    mode before:
+
+        with fcfun.pure_shp():
+            shp = fcfun.shp_filletchamfer_dir(shp, VZ, fillet = 1, radius = 2)
+            ...
+    """
+    recompute = RECOMPUTE_SHP
+    set_recompute_shp(0)
+    try:
+        yield
+    finally:
+        set_recompute_shp(recompute)
+
+
+# -------------------- memoization of the primitive shapes
+# Some functions (shp_box_dir, shp_bolt_dir, shp_nuthole, ...) are called
+# many times with the same dimensions, only changing pos. Those functions
+# are decorated with memo_pos, and if memoization is enabled, the shape is
+# built once at the origin (pos = V0) and then a translated copy is returned.
+# It is disabled by default, to enable it:
+#    fcfun.set_memo_shp(1)
+
+# 1: memoization enabled
+MEMO_SHP = 0
+# maximum number of shapes kept, the least recently used are discarded
+MEMO_SHP_MAX = 128
+# shapes built at the origin, key: function name and arguments (but pos)
+_memo_shp = collections.OrderedDict()
+# number of shapes taken from the memo (hits) and built (misses)
+memo_stats = {'hits' : 0, 'misses' : 0}
+
+
+def set_memo_shp (enable = 1, max_size = MEMO_SHP_MAX):
+    """ Enables or disables the memoization of the primitive shapes
+
+    Parameters:
+    -----------
+    enable : int
+        1: enabled
+        0: disabled, the memoized shapes are discarded
+    max_size : int
+        maximum number of shapes kept
+    """
+    global MEMO_SHP, MEMO_SHP_MAX
+    MEMO_SHP = enable
+    MEMO_SHP_MAX = max_size
+    if not enable:
+        clear_memo_shp()
+
+
+def clear_memo_shp ():
+    """ discards the memoized shapes and sets the counters to zero
+    """
+    _memo_shp.clear()
+    memo_stats['hits'] = 0
+    memo_stats['misses'] = 0
+
+
+def _memo_key_value (value):
+    """ returns a hashable value of an argument to be part of the key.
+    Raises TypeError if it cannot be hashed
+    """
+    if isinstance(value, FreeCAD.Vector):
+        return ('Vector', value.x, value.y, value.z)
+    elif isinstance(value, bool):
+        return value
+    elif isinstance(value, (int, float)):
+        # 1 and 1. make the same shape
+        return float(value)
+    hash(value)
+    return value
+
+
+def memo_pos (shp_func):
+    """ Decorator of the functions that create a shape with an argument pos
+    that just translates the shape.
+    If MEMO_SHP is enabled, the shape is built at pos = V0 and kept, and a
+    copy translated to pos is returned. The next calls with the same
+    arguments (but pos) return a translated copy of the kept shape
+    """
+    signature = inspect.signature(shp_func)
+
+    @functools.wraps(shp_func)
+    def memo_shp_func (*args, **kwargs):
+        if not MEMO_SHP:
+            return shp_func(*args, **kwargs)
+        arguments = signature.bind(*args, **kwargs)
+        arguments.apply_defaults()
+        pos = arguments.arguments['pos']
+        try:
+            key = (shp_func.__name__,
+                   tuple((name, _memo_key_value(value))
+                         for name, value in arguments.arguments.items()
+                         if name != 'pos'))
+        except TypeError:
+            # an argument cannot be hashed
+            return shp_func(*args, **kwargs)
+        try:
+            shp_o = _memo_shp[key]
+            _memo_shp.move_to_end(key)
+            memo_stats['hits'] += 1
+        except KeyError:
+            arguments.arguments['pos'] = V0
+            shp_o = shp_func(*arguments.args, **arguments.kwargs)
+            memo_stats['misses'] += 1
+            _memo_shp[key] = shp_o
+            while len(_memo_shp) > MEMO_SHP_MAX:
+                _memo_shp.popitem(last = False)
+        # the position in the geometry, as if it had been built at pos
+        return shp_copy_translated(shp_o, pos)
+
+    return memo_shp_func
+
+
+def shp_copy_translated (shp, vec):
+    """ Returns a copy of the shape translated by vec. The translation is
+    in the geometry, not in the placement of the copy, as if the shape had
+    been built there. So the placement is not lost when the placement of
+    its FreeCAD object is set (see fc_clss.SinglePart.place_fcos)
+
+    Parameters:
+    -----------
+    shp : TopoShape
+        shape to copy, it is not modified
+    vec : FreeCAD.Vector
+        translation
+
+    Returns:
+    --------
+    TopoShape translated copy
+    """
+    shp_copy = shp.copy()
+    if vec != V0:
+        matrix = FreeCAD.Matrix()
+        matrix.move(vec)
+        # copy = True: the geometry is transformed, translate would only
+        # change the placement. Not transformGeometry, that converts the
+        # surfaces to B-splines
+        shp_copy.transformShape(matrix, True)
+    return shp_copy
+
+
 
 def RotateView(axisX=1.0,axisY=0.0,axisZ=0.0,angle=45.0):
     import math
@@ -692,9 +888,6 @@ def addBox_cen(x, y, z, name, cx= False, cy=False, cz=False):
 # its given position
 
 def shp_boxcen(x, y, z, cx= False, cy=False, cz=False, pos=V0):
-    # we have to bring the active document
-    doc = FreeCAD.ActiveDocument
-
     if cx == True:
         x0 = -x/2.0
         x1 =  x/2.0
@@ -722,7 +915,7 @@ def shp_boxcen(x, y, z, cx= False, cy=False, cz=False, pos=V0):
     shp_face_sq = Part.Face(shp_wire_sq)
     shp_box = shp_face_sq.extrude(FreeCAD.Vector(0,0,z))
 
-    doc.recompute()
+    shp_recompute()
     
     return shp_box
 
@@ -755,9 +948,6 @@ def shp_boxcenxtr(x, y, z, cx= False, cy=False, cz=False,
                   xtr_ny = 0, xtr_y = 0,
                   xtr_nz = 0, xtr_z = 0,
                   pos=V0):
-    # we have to bring the active document
-    doc = FreeCAD.ActiveDocument
-
     if cx == True:
         x0 = -x/2.0 - xtr_nx
         x1 =  x/2.0 + xtr_x
@@ -785,7 +975,7 @@ def shp_boxcenxtr(x, y, z, cx= False, cy=False, cz=False,
     shp_face_sq = Part.Face(shp_wire_sq)
     shp_box = shp_face_sq.extrude(FreeCAD.Vector(0,0, z+xtr_z+xtr_nz))
 
-    doc.recompute()
+    shp_recompute()
     
     return shp_box
 
@@ -856,6 +1046,7 @@ def shp_box_rot (box_w, box_d, box_h,
     return shp_box
 
 
+@memo_pos
 def shp_box_dir (box_w, box_d, box_h,
                     fc_axis_w = V0,
                     fc_axis_h =VZ,
@@ -1262,7 +1453,6 @@ def shp_boxdir_fillchmfplane (
 
     """
 
-    doc = FreeCAD.ActiveDocument
     # normalize axes:
     # axis_l.normalize() could be used, but would change the vector
     # used as parameter
@@ -1347,7 +1537,7 @@ def shp_boxdir_fillchmfplane (
         else:
             #logger.debug('%s', str(edg_list))
             shp_fillchmf = shp_box.makeChamfer(radius, edg_list)
-        doc.recompute()
+        shp_recompute()
         return shp_fillchmf
     else:
         logger.debug('No edge to fillet or chamfer')
@@ -1757,6 +1947,31 @@ def shp_cylcenxtr (r, h, normal = VZ,
     return shpcyl
 
 
+def shp_array_translate (shp, vec_list):
+    """ Returns a compound with copies of a shape, each one translated by
+    a vector of the list. It is used to make arrays of holes: the tool is
+    built once and the compound is cut in a single boolean operation,
+    instead of building and fusing each hole.
+    The shapes of the compound should not intersect each other, since
+    the boolean operations take the compound as a single argument
+
+    Parameters:
+    -----------
+    shp : TopoShape
+        shape to copy, it is not modified
+    vec_list : list of FreeCAD.Vector
+        translation of each copy
+
+    Returns:
+    --------
+    TopoShape compound with a copy of the shape for each vector
+    """
+
+    # the translation in the geometry of the copies (see shp_copy_translated)
+    shp_list = [shp_copy_translated(shp, vec) for vec in vec_list]
+    return Part.makeCompound(shp_list)
+
+
 def shp_cyl_gen (r, h, axis_h = VZ, 
                        axis_ra = None, axis_rb = None,
                        pos_h = 0, pos_ra = 0, pos_rb = 0,
@@ -2094,6 +2309,7 @@ def shp_cylholedir (r_out, r_in, h, normal = VZ, pos = V0):
 
 
 
+@memo_pos
 def shp_cylhole_gen (r_out, r_in, h,
                      axis_h = VZ, axis_ra = None, axis_rb = None,
                      pos_h = 0, pos_ra = 0, pos_rb = 0,
@@ -5542,6 +5758,7 @@ def shp_bolt (r_shank, l_bolt, r_head, l_head,
     return shp_bolt
 
 
+@memo_pos
 def shp_bolt_dir (r_shank, l_bolt, r_head, l_head,
               hex_head = 0,
               xtr_head=1,
@@ -5836,6 +6053,7 @@ def addBoltNut_hole (r_shank,        l_bolt,
 
 
 
+@memo_pos
 def shp_boltnut_dir_hole (r_shank,        l_bolt, 
                           r_head,         l_head,
                           r_nut,          l_nut,
@@ -6326,6 +6544,7 @@ class NutHole (object):
  
 # -------------------- shp_nuthole -----------------------------
 
+@memo_pos
 def shp_nuthole (nut_r, nut_h, hole_h,
                  xtr_nut = 1, xtr_hole = 1,
                  fc_axis_nut = VX,
@@ -6398,7 +6617,6 @@ def shp_nuthole (nut_r, nut_h, hole_h,
                     xtr_nut....|___|
 
     """
-    doc = FreeCAD.ActiveDocument
     # normalize axis:
     axis_nut = DraftVecUtils.scaleTo(fc_axis_nut,1)
     axis_hole = DraftVecUtils.scaleTo(fc_axis_hole,1)
@@ -6480,7 +6698,7 @@ def shp_nuthole (nut_r, nut_h, hole_h,
 
     shp_nuthole = shp_nut.fuse(shp_hole)
     shp_nuthole = shp_nuthole.removeSplitter()
-    doc.recompute() 
+    shp_recompute()
     return shp_nuthole
 
 #doc = FreeCAD.newDocument()
@@ -6659,6 +6877,226 @@ def get_bolt_bearing_sep (bolt_d, hasnut, lbearing_r, bsep=0):
 
 
 
+# -------------------- index of the edges to fillet or chamfer
+# The shp_filletchamfer_dir* functions select the straight edges of a shape
+# that are parallel to an axis (and, for the *_dirpt* functions, that are on
+# the line of a point). Instead of going through all the edges with
+# FreeCAD vectors in each call, the vertexes of the straight edges are taken
+# once per shape in an EdgeIndex, and the edges are classified with NumPy,
+# if it is available (with python lists if not).
+# The edges parallel to each direction are kept in the index (direction
+# buckets), and the index of the last shapes are kept (see get_edge_index),
+# so the same query on the same shape is not done again.
+
+# maximum number of edge indexes kept, the least recently used are discarded
+EDGE_INDEX_MAX = 16
+# edge indexes of the last shapes, key: hashCode of the shape
+_edge_index = collections.OrderedDict()
+# number of edge indexes taken from the kept ones (hits) and built (misses)
+edge_index_stats = {'hits' : 0, 'misses' : 0}
+
+
+class EdgeIndex (object):
+    """ Index of the straight edges (edges with 2 vertexes) of a shape, to
+    select the edges to fillet or chamfer.
+
+    Parameters:
+    -----------
+    shp : TopoShape
+        shape whose edges are indexed
+
+    Attributes:
+    -----------
+    shp : TopoShape
+        shape whose edges are indexed
+    edges : list of Edges
+        straight edges of the shape, in the order they are in shp.Edges
+    pt0_arr, pt1_arr : numpy array (n,3), or list of tuples if no NumPy
+        coordinates of the first and second vertex of each edge
+    dir_arr : numpy array (n,3), or list of tuples if no NumPy
+        unit vector from the first to the second vertex of each edge
+    tol : float
+        tolerance to compare the coordinates, the same as
+        DraftVecUtils.equals
+    dir_buckets : dict
+        key: direction (either sense)
+        value: list of the indexes of the edges parallel to the direction
+    """
+
+    def __init__(self, shp):
+        self.shp = shp
+        self.tol = 0.5 * 10 ** (-DraftVecUtils.precision())
+        self.dir_buckets = {}
+        self.edges = []
+        pt0_list = []
+        pt1_list = []
+        for edge in shp.Edges:
+            vertexes = edge.Vertexes
+            if len(vertexes) == 2:
+                p0 = vertexes[0].Point
+                p1 = vertexes[1].Point
+                self.edges.append(edge)
+                pt0_list.append((p0.x, p0.y, p0.z))
+                pt1_list.append((p1.x, p1.y, p1.z))
+        if numpy is not None:
+            self.pt0_arr = numpy.array(pt0_list, dtype=float).reshape(-1,3)
+            self.pt1_arr = numpy.array(pt1_list, dtype=float).reshape(-1,3)
+            self.dir_arr = self.unit_arr(self.pt1_arr - self.pt0_arr)
+        else:
+            self.pt0_arr = pt0_list
+            self.pt1_arr = pt1_list
+            self.dir_arr = [self.unit_tup((p1[0]-p0[0], p1[1]-p0[1],
+                                           p1[2]-p0[2]))
+                            for p0, p1 in zip(pt0_list, pt1_list)]
+
+    @staticmethod
+    def unit_arr (vec_arr):
+        """ returns the unit vectors of an array of vectors. The null
+        vectors are left null, so they are not parallel to any direction
+        """
+        norm_arr = numpy.linalg.norm(vec_arr, axis=1)
+        norm_arr[norm_arr == 0] = 1.
+        return vec_arr / norm_arr[:,None]
+
+    @staticmethod
+    def unit_tup (vec):
+        """ same as unit_arr, but for a tuple, without NumPy
+        """
+        norm = math.sqrt(vec[0]*vec[0] + vec[1]*vec[1] + vec[2]*vec[2])
+        if norm == 0:
+            return vec
+        return (vec[0]/norm, vec[1]/norm, vec[2]/norm)
+
+    def equ_tup (self, vec1, vec2):
+        """ True if the tuples vec1 and vec2 are equal or opposite, with
+        the tolerance
+        """
+        tol = self.tol
+        return ((abs(vec1[0]-vec2[0]) < tol and abs(vec1[1]-vec2[1]) < tol
+                 and abs(vec1[2]-vec2[2]) < tol) or
+                (abs(vec1[0]+vec2[0]) < tol and abs(vec1[1]+vec2[1]) < tol
+                 and abs(vec1[2]+vec2[2]) < tol))
+
+    def get_ind_dir (self, fc_axis):
+        """ returns the list of the indexes of the edges parallel to
+        fc_axis (in either sense)
+
+        Parameters:
+        -----------
+        fc_axis : FreeCAD.Vector
+            direction of the edges, it doesnt have to be normalized
+        """
+        nnorm = DraftVecUtils.scaleTo(fc_axis,1)
+        # -0. and 0. are the same
+        key = (round(nnorm.x, 9) + 0., round(nnorm.y, 9) + 0.,
+               round(nnorm.z, 9) + 0.)
+        if key < (0, 0, 0):
+            # the same key for both senses
+            key = (-key[0] + 0., -key[1] + 0., -key[2] + 0.)
+        try:
+            return self.dir_buckets[key]
+        except KeyError:
+            pass
+        axis_tup = (nnorm.x, nnorm.y, nnorm.z)
+        if numpy is not None:
+            axis_arr = numpy.array(axis_tup)
+            par_arr = (
+                  numpy.all(abs(self.dir_arr - axis_arr) < self.tol, axis=1)
+                | numpy.all(abs(self.dir_arr + axis_arr) < self.tol, axis=1))
+            ind_list = numpy.nonzero(par_arr)[0].tolist()
+        else:
+            ind_list = [ind for ind, dir_tup in enumerate(self.dir_arr)
+                        if self.equ_tup(dir_tup, axis_tup)]
+        self.dir_buckets[key] = ind_list
+        return ind_list
+
+    def get_ind_dirpts (self, fc_axis, fc_pts):
+        """ returns the list of the indexes of the edges parallel to
+        fc_axis, whose second vertex is on the line of any of the points
+        fc_pts along fc_axis (or is the point)
+
+        Parameters:
+        -----------
+        fc_axis : FreeCAD.Vector
+            direction of the edges, it doesnt have to be normalized
+        fc_pts : list of FreeCAD.Vector
+            points on the edges
+        """
+        ind_list = self.get_ind_dir(fc_axis)
+        if not ind_list or not fc_pts:
+            return []
+        nnorm = DraftVecUtils.scaleTo(fc_axis,1)
+        axis_tup = (nnorm.x, nnorm.y, nnorm.z)
+        tol = self.tol
+        if numpy is not None:
+            axis_arr = numpy.array(axis_tup)
+            pt1_arr = self.pt1_arr[ind_list]
+            in_arr = numpy.zeros(len(ind_list), dtype=bool)
+            for fc_pt in fc_pts:
+                vec_arr = pt1_arr - numpy.array((fc_pt.x, fc_pt.y, fc_pt.z))
+                # same point
+                in_arr |= numpy.all(abs(vec_arr) < tol, axis=1)
+                # the vector from the point is parallel to the axis
+                vec_arr = self.unit_arr(vec_arr)
+                in_arr |= numpy.all(abs(vec_arr - axis_arr) < tol, axis=1)
+                in_arr |= numpy.all(abs(vec_arr + axis_arr) < tol, axis=1)
+            return [ind for ind, in_line in zip(ind_list, in_arr) if in_line]
+        else:
+            ind_pts_list = []
+            for ind in ind_list:
+                p1 = self.pt1_arr[ind]
+                for fc_pt in fc_pts:
+                    vec = (p1[0]-fc_pt.x, p1[1]-fc_pt.y, p1[2]-fc_pt.z)
+                    if ((abs(vec[0]) < tol and abs(vec[1]) < tol
+                         and abs(vec[2]) < tol) or
+                        self.equ_tup(self.unit_tup(vec), axis_tup)):
+                        ind_pts_list.append(ind)
+                        break
+            return ind_pts_list
+
+    def get_edges (self, ind_list):
+        """ returns the list of edges of a list of indexes
+        """
+        return [self.edges[ind] for ind in ind_list]
+
+
+def get_edge_index (shp):
+    """ Returns the EdgeIndex of a shape. The indexes of the last shapes are
+    kept, so if the shape is the same, the index is not built again
+
+    Parameters:
+    -----------
+    shp : TopoShape
+        shape whose edges are indexed
+
+    Returns:
+    --------
+    EdgeIndex of the shape
+    """
+    key = shp.hashCode()
+    edge_index = _edge_index.get(key)
+    if edge_index is not None and edge_index.shp.isSame(shp):
+        _edge_index.move_to_end(key)
+        edge_index_stats['hits'] += 1
+        return edge_index
+    edge_index = EdgeIndex(shp)
+    edge_index_stats['misses'] += 1
+    _edge_index[key] = edge_index
+    _edge_index.move_to_end(key)
+    while len(_edge_index) > EDGE_INDEX_MAX:
+        _edge_index.popitem(last = False)
+    return edge_index
+
+
+def clear_edge_index ():
+    """ discards the kept edge indexes and sets the counters to zero
+    """
+    _edge_index.clear()
+    edge_index_stats['hits'] = 0
+    edge_index_stats['misses'] = 0
+
+
+
 #  ---------------- edgeonaxis
 # It tells if an edge is on an axis
 # Arguments:
@@ -6719,30 +7157,10 @@ def shp_filletchamfer_dir (shp, fc_axis = VZ,  fillet = 1, radius=1):
 
     """
 
-    # we have to bring the active document
-    doc = FreeCAD.ActiveDocument
-    doc.recompute()  # you may hav problems if you dont do it
-    edgelist = []
-    # normalize the axis:
-    nnorm = DraftVecUtils.scaleTo(fc_axis,1)
-    # get the negative of the normalized vector
-    nnorm_neg = nnorm.negative()
-    for edge in shp.Edges:
-        #logger.debug('filletchamfer: edge Length: %s', edge.Length)
-        # get the FreeCAD.Vector with the point
-        if len(edge.Vertexes) == 2:
-            p0 = edge.Vertexes[0].Point
-            p1 = edge.Vertexes[1].Point
-            v_vertex = p1.sub(p0)  #substraction
-            # I could calculate the angle, but I think it will take more
-            # time than normalizing and checking if they are the same
-            v_vertex.normalize()
-            # check if they are the same vector (they are parallel):
-            if ( DraftVecUtils.equals(v_vertex, nnorm) or
-                 DraftVecUtils.equals(v_vertex, nnorm_neg)):
-                edgelist.append(edge)
-                #logger.debug('append edge Length: %s', edge.Length)
-                #logger.debug(str(p0) + ' - ' + str(p1))
+    shp_recompute()
+    # the edges parallel to the axis, see EdgeIndex
+    edge_index = get_edge_index(shp)
+    edgelist = edge_index.get_edges(edge_index.get_ind_dir(fc_axis))
 
     if len(edgelist) != 0:
         if fillet == 1:
@@ -6750,7 +7168,7 @@ def shp_filletchamfer_dir (shp, fc_axis = VZ,  fillet = 1, radius=1):
             shp_fillcham = shp.makeFillet(radius, edgelist)
         else:
             shp_fillcham = shp.makeChamfer(radius, edgelist)
-        doc.recompute()
+        shp_recompute()
         return shp_fillcham
     else:
         logger.debug('No edge to fillet or chamfer')
@@ -6770,35 +7188,14 @@ def shp_filletchamfer_dirs (shp, fc_axis_l, fillet = 1, radius=1):
 
     """
 
-    # we have to bring the active document
-    doc = FreeCAD.ActiveDocument
-    doc.recompute()  # you may hav problems if you dont do it
-    edgelist = []
-    n_axis_list = []
+    shp_recompute()
+    # the edges parallel to any of the axis, see EdgeIndex
+    edge_index = get_edge_index(shp)
+    ind_set = set()
     for axis in fc_axis_l:
-        # normalize the axis:
-        nnorm = DraftVecUtils.scaleTo(axis,1)
-        n_axis_list.append(nnorm)
-        # get the negative of the normalized vector
-        nnorm_neg = nnorm.negative()
-        n_axis_list.append(nnorm_neg)
-    #logger.debug('filletchamfer: elen: %s',  e_len)
-    for edge in shp.Edges:
-        #logger.debug('filletchamfer: edge Length: %s ind %s',
-        #             edge.Length, edge_ind)
-        # get the FreeCAD.Vector with the point
-        if len(edge.Vertexes) == 2:
-            p0 = edge.Vertexes[0].Point
-            p1 = edge.Vertexes[1].Point
-            v_vertex = p1.sub(p0)  #substraction
-            # I could calculate the angle, but I think it will take more
-            # time than normalizing and checking if they are the same
-            v_vertex.normalize()
-            # check if they are the same vector (they are parallel):
-            for naxis in n_axis_list:
-                if ( DraftVecUtils.equals(v_vertex, naxis)):
-                    edgelist.append(edge)
-                    break # breaks inside this for, but not the outer
+        ind_set.update(edge_index.get_ind_dir(axis))
+    # in the same order as they are in the shape
+    edgelist = edge_index.get_edges(sorted(ind_set))
 
     if len(edgelist) != 0:
         if fillet == 1:
@@ -6806,7 +7203,7 @@ def shp_filletchamfer_dirs (shp, fc_axis_l, fillet = 1, radius=1):
             shp_fillcham = shp.makeFillet(radius, edgelist)
         else:
             shp_fillcham = shp.makeChamfer(radius, edgelist)
-        doc.recompute()
+        shp_recompute()
         return shp_fillcham
     else:
         logger.debug('No edge to fillet or chamfer')
@@ -6830,41 +7227,13 @@ def shp_filletchamfer_dirpt (shp, fc_axis = VZ, fc_pt = V0,  fillet = 1,
 
     """
 
-    # we have to bring the active document
-    doc = FreeCAD.ActiveDocument
-    doc.recompute()  # you may hav problems if you dont do it
-    edgelist = []
-    # normalize the axis:
-    nnorm = DraftVecUtils.scaleTo(fc_axis,1)
-    # get the negative of the normalized vector
-    nnorm_neg = nnorm.negative()
-    #logger.debug('filletchamfer: elen: %s',  e_len)
-    for edge in shp.Edges:
-        #logger.debug('filletchamfer: edge Length: %s ind %s',
-        #             edge.Length, edge_ind)
-        # get the FreeCAD.Vector with the point
-        if len(edge.Vertexes) == 2:
-            p0 = edge.Vertexes[0].Point
-            p1 = edge.Vertexes[1].Point
-            v_vertex = p1.sub(p0)  #substraction
-            # I could calculate the angle, but I think it will take more
-            # time than normalizing and checking if they are the same
-            v_vertex.normalize()
-            # check if they are the same vector (they are parallel):
-            if ( DraftVecUtils.equals(v_vertex, nnorm) or
-                 DraftVecUtils.equals(v_vertex, nnorm_neg)):
-                # Now check if this vertex goes through the point
-                # get the vector from a vertex to the point
-                if DraftVecUtils.equals(p1, fc_pt): # same point
-                    edgelist.append(edge)
-                    break # vertex found
-                else:
-                    v_vertex_pt = p1.sub(fc_pt)
-                    v_vertex_pt.normalize()
-                    if ( DraftVecUtils.equals(v_vertex_pt, nnorm) or
-                         DraftVecUtils.equals(v_vertex_pt, nnorm_neg)):
-                        edgelist.append(edge)
-                        break #only one
+    shp_recompute()
+    # the edges parallel to the axis that go through the point,
+    # see EdgeIndex
+    edge_index = get_edge_index(shp)
+    ind_list = edge_index.get_ind_dirpts(fc_axis, [fc_pt])
+    # only one, the first
+    edgelist = edge_index.get_edges(ind_list[:1])
 
     if len(edgelist) != 0:
         if fillet == 1:
@@ -6872,7 +7241,7 @@ def shp_filletchamfer_dirpt (shp, fc_axis = VZ, fc_pt = V0,  fillet = 1,
             shp_fillcham = shp.makeFillet(radius, edgelist)
         else:
             shp_fillcham = shp.makeChamfer(radius, edgelist)
-        doc.recompute()
+        shp_recompute()
         return shp_fillcham
     else:
         logger.debug('No edge to fillet or chamfer')
@@ -6894,43 +7263,12 @@ def shp_filletchamfer_dirpts (shp, fc_axis, fc_pts,  fillet = 1,
 
     """
 
-    # we have to bring the active document
-    doc = FreeCAD.ActiveDocument
-    doc.recompute()  # you may hav problems if you dont do it
-    edgelist = []
-    # normalize the axis:
-    nnorm = DraftVecUtils.scaleTo(fc_axis,1)
-    # get the negative of the normalized vector
-    nnorm_neg = nnorm.negative()
-    #logger.debug('filletchamfer: elen: %s',  e_len)
-    for edge in shp.Edges:
-        #logger.debug('filletchamfer: edge Length: %s ind %s',
-        #             edge.Length, edge_ind)
-        # get the FreeCAD.Vector with the point
-        if len(edge.Vertexes) == 2:
-            p0 = edge.Vertexes[0].Point
-            p1 = edge.Vertexes[1].Point
-            v_vertex = p1.sub(p0)  #substraction
-            # I could calculate the angle, but I think it will take more
-            # time than normalizing and checking if they are the same
-            v_vertex.normalize()
-            # check if they are the same vector (they are parallel):
-            if ( DraftVecUtils.equals(v_vertex, nnorm) or
-                 DraftVecUtils.equals(v_vertex, nnorm_neg)):
-                # Now check if this vertex goes through the point
-                # get the vector from a vertex to the point
-                for pti in fc_pts:
-                    if DraftVecUtils.equals(p1, pti):
-                        # same point
-                        edgelist.append(edge)
-                        break # vertex found
-                    else:
-                        v_vertex_pt = p1.sub(pti)
-                        v_vertex_pt.normalize()
-                        if ( DraftVecUtils.equals(v_vertex_pt, nnorm) or
-                             DraftVecUtils.equals(v_vertex_pt, nnorm_neg)):
-                            edgelist.append(edge)
-                            break # vertex found
+    shp_recompute()
+    # the edges parallel to the axis that go through any of the points,
+    # see EdgeIndex
+    edge_index = get_edge_index(shp)
+    edgelist = edge_index.get_edges(
+                            edge_index.get_ind_dirpts(fc_axis, fc_pts))
 
     if len(edgelist) != 0:
         if fillet == 1:
@@ -6938,7 +7276,7 @@ def shp_filletchamfer_dirpts (shp, fc_axis, fc_pts,  fillet = 1,
             shp_fillcham = shp.makeFillet(radius, edgelist)
         else:
             shp_fillcham = shp.makeChamfer(radius, edgelist)
-        doc.recompute()
+        shp_recompute()
         return shp_fillcham
     else:
         logger.debug('No edge to fillet or chamfer')
@@ -6958,9 +7296,7 @@ def shp_cir_fillchmf (shp, circen_pos = V0,  fillet = 1, radius=1):
 
     """
 
-    # we have to bring the active document
-    doc = FreeCAD.ActiveDocument
-    doc.recompute()  # you may hav problems if you dont do it
+    shp_recompute()
     edgelist = []
     for edge in shp.Edges:
         # get the edges, if it is a cylinder, 2 edges will have just one
@@ -6980,7 +7316,7 @@ def shp_cir_fillchmf (shp, circen_pos = V0,  fillet = 1, radius=1):
             shp_fillcham = shp.makeFillet(radius, edgelist)
         else:
             shp_fillcham = shp.makeChamfer(radius, edgelist)
-        doc.recompute()
+        shp_recompute()
         return shp_fillcham
     else:
         logger.debug('No edge to fillet or chamfer')
@@ -6997,9 +7333,7 @@ def shp_cylfilletchamfer (shp, fillet = 1, radius=1):
 
     """
 
-    # we have to bring the active document
-    doc = FreeCAD.ActiveDocument
-    doc.recompute()  # you may hav problems if you dont do it
+    shp_recompute()
     edgelist = []
     for edge in shp.Edges:
         # get the edges, if it is a cylinder, 2 edges will have just one
@@ -7014,7 +7348,7 @@ def shp_cylfilletchamfer (shp, fillet = 1, radius=1):
             shp_fillcham = shp.makeFillet(radius, edgelist)
         else:
             shp_fillcham = shp.makeChamfer(radius, edgelist)
-        doc.recompute()
+        shp_recompute()
         return shp_fillcham
     else:
         logger.debug('No edge to fillet or chamfer')
@@ -7040,9 +7374,7 @@ def shp_filletchamfer (shp, e_len, fillet = 1, radius=1, axis='x',
                    xpos_chk = 0, ypos_chk = 0, zpos_chk=0,
                    xpos = 0, ypos = 0, zpos = 0
                     ):
-    # we have to bring the active document
-    doc = FreeCAD.ActiveDocument
-    doc.recompute()  # you may hav problems if you dont do it
+    shp_recompute()
     edgelist = []
     #logger.debug('filletchamfer: elen: %s',  e_len)
     for edge_ind, edge in enumerate(shp.Edges):
@@ -7098,7 +7430,7 @@ def shp_filletchamfer (shp, e_len, fillet = 1, radius=1, axis='x',
             shp_fillcham = shp.makeFillet(radius, edgelist)
         else:
             shp_fillcham = shp.makeChamfer(radius, edgelist)
-        doc.recompute()
+        shp_recompute()
         return shp_fillcham
     else:
         logger.debug('No edge to fillet or chamfer')
@@ -0,0 +1,548 @@
+# ----------------------------------------------------------------------------
+# -- Timing of the construction of the shapes
+# -- comps library
+# ----------------------------------------------------------------------------
+# -- (c) Felipe Machado
+# -- Area of Electronic Technology. Rey Juan Carlos University (urjc.es)
+# -- https://github.com/felipe-m/fcad-comps
+# -- October-2026
+# ----------------------------------------------------------------------------
+# --- LGPL Licence
+# ----------------------------------------------------------------------------
+
+# The classes that build the shapes (shp_clss.Obj3D children) mark the
+# interesting parts of their construction with stages:
+#
+#        with fcprof.stage('boolean'):
+#            shp_l = shp_l.cut(shp_bolts)
+#            shp_l = shp_l.removeSplitter()
+#
+# If nobody is collecting, a stage does nothing but to execute its block.
+# To collect the time spent in each stage:
+#
+#        with fcprof.collect_stages() as stages:
+#            shp = ShpFilterHolder()
+#        print (stages.times['boolean'])
+#
+# The constructors of the parts can also be divided in consecutive steps,
+# without having to indent the code inside a with statement:
+#
+#        steps = fcprof.StageSteps('ShpFilterHolder')
+#        steps.step('base')
+#        ...
+#        steps.step('bolt_holes')
+#        ...
+#        steps.end()
+#
+# The steps are also collected as stages (collect_stages), and all the
+# stages and steps can be collected as spans, to be seen in a timeline
+# (chrome://tracing or https://ui.perfetto.dev):
+#
+#        with fcprof.collect_spans() as spans:
+#            shp = ShpFilterHolder()
+#        spans.save_chrome_trace('filter_holder_trace.json')
+#
+# The functions that build the shapes (fcfun.shp_box_dir, ...) and the
+# constructors of the classes (Obj3D and SinglePart children) can also be
+# profiled, to know which of them is taking the time inside a part.
+# It is opt-in: the functions are wrapped only when they are instrumented,
+# and the wrappers just call the function if nobody is collecting:
+#
+#        fcprof.instrument_funcs(fcfun, prefix_list = ['shp_', 'fuseshplist'])
+#        fcprof.instrument_classes(tensioner_clss,
+#                                  [shp_clss.Obj3D, fc_clss.SinglePart])
+#        with fcprof.collect_funcs() as func_prof:
+#            shp = ShpTensionerHolder()
+#        print (func_prof.report())
+#        func_prof.save_json('prof.json')
+#        func_prof.save_collapsed('prof.folded') # for flamegraph.pl
+#        fcprof.uninstrument()
+#
+# This module doesnt import FreeCAD, so it can be used anywhere
+
+import os
+import json
+import time
+import threading
+import inspect
+import logging
+import functools
+import contextlib
+
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+# clock to measure the elapsed times
+clock = time.perf_counter
+
+# list of StageTimes objects that are collecting now
+_collectors = []
+# list of SpanTrace objects that are collecting now
+_span_traces = []
+
+
+class StageTimes (object):
+    """ Accumulates the time spent in each named stage
+
+    Attributes:
+    -----------
+    times : dict
+        key: name of the stage. value: accumulated time in seconds
+    counts : dict
+        key: name of the stage. value: number of times the stage was entered
+
+    """
+    def __init__(self):
+        self.times = {}
+        self.counts = {}
+
+    def add (self, name, elapsed):
+        """ Adds the elapsed time (seconds) to the stage name
+        """
+        self.times[name] = self.times.get(name, 0.) + elapsed
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    def get_time (self, name):
+        """ returns the accumulated time of the stage, 0 if never entered
+        """
+        return self.times.get(name, 0.)
+
+
+@contextlib.contextmanager
+def collect_stages ():
+    """ Context manager that collects the time of all the stages executed
+    inside it. Collectors can be nested, each one gets all the stages
+
+    Returns:
+    --------
+    StageTimes object (in the with statement)
+    """
+    stage_times = StageTimes()
+    _collectors.append(stage_times)
+    try:
+        yield stage_times
+    finally:
+        _collectors.remove(stage_times)
+
+
+class SpanTrace (object):
+    """ Keeps the spans (name, start and duration) of the stages, steps and
+    parts, to be exported in the Chrome trace format
+
+    Attributes:
+    -----------
+    time_0 : float
+        clock time when the collection started, the origin of the spans
+    events : list of dict
+        Chrome trace events, times in microseconds
+    """
+    def __init__(self):
+        self.time_0 = clock()
+        self.events = []
+
+    def add (self, name, cat, time_start, time_end):
+        """ Adds a span
+
+        Parameters:
+        -----------
+        name : str
+            name of the span
+        cat : str
+            category: 'stage', 'step' or 'part'
+        time_start, time_end : float
+            clock times of the start and the end of the span
+        """
+        self.events.append({'name' : name,
+                            'cat'  : cat,
+                            'ph'   : 'X',
+                            'ts'   : (time_start - self.time_0) * 1e6,
+                            'dur'  : (time_end - time_start) * 1e6,
+                            'pid'  : os.getpid(),
+                            'tid'  : threading.get_ident()})
+
+    def get_chrome_trace (self):
+        """ returns a dictionary in the Chrome trace format, the spans
+        are nested by their times
+        """
+        return {'traceEvents'     : self.events,
+                'displayTimeUnit' : 'ms'}
+
+    def save_chrome_trace (self, filename):
+        """ saves the spans in a JSON file in the Chrome trace format
+        """
+        with open(filename, 'w') as json_file:
+            json.dump(self.get_chrome_trace(), json_file)
+
+
+@contextlib.contextmanager
+def collect_spans ():
+    """ Context manager that collects the spans of all the stages, steps
+    and parts executed inside it
+
+    Returns:
+    --------
+    SpanTrace object (in the with statement)
+    """
+    span_trace = SpanTrace()
+    _span_traces.append(span_trace)
+    try:
+        yield span_trace
+    finally:
+        _span_traces.remove(span_trace)
+
+
+def _add_span (name, cat, time_start, time_end):
+    """ adds the span to the collectors. The steps and stages are also
+    added to the collectors of stages
+    """
+    if cat != 'part':
+        for stage_times in _collectors:
+            stage_times.add(name, time_end - time_start)
+    for span_trace in _span_traces:
+        span_trace.add(name, cat, time_start, time_end)
+
+
+@contextlib.contextmanager
+def stage (name):
+    """ Context manager that marks a stage of the construction of a shape
+    If there is no collector, it just executes the block
+
+    Parameters:
+    -----------
+    name : str
+        name of the stage, the time of stages with the same name is added
+    """
+    if not _collectors and not _span_traces:
+        yield
+        return
+    time_0 = clock()
+    try:
+        yield
+    finally:
+        _add_span(name, 'stage', time_0, clock())
+
+
+class StageSteps (object):
+    """ Consecutive steps of the construction of a part. Each step ends
+    when the next one starts, so the code of the steps doesnt have to be
+    inside a with statement. If the construction raises an exception, the
+    unfinished steps are not collected
+
+    Parameters:
+    -----------
+    part_name : str
+        name of the part, the span of the whole part has this name
+
+    Attributes:
+    -----------
+    part_name : str
+        name of the part
+    step_name : str
+        name of the current step, None if there is no step
+    """
+    def __init__(self, part_name):
+        self.part_name = part_name
+        self.step_name = None
+        self.time_0 = clock()
+        self.step_time_0 = self.time_0
+
+    def end_step (self):
+        """ ends the current step, if there is one
+        """
+        if self.step_name is not None:
+            time_end = clock()
+            if _collectors or _span_traces:
+                _add_span(self.step_name, 'step', self.step_time_0, time_end)
+            self.step_name = None
+
+    def step (self, name):
+        """ ends the current step and starts a new one
+
+        Parameters:
+        -----------
+        name : str
+            name of the step: 'base', 'bolt_holes', ...
+        """
+        self.end_step()
+        self.step_name = name
+        self.step_time_0 = clock()
+
+    def end (self):
+        """ ends the current step and the part
+        """
+        self.end_step()
+        if _span_traces:
+            _add_span(self.part_name, 'part', self.time_0, clock())
+
+
+# ------------------------ profiling of functions and constructors
+
+# list of FuncProfile objects that are collecting now
+_func_profiles = []
+# calls of instrumented functions being executed: [name, start time,
+# time of the instrumented functions called inside]
+_func_stack = []
+# functions that have been instrumented: (owner, attribute, original)
+_instrumented = []
+
+
+class FuncProfile (object):
+    """ Accumulates the calls and times of the instrumented functions
+
+    Attributes:
+    -----------
+    funcs : dict
+        key: name of the function. value: dictionary with:
+        'calls' : number of calls
+        'time' : cumulative time in seconds, including the functions called
+                 (recursive calls are counted once)
+        'self_time' : time in seconds, not including the instrumented
+                      functions called
+        'shapes' : number of shapes returned (or built by the constructor)
+        'faces' : number of faces of those shapes
+    stacks : dict
+        key: names of the functions of the call stack, separated by ';'
+        value: self time in seconds of the last function of the stack
+    """
+
+    # columns of the report and the key to sort them
+    COLUMNS = ['calls', 'time', 'self_time', 'shapes', 'faces']
+
+    def __init__(self):
+        self.funcs = {}
+        self.stacks = {}
+
+    def add (self, name_stack, elapsed, self_time, shp):
+        """ Adds a call of the function that is the last of name_stack
+
+        Parameters:
+        -----------
+        name_stack : list of str
+            names of the instrumented functions of the call stack
+        elapsed : float
+            time of the call, in seconds
+        self_time : float
+            time of the call, not including the instrumented functions
+            called
+        shp : TopoShape
+            shape returned or built, None if there is no shape
+        """
+        name = name_stack[-1]
+        try:
+            func_stats = self.funcs[name]
+        except KeyError:
+            func_stats = dict((col, 0) for col in self.COLUMNS)
+            self.funcs[name] = func_stats
+        func_stats['calls'] += 1
+        if name not in name_stack[:-1]:
+            # not a recursive call
+            func_stats['time'] += elapsed
+        func_stats['self_time'] += self_time
+        if shp is not None:
+            func_stats['shapes'] += 1
+            func_stats['faces'] += len(shp.Faces)
+        stack_key = ';'.join(name_stack)
+        self.stacks[stack_key] = self.stacks.get(stack_key, 0.) + self_time
+
+    def get_rows (self, sort = 'time'):
+        """ returns a list of tuples (name, statistics dictionary) sorted
+        by the column sort, from higher to lower
+        """
+        return sorted(self.funcs.items(),
+                      key = lambda item: item[1][sort], reverse = True)
+
+    def report (self, sort = 'time', limit = 0):
+        """ returns a str with a table of the functions
+
+        Parameters:
+        -----------
+        sort : str
+            column to sort the table, one of COLUMNS
+        limit : int
+            maximum number of functions in the table. 0: all
+        """
+        rows = self.get_rows(sort)
+        if limit:
+            rows = rows[:limit]
+        lines = ['%-44s%8s%12s%12s%8s%8s' % ('function', 'calls', 'time (s)',
+                                             'self (s)', 'shapes', 'faces')]
+        for name, func_stats in rows:
+            lines.append('%-44s%8d%12.4f%12.4f%8d%8d' % (
+                                                   name,
+                                                   func_stats['calls'],
+                                                   func_stats['time'],
+                                                   func_stats['self_time'],
+                                                   func_stats['shapes'],
+                                                   func_stats['faces']))
+        return '\n'.join(lines)
+
+    def save_json (self, filename):
+        """ saves the statistics of the functions and the stacks in a JSON
+        file
+        """
+        with open(filename, 'w') as json_file:
+            json.dump({'funcs' : self.funcs, 'stacks' : self.stacks},
+                      json_file, indent = 2, sort_keys = True)
+
+    def save_collapsed (self, filename):
+        """ saves the stacks in the collapsed format of flamegraph.pl:
+        one line per stack, with the self time in microseconds:
+            ShpTensionerHolder.__init__;shp_box_dir 1530
+        """
+        with open(filename, 'w') as folded_file:
+            for stack_key in sorted(self.stacks):
+                usecs = int(round(self.stacks[stack_key] * 1e6))
+                if usecs > 0:
+                    folded_file.write(stack_key + ' ' + str(usecs) + '\n')
+
+
+@contextlib.contextmanager
+def collect_funcs ():
+    """ Context manager that collects the calls of the instrumented functions
+    executed inside it. Collectors can be nested, each one gets all the
+    calls
+
+    Returns:
+    --------
+    FuncProfile object (in the with statement)
+    """
+    func_prof = FuncProfile()
+    _func_profiles.append(func_prof)
+    try:
+        yield func_prof
+    finally:
+        _func_profiles.remove(func_prof)
+
+
+def prof_func (func, name, get_shp = None):
+    """ Returns a wrapper of the function that records its calls if there
+    is a collector (collect_funcs)
+
+    Parameters:
+    -----------
+    func : function
+        function to profile
+    name : str
+        name of the function in the profile
+    get_shp : function
+        it receives the arguments and the result of the call and returns
+        the shape to count, or None. If None, the result is counted if it
+        is a shape (it has Faces)
+    """
+    @functools.wraps(func)
+    def prof_wrapper (*args, **kwargs):
+        if not _func_profiles:
+            return func(*args, **kwargs)
+        frame = [name, clock(), 0.]
+        _func_stack.append(frame)
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            time_end = clock()
+            _func_stack.pop()
+        elapsed = time_end - frame[1]
+        if get_shp is None:
+            shp = result if hasattr(result, 'Faces') else None
+        else:
+            shp = get_shp(args, result)
+        name_stack = [stack_frame[0] for stack_frame in _func_stack]
+        name_stack.append(name)
+        for func_prof in _func_profiles:
+            func_prof.add(name_stack, elapsed, elapsed - frame[2], shp)
+        if _func_stack:
+            # the time of the counting of the faces is not taken as the
+            # time of the calling function
+            _func_stack[-1][2] += clock() - frame[1]
+        return result
+    prof_wrapper.prof_func = func
+    return prof_wrapper
+
+
+def _set_instrumented (owner, attr, wrapper):
+    """ replaces the attribute of owner (module or class) by the wrapper,
+    keeping the original to be restored by uninstrument
+    """
+    _instrumented.append((owner, attr, owner.__dict__[attr]))
+    setattr(owner, attr, wrapper)
+
+
+def instrument_funcs (module, prefix_list = None, name_list = None):
+    """ Instruments the public functions of a module, the calls inside the
+    module are also profiled, since they are looked up in the module
+
+    Parameters:
+    -----------
+    module : module
+        module whose functions are instrumented
+    prefix_list : list of str
+        only the functions that start with any of the prefixes
+    name_list : list of str
+        functions to instrument, besides the ones with the prefixes.
+        If prefix_list and name_list are None, all the public functions
+
+    Returns:
+    --------
+    Number of functions instrumented
+    """
+    func_num = 0
+    for attr, func in list(module.__dict__.items()):
+        if (not inspect.isfunction(func) or attr.startswith('_')
+            or func.__module__ != module.__name__
+            or hasattr(func, 'prof_func')):
+            continue
+        if prefix_list is None and name_list is None:
+            selected = True
+        else:
+            selected = ((prefix_list is not None and
+                         attr.startswith(tuple(prefix_list))) or
+                        (name_list is not None and attr in name_list))
+        if selected:
+            _set_instrumented(module, attr, prof_func(func, attr))
+            func_num += 1
+    return func_num
+
+
+def _get_init_shp (args, result):
+    """ returns the shape built by a constructor, without building it if
+    it is lazy (see shp_clss.Obj3D.shp)
+    """
+    return args[0].__dict__.get('_shp')
+
+
+def instrument_classes (module, base_class_list):
+    """ Instruments the constructors of the classes of a module that are
+    children of any of the base classes (or are the base classes)
+
+    Parameters:
+    -----------
+    module : module
+        module whose classes are instrumented
+    base_class_list : list of classes
+        for example: [shp_clss.Obj3D, fc_clss.SinglePart]
+
+    Returns:
+    --------
+    Number of constructors instrumented
+    """
+    init_num = 0
+    for cls in list(module.__dict__.values()):
+        if (not inspect.isclass(cls) or cls.__module__ != module.__name__
+            or not issubclass(cls, tuple(base_class_list))):
+            continue
+        init = cls.__dict__.get('__init__')
+        if init is None or hasattr(init, 'prof_func'):
+            # the constructor of the parent is used, or already instrumented
+            continue
+        _set_instrumented(cls, '__init__',
+                          prof_func(init, cls.__name__ + '.__init__',
+                                    get_shp = _get_init_shp))
+        init_num += 1
+    return init_num
+
+
+def uninstrument ():
+    """ restores all the instrumented functions and constructors
+    """
+    while _instrumented:
+        owner, attr, func = _instrumented.pop()
+        setattr(owner, attr, func)
@@ -0,0 +1,489 @@
+# ----------------------------------------------------------------------------
+# -- Interference detection between the parts of an assembly
+# -- comps library
+# ----------------------------------------------------------------------------
+# -- (c) Felipe Machado
+# -- Area of Electronic Technology. Rey Juan Carlos University (urjc.es)
+# -- https://github.com/felipe-m/fcad-comps
+# -- October-2026
+# ----------------------------------------------------------------------------
+# --- LGPL Licence
+# ----------------------------------------------------------------------------
+
+# Finds the parts of an assembly that intersect each other. Making the
+# common of all the pairs of parts is too slow, so it is done in 2 phases:
+#  - broadphase: the bounding boxes of the parts are sorted along X, and
+#    swept (sweep and prune), to get the pairs of parts whose bounding boxes
+#    intersect (candidates)
+#  - the common (boolean intersection) is only made on the candidates, and
+#    if the volume is larger than min_volume, the parts intersect.
+#    It can be done in a pool of processes, with the shapes serialized as
+#    BREP strings, like in stlexport
+#
+# The parts touching each other (a bolt in its hole, a piece on a profile)
+# have a common with no volume, so they are not interferences.
+#
+#        interf_list = interference.find_interferences(
+#                                [filter_holder, tensioner, partLinGuideRail])
+#        interference.print_interferences(interf_list)
+#
+# or, for a set of parts: tensioner.get_interferences()
+
+import os
+import logging
+import concurrent.futures
+
+import FreeCAD
+import Part
+
+import fcprof
+
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+# common volume (mm3) smaller than this is not an interference, it comes
+# from parts that are touching and the precision of the booleans
+MIN_VOLUME = 0.001
+
+# last statistics of find_interferences: number of parts, candidate pairs
+# of the broadphase, interferences and times (seconds)
+stats = {}
+
+
+def get_part_shps (part_list, placement = None):
+    """ Returns the parts and their shapes, in the position they are in the
+    assembly. The sets (PartsSet) are searched recursively, so only the
+    single parts are returned
+
+    Parameters:
+    -----------
+    part_list : list of fc_clss.SinglePart or fc_clss.PartsSet
+        parts of the assembly
+    placement : FreeCAD.Placement
+        placement of the set the parts are in, if it has been grouped
+
+    Returns:
+    --------
+    List of tuples (part, shape)
+    """
+    part_shp_list = []
+    for part in part_list:
+        try:
+            child_list = part.get_parts()
+        except AttributeError:
+            logger.error('not a part or a set of parts: ' + str(part))
+            continue
+        if child_list:
+            # a set of parts, if it has been grouped, its FreeCAD object
+            # moves its children
+            set_placement = placement
+            fco = getattr(part, 'fco', None)
+            if fco is not None:
+                if set_placement is None:
+                    set_placement = fco.Placement
+                else:
+                    set_placement = set_placement.multiply(fco.Placement)
+            part_shp_list.extend(get_part_shps(child_list, set_placement))
+            continue
+        fco = getattr(part, 'fco', None)
+        if fco is not None:
+            # the shape of the object has its placement
+            shp = fco.Shape.copy()
+        else:
+            shp = part.shp.copy()
+        if shp.isNull():
+            logger.warning('part with no shape: ' + str(part.name))
+            continue
+        if placement is not None:
+            shp.Placement = placement.multiply(shp.Placement)
+        part_shp_list.append((part, shp))
+    return part_shp_list
+
+
+def get_bbox_pairs (bbox_list, tol = 0.):
+    """ Broadphase: returns the pairs of bounding boxes that intersect.
+    The boxes are sorted by their start along X, and swept: a box can only
+    intersect the boxes that have started and not ended before it starts
+    (sweep and prune). Then Y and Z are checked
+
+    Parameters:
+    -----------
+    bbox_list : list of FreeCAD.BoundBox
+    tol : float
+        the boxes are enlarged by this tolerance
+
+    Returns:
+    --------
+    List of tuples (i, j) with the indexes of the boxes that intersect,
+    i < j
+    """
+    order_list = sorted(range(len(bbox_list)),
+                        key = lambda ind: bbox_list[ind].XMin)
+    pair_list = []
+    active_list = []
+    for ind in order_list:
+        bbox = bbox_list[ind]
+        # the boxes that end before this one starts are no longer active
+        active_list = [act for act in active_list
+                       if bbox_list[act].XMax + tol >= bbox.XMin - tol]
+        for act in active_list:
+            act_bbox = bbox_list[act]
+            if (    act_bbox.YMax + tol >= bbox.YMin - tol
+                and bbox.YMax + tol >= act_bbox.YMin - tol
+                and act_bbox.ZMax + tol >= bbox.ZMin - tol
+                and bbox.ZMax + tol >= act_bbox.ZMin - tol):
+                pair_list.append((min(act, ind), max(act, ind)))
+        active_list.append(ind)
+    return sorted(pair_list)
+
+
+def common_volume (shp_a, shp_b):
+    """ returns the volume of the common of 2 shapes
+    """
+    try:
+        return shp_a.common(shp_b).Volume
+    except Exception:  # Part raises different exceptions
+        logger.warning('common of the shapes failed')
+        return 0.
+
+
+def common_brep (job):
+    """ Reads the 2 shapes from BREP strings and returns the volume of
+    their common.
+    It is executed in the processes of the pool, so it is a module function
+
+    Parameters:
+    -----------
+    job : dict
+        'pair' : tuple with the indexes of the shapes
+        'brep_a', 'brep_b' : str with the BREP of the shapes
+
+    Returns:
+    --------
+    Tuple (pair, volume)
+    """
+    shp_a = Part.Shape()
+    shp_a.importBrepFromString(job['brep_a'])
+    shp_b = Part.Shape()
+    shp_b.importBrepFromString(job['brep_b'])
+    return job['pair'], common_volume(shp_a, shp_b)
+
+
+def find_interferences (part_list, min_volume = MIN_VOLUME, tol = 0.,
+                        processes = 1):
+    """ Finds the parts of an assembly that intersect
+
+    Parameters:
+    -----------
+    part_list : list of fc_clss.SinglePart or fc_clss.PartsSet
+        parts of the assembly, the sets are searched recursively
+    min_volume : float
+        minimum volume of the common to be an interference
+    tol : float
+        tolerance of the bounding boxes of the broadphase
+    processes : int
+        number of processes of the pool to make the commons.
+        1: no pool, everything is done in this process
+        None: the number of CPUs
+
+    Returns:
+    --------
+    List of dictionaries, one for each pair of parts that intersect,
+    sorted by volume, the largest first:
+    {'part_a', 'part_b' : the parts (SinglePart),
+     'name_a', 'name_b' : their names,
+     'volume' : volume of the common}
+    The statistics are in the module variable stats
+    """
+    time_0 = fcprof.clock()
+    part_shp_list = get_part_shps(part_list)
+    bbox_list = [shp.BoundBox for _, shp in part_shp_list]
+    pair_list = get_bbox_pairs(bbox_list, tol = tol)
+    time_broad = fcprof.clock()
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+    processes = max(1, min(processes, len(pair_list)))
+    result_list = None
+    if processes > 1:
+        # each shape is serialized once
+        brep_dict = {}
+        for pair in pair_list:
+            for ind in pair:
+                if ind not in brep_dict:
+                    brep_dict[ind] = part_shp_list[ind][1].exportBrepToString()
+        job_list = [{'pair'   : pair,
+                     'brep_a' : brep_dict[pair[0]],
+                     'brep_b' : brep_dict[pair[1]]}
+                    for pair in pair_list]
+        try:
+            with concurrent.futures.ProcessPoolExecutor(
+                                    max_workers = processes) as executor:
+                result_list = list(executor.map(common_brep, job_list))
+        except (OSError, concurrent.futures.process.BrokenProcessPool):
+            logger.warning('pool of processes failed, making the commons '
+                           'in this process')
+            processes = 1
+    if result_list is None:
+        result_list = [(pair, common_volume(part_shp_list[pair[0]][1],
+                                            part_shp_list[pair[1]][1]))
+                       for pair in pair_list]
+
+    interf_list = []
+    for (ind_a, ind_b), volume in result_list:
+        if volume > min_volume:
+            part_a = part_shp_list[ind_a][0]
+            part_b = part_shp_list[ind_b][0]
+            interf_list.append({'part_a' : part_a,
+                                'part_b' : part_b,
+                                'name_a' : part_a.name,
+                                'name_b' : part_b.name,
+                                'volume' : volume})
+    interf_list.sort(key = lambda interf: interf['volume'], reverse = True)
+    time_end = fcprof.clock()
+
+    stats.clear()
+    stats.update({'parts'         : len(part_shp_list),
+                  'pairs'         : (len(part_shp_list)
+                                     * (len(part_shp_list) - 1) // 2),
+                  'candidates'    : len(pair_list),
+                  'interferences' : len(interf_list),
+                  'processes'     : processes,
+                  'time_broad'    : time_broad - time_0,
+                  'time_common'   : time_end - time_broad})
+    logger.debug(str(stats['parts']) + ' parts, '
+                 + str(stats['candidates']) + ' candidates of '
+                 + str(stats['pairs']) + ' pairs, '
+                 + str(stats['interferences']) + ' interferences')
+    return interf_list
+
+
+def print_interferences (interf_list):
+    """ prints the interferences returned by find_interferences
+    """
+    if not interf_list:
+        print ('no interferences')
+        return
+    print ('%-36s%-36s%14s' % ('part', 'part', 'volume (mm3)'))
+    for interf in interf_list:
+        print ('%-36s%-36s%14.3f' % (interf['name_a'], interf['name_b'],
+                                     interf['volume']))
+
+
+# ------------------- Motion sweep
+# The moving parts (for example, the filter holder and the block of the
+# linear guide) are moved along an axis in steps, and at each step the
+# clearance (minimum distance) to the static parts is calculated.
+# The shapes are taken once, the broadphase is made once with the bounding
+# boxes of the moving parts swept along all the travel, and at each step
+# the shapes of the moving parts are only translated (their location
+# changes, they are not built again)
+#
+#        sweep = interference.sweep_clearance(
+#                          moving_list = [filter_holder, partLinGuideBlock],
+#                          static_list = [tensioner, nemaholder_w_motor],
+#                          axis_mov = axis_mov,
+#                          offset_list = interference.get_offsets(-30, 30, 12))
+#        interference.print_sweep(sweep)
+
+# clearances larger than this (mm) are not calculated
+MAX_CLEARANCE = 10.
+
+
+def get_offsets (start, end, n_steps):
+    """ returns a list of n_steps + 1 offsets from start to end, both
+    included
+    """
+    if n_steps < 1:
+        return [start]
+    step = (end - start) / float(n_steps)
+    return [start + step * i for i in range(n_steps + 1)]
+
+
+def get_bbox_tuple (bbox, vec = None):
+    """ returns a tuple (XMin, YMin, ZMin, XMax, YMax, ZMax) of a bounding
+    box, moved by vec. So it is not necessary to get the BoundBox of a
+    shape each time it is moved
+    """
+    if vec is None:
+        return (bbox.XMin, bbox.YMin, bbox.ZMin,
+                bbox.XMax, bbox.YMax, bbox.ZMax)
+    return (bbox.XMin + vec.x, bbox.YMin + vec.y, bbox.ZMin + vec.z,
+            bbox.XMax + vec.x, bbox.YMax + vec.y, bbox.ZMax + vec.z)
+
+
+def bbox_tuple_near (bbt_a, bbt_b, dist = 0.):
+    """ returns True if 2 bounding box tuples (see get_bbox_tuple) are
+    closer than dist
+    """
+    return (    bbt_a[0] <= bbt_b[3] + dist and bbt_b[0] <= bbt_a[3] + dist
+            and bbt_a[1] <= bbt_b[4] + dist and bbt_b[1] <= bbt_a[4] + dist
+            and bbt_a[2] <= bbt_b[5] + dist and bbt_b[2] <= bbt_a[5] + dist)
+
+
+def sweep_clearance (moving_list, static_list, axis_mov, offset_list,
+                     max_clear = MAX_CLEARANCE, min_volume = MIN_VOLUME):
+    """ Moves the moving parts along axis_mov and gets their clearance to
+    the static parts at each offset
+
+    Parameters:
+    -----------
+    moving_list : list of fc_clss.SinglePart or fc_clss.PartsSet
+        parts that move together, the sets are searched recursively.
+        The clearance between them is not calculated
+    static_list : list of fc_clss.SinglePart or fc_clss.PartsSet
+        parts that dont move
+    axis_mov : FreeCAD.Vector
+        direction of the movement
+    offset_list : list of float
+        positions (mm) along axis_mov, relative to the current position of
+        the moving parts, see get_offsets
+    max_clear : float
+        larger clearances are not calculated
+    min_volume : float
+        minimum volume of the common to be an interference
+
+    Returns:
+    --------
+    Dictionary:
+    {'pairs' : list of dictionaries, one for each moving and static parts
+               that are closer than max_clear at some offset, sorted by
+               clearance, the smallest first:
+               {'part_a', 'part_b' : moving and static parts,
+                'name_a', 'name_b' : their names,
+                'clearance' : minimum distance (0 if they touch or
+                              intersect),
+                'offset' : offset where it is the minimum,
+                'volume' : largest volume of the common (interference),
+                'offset_volume' : offset of the largest volume}
+     'steps' : list of dictionaries, one for each offset:
+               {'offset', 'clearance' (minimum, None if all the parts are
+                farther than max_clear), 'name_a', 'name_b'}
+     'stats' : number of parts, candidates, distances calculated, time}
+    """
+    time_0 = fcprof.clock()
+    axis_mov = FreeCAD.Vector(axis_mov)
+    axis_mov.normalize()
+    moving_shp_list = get_part_shps(moving_list)
+    static_shp_list = get_part_shps(static_list)
+    n_moving = len(moving_shp_list)
+
+    # broadphase, once: the boxes of the moving parts are swept from the
+    # first to the last offset, and enlarged by max_clear/2 as the static
+    # boxes, so the pairs closer than max_clear are candidates
+    moving_bbox_list = []
+    bbox_list = []
+    min_offset = min(offset_list)
+    max_offset = max(offset_list)
+    for _, shp in moving_shp_list:
+        bbox = shp.BoundBox
+        moving_bbox_list.append(bbox)
+        bbt_min = get_bbox_tuple(bbox, axis_mov * min_offset)
+        bbt_max = get_bbox_tuple(bbox, axis_mov * max_offset)
+        bbox_list.append(FreeCAD.BoundBox(
+                                min(bbt_min[0], bbt_max[0]),
+                                min(bbt_min[1], bbt_max[1]),
+                                min(bbt_min[2], bbt_max[2]),
+                                max(bbt_min[3], bbt_max[3]),
+                                max(bbt_min[4], bbt_max[4]),
+                                max(bbt_min[5], bbt_max[5])))
+    static_bbt_list = []
+    for _, shp in static_shp_list:
+        bbox = shp.BoundBox
+        static_bbt_list.append(get_bbox_tuple(bbox))
+        bbox_list.append(bbox)
+    # only the pairs of a moving and a static part
+    cand_list = [(ind_a, ind_b - n_moving)
+                 for ind_a, ind_b in get_bbox_pairs(bbox_list,
+                                                    tol = max_clear / 2.)
+                 if ind_a < n_moving <= ind_b]
+    time_broad = fcprof.clock()
+
+    pair_dict = {}
+    step_list = []
+    n_dist = 0
+    offset_prev = 0.
+    for offset in offset_list:
+        # the moving shapes are translated from the previous offset
+        vec_step = axis_mov * (offset - offset_prev)
+        for _, shp in moving_shp_list:
+            shp.translate(vec_step)
+        offset_prev = offset
+        vec_offset = axis_mov * offset
+        step = {'offset' : offset, 'clearance' : None,
+                'name_a' : '', 'name_b' : ''}
+        for ind_m, ind_s in cand_list:
+            # the pair may be far at this offset
+            if not bbox_tuple_near(get_bbox_tuple(moving_bbox_list[ind_m],
+                                                  vec_offset),
+                                   static_bbt_list[ind_s], max_clear):
+                continue
+            part_m, shp_m = moving_shp_list[ind_m]
+            part_s, shp_s = static_shp_list[ind_s]
+            try:
+                clearance = shp_m.distToShape(shp_s)[0]
+            except Exception:  # Part raises different exceptions
+                logger.warning('distance failed: ' + part_m.name + ' - '
+                               + part_s.name)
+                continue
+            n_dist += 1
+            if clearance > max_clear:
+                continue
+            volume = 0.
+            if clearance == 0:
+                volume = common_volume(shp_m, shp_s)
+            pair = pair_dict.get((ind_m, ind_s))
+            if pair is None:
+                pair = {'part_a' : part_m, 'part_b' : part_s,
+                        'name_a' : part_m.name, 'name_b' : part_s.name,
+                        'clearance' : clearance, 'offset' : offset,
+                        'volume' : 0., 'offset_volume' : None}
+                pair_dict[(ind_m, ind_s)] = pair
+            elif clearance < pair['clearance']:
+                pair['clearance'] = clearance
+                pair['offset'] = offset
+            if volume > min_volume and volume > pair['volume']:
+                pair['volume'] = volume
+                pair['offset_volume'] = offset
+            if step['clearance'] is None or clearance < step['clearance']:
+                step['clearance'] = clearance
+                step['name_a'] = part_m.name
+                step['name_b'] = part_s.name
+        step_list.append(step)
+
+    pair_list = sorted(pair_dict.values(),
+                       key = lambda pair: (pair['clearance'], -pair['volume']))
+    time_end = fcprof.clock()
+    sweep_stats = {'moving'     : n_moving,
+                   'static'     : len(static_shp_list),
+                   'steps'      : len(offset_list),
+                   'candidates' : len(cand_list),
+                   'distances'  : n_dist,
+                   'time_broad' : time_broad - time_0,
+                   'time_steps' : time_end - time_broad}
+    logger.debug(str(sweep_stats['candidates']) + ' candidates, '
+                 + str(sweep_stats['distances']) + ' distances in '
+                 + str(sweep_stats['steps']) + ' steps')
+    return {'pairs' : pair_list, 'steps' : step_list, 'stats' : sweep_stats}
+
+
+def print_sweep (sweep):
+    """ prints the result of sweep_clearance: the clearance at each offset
+    and the pairs of parts that are closer than max_clear
+    """
+    print ('%10s%14s  %s' % ('offset', 'clearance', 'parts'))
+    for step in sweep['steps']:
+        if step['clearance'] is None:
+            print ('%10.2f%14s' % (step['offset'], '-'))
+        else:
+            print ('%10.2f%14.3f  %s - %s' % (step['offset'],
+                                              step['clearance'],
+                                              step['name_a'], step['name_b']))
+    print ('%-32s%-32s%12s%10s%14s' % ('moving', 'static', 'clearance',
+                                       'offset', 'volume (mm3)'))
+    for pair in sweep['pairs']:
+        print ('%-32s%-32s%12.3f%10.2f%14.3f' % (pair['name_a'],
+                                                 pair['name_b'],
+                                                 pair['clearance'],
+                                                 pair['offset'],
+                                                 pair['volume']))
@@ -48,3 +48,12 @@ MLTOL = kcomp.TOL - 0.05 # reducing the tolrances, it was too tolerant :)
 # default values for exporting to STL
 LIN_DEFL = 0.1
 ANG_DEFL = 0.523599 # 30 degree
+
+# adaptive values for exporting to STL, see stlexport.get_adaptive_defl
+# maximum chord error (mm) of the mesh of the pieces to print
+CHORD_ERR = 0.02
+# the linear deflection is not larger than this fraction of the diagonal
+# of the bounding box of the piece
+REL_DEFL = 0.001
+# the angular deflection is between ANG_DEFL_MIN and ANG_DEFL
+ANG_DEFL_MIN = 0.0872665 # 5 degree
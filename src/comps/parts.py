@@ -36,6 +36,7 @@ import comps
 import kparts
 import shp_clss
 import fc_clss
+import fcprof
 
 from fcfun import V0, VX, VY, VZ, V0ROT, addBox, addCyl, addCyl_pos, fillet_len
 from fcfun import VXN, VYN, VZN
@@ -4543,6 +4544,9 @@ class ShpNemaMotorHolder (shp_clss.Obj3D):
         # calculates the position of the origin, and keeps it in attribute pos_o
         self.set_pos_o()
 
+        # steps of the construction, see fcprof.StageSteps
+        steps = fcprof.StageSteps('ShpNemaMotorHolder')
+        steps.step('base')
         # make the whole box, extra height and depth to cut all the way
         # back and down:
         shp_box = fcfun.shp_box_dir (box_w = self.tot_w,
@@ -4555,7 +4559,8 @@ class ShpNemaMotorHolder (shp_clss.Obj3D):
         shp_box = fcfun.shp_filletchamfer_dir(shp_box, self.axis_h,
                                               fillet=0,
                                               radius = chmf_r)
-        shp_box = shp_box.removeSplitter()
+        with fcprof.stage('boolean'):
+            shp_box = shp_box.removeSplitter()
 
         # chamfer of the box to make a 'triangular' reinforcement
         chmf_reinf_r = min(self.tot_d- wall_thick, self.tot_h-motorside_thick)
@@ -4564,9 +4569,11 @@ class ShpNemaMotorHolder (shp_clss.Obj3D):
                                               fc_pt =self.get_pos_dwh(5,0,4),
                                               fillet=0,
                                               radius = chmf_reinf_r)
-        shp_box = shp_box.removeSplitter()
+        with fcprof.stage('boolean'):
+            shp_box = shp_box.removeSplitter()
 
         # holes:
+        steps.step('bolt_holes')
         holes = []
         # the space for the motor
         shp_motor = fcfun.shp_box_dir (
@@ -4634,9 +4641,12 @@ class ShpNemaMotorHolder (shp_clss.Obj3D):
                                             pos = self.get_pos_dwh(0,pt_w,pt_h))
                 holes.append(shp_hole)
 
-        shp_holes = fcfun.fuseshplist(holes)
-        shp_motorholder = shp_box.cut(shp_holes)
-        shp_bracket =shp_motorholder.removeSplitter()
+        steps.step('cut')
+        with fcprof.stage('boolean'):
+            shp_holes = fcfun.fuseshplist(holes)
+            shp_motorholder = shp_box.cut(shp_holes)
+            shp_bracket =shp_motorholder.removeSplitter()
+        steps.end()
         self.shp = shp_motorholder
 
 
@@ -20,7 +20,8 @@ import Draft
 import DraftGeomUtils
 import DraftVecUtils
 import math
-#import copy;
+import copy
+import collections
 #import Mesh;
 
 # ---------------------- can be taken away after debugging
@@ -49,6 +50,140 @@ logging.basicConfig(level=logging.DEBUG,
 logger = logging.getLogger(__name__)
 
 
+# -------------------- instanced fasteners
+# The bolts, nuts and washers of the sets (Din912BoltWashSet,
+# Din934NutWashSet) are repeated many times in an assembly, usually only
+# changing their position. If INSTANCE_FASTENERS is enabled, each different
+# fastener (class and arguments, but pos and name) is built once, and the
+# next ones are FreeCAD objects with a translated copy of its shape.
+# It is disabled by default, to enable it:
+#    partset.set_instance_fasteners(1)
+
+# 1: instanced fasteners
+INSTANCE_FASTENERS = 0
+# fasteners that have been built
+# key: class, level of detail (shp_clss.LOD) and arguments (but pos and
+#      name)
+# value: dictionary with:
+#    'name': name of the first fastener
+#    'part': first fastener, the one that was built
+#    'shp': copy of the shape of the first fastener
+#    'pos_o': origin of the first fastener
+#    'placed': number of fasteners with this key (including the first one)
+fastener_registry = collections.OrderedDict()
+
+
+def set_instance_fasteners (enable = 1):
+    """ Enables or disables the instanced fasteners. In both cases the
+    registry is cleared, so the fasteners of a previous execution (in the
+    same FreeCAD session) are not used
+
+    Parameters:
+    -----------
+    enable : int
+        1: enabled
+        0: disabled
+    """
+    global INSTANCE_FASTENERS
+    INSTANCE_FASTENERS = enable
+    clear_fastener_registry()
+
+
+def clear_fastener_registry ():
+    """ discards the fasteners that have been built, the next ones will
+    be built again
+    """
+    fastener_registry.clear()
+
+
+def get_fastener_counts ():
+    """ returns a tuple with the number of unique fasteners (built) and
+    the number of fasteners placed
+    """
+    placed = sum(entry['placed'] for entry in fastener_registry.values())
+    return len(fastener_registry), placed
+
+
+def print_fastener_registry ():
+    """ prints the unique fasteners and how many of each have been placed
+    """
+    for entry in fastener_registry.values():
+        print ('%-40s%6d' % (entry['name'], entry['placed']))
+    unique, placed = get_fastener_counts()
+    print (str(unique) + ' unique fasteners, ' + str(placed) + ' placed')
+
+
+def _fastener_key_value (value):
+    """ returns a hashable value of an argument to be part of the key
+    """
+    if isinstance(value, FreeCAD.Vector):
+        return ('Vector', value.x, value.y, value.z)
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        # 3 and 3. make the same fastener
+        return float(value)
+    return value
+
+
+def make_fastener (part_class, pos = V0, name = '', **kwargs):
+    """ Creates a fastener (fc_clss.Din912Bolt, Din934Nut, Din125Washer, ...)
+    If INSTANCE_FASTENERS is enabled and a fastener of the same class and
+    arguments has already been built, it is not built again: a copy of it
+    is made with a translated copy of its shape, and its own FreeCAD object
+
+    Parameters:
+    -----------
+    part_class : class
+        class of the fastener, child of fc_clss.SinglePart
+    pos : FreeCAD.Vector
+        position of the fastener
+    name : str
+        name of the fastener, if empty, the default name of the class
+    kwargs :
+        the rest of the arguments of the class
+
+    Returns:
+    --------
+    fastener object of class part_class
+    """
+    if not INSTANCE_FASTENERS:
+        return part_class(pos = pos, name = name, **kwargs)
+    # the level of detail is also in the key, the fasteners take it from
+    # shp_clss.LOD when they are built
+    key = (part_class.__name__,
+           shp_clss.LOD,
+           tuple(sorted((arg, _fastener_key_value(value))
+                        for arg, value in kwargs.items())))
+    try:
+        entry = fastener_registry[key]
+    except KeyError:
+        part = part_class(pos = pos, name = name, **kwargs)
+        fastener_registry[key] = {'name'   : part.name,
+                                  'part'   : part,
+                                  'shp'    : part.shp.copy(),
+                                  'pos_o'  : part.pos_o,
+                                  'placed' : 1}
+        return part
+    entry['placed'] += 1
+    part = copy.copy(entry['part'])
+    # the position only changes the origin, the rest of the attributes
+    # are the same
+    part.pos = pos
+    part.set_pos_o()
+    # the translation in the geometry, not in the placement, that would be
+    # overwritten when placing the FreeCAD object (place_fcos, set_place)
+    part.shp = fcfun.shp_copy_translated(entry['shp'],
+                                         part.pos_o - entry['pos_o'])
+    part.place = V0
+    part.rel_place = V0
+    part.extra_mov = V0
+    if name:
+        part.name = name
+    part.doc = FreeCAD.ActiveDocument
+    part.create_fco(part.name)
+    return part
+
+
+
 
 class BearWashSet (fc_clss.PartsSet):
     """ A set of bearings and washers, usually to make idle pulleys
@@ -512,28 +647,29 @@ class Din912BoltWashSet (fc_clss.PartsSet):
         self.set_pos_o()
 
         # creation of the bolt, at the origin self.pos_o:
-        bolt = fc_clss.Din912Bolt(metric = metric,
-                                  shank_l = self.shank_l,
-                                  shank_out = shank_out,
-                                  head_out = head_out,
-                                  axis_h = self.axis_h,
-                                  axis_d = self.axis_d,
-                                  axis_w = self.axis_w,
-                                  pos_h = 0, pos_d = 0, pos_w = 0,
-                                  pos = self.pos_o)
+        # (built once if INSTANCE_FASTENERS, see make_fastener)
+        bolt = make_fastener(fc_clss.Din912Bolt,
+                             metric = metric,
+                             shank_l = self.shank_l,
+                             shank_out = shank_out,
+                             head_out = head_out,
+                             axis_h = self.axis_h,
+                             axis_d = self.axis_d,
+                             axis_w = self.axis_w,
+                             pos_h = 0, pos_d = 0, pos_w = 0,
+                             pos = self.pos_o)
         self.append_part(bolt)
         # creation of the washer, at the origin at pos_h = 2, and at the end
         # of the washer, could use an if
         if wide_washer == 0:
-            washer = fc_clss.Din125Washer(metric = metric,
-                                          axis_h = self.axis_h,
-                                          pos_h = -1, # base of cylinder
-                                          pos = self.get_pos_h(2))
+            washer_class = fc_clss.Din125Washer
         else:
-            washer = fc_clss.Din9021Washer(metric = metric,
-                                           axis_h = self.axis_h,
-                                           pos_h = -1, # base of cylinder
-                                           pos = self.get_pos_h(2))
+            washer_class = fc_clss.Din9021Washer
+        washer = make_fastener(washer_class,
+                               metric = metric,
+                               axis_h = self.axis_h,
+                               pos_h = -1, # base of cylinder
+                               pos = self.get_pos_h(2))
         self.append_part(washer)
         if group == 1:
             self.make_group()
@@ -701,26 +837,27 @@ class Din934NutWashSet (fc_clss.PartsSet):
         self.set_pos_o()
 
         # creation of the nut, at pos h = 1
-        nut = fc_clss.Din934Nut(metric = metric,
-                                axis_d_apo = axis_d_apo,
-                                axis_h = self.axis_h,
-                                axis_d = self.axis_d,
-                                axis_w = self.axis_w,
-                                pos_h = -1, pos_d = 0, pos_w = 0,
-                                pos = self.get_pos_h(1))
+        # (built once if INSTANCE_FASTENERS, see make_fastener)
+        nut = make_fastener(fc_clss.Din934Nut,
+                            metric = metric,
+                            axis_d_apo = axis_d_apo,
+                            axis_h = self.axis_h,
+                            axis_d = self.axis_d,
+                            axis_w = self.axis_w,
+                            pos_h = -1, pos_d = 0, pos_w = 0,
+                            pos = self.get_pos_h(1))
         self.append_part(nut)
         # creation of the washer, at the origin , and at the end
         # of the washer, could use an if
         if wide_washer == 0:
-            washer = fc_clss.Din125Washer(metric = metric,
-                                          axis_h = self.axis_h,
-                                          pos_h = -1, # base of cylinder
-                                          pos = self.pos_o)
+            washer_class = fc_clss.Din125Washer
         else:
-            washer = fc_clss.Din9021Washer(metric = metric,
-                                           axis_h = self.axis_h,
-                                           pos_h = -1, # base of cylinder
-                                           pos = self.pos_o)
+            washer_class = fc_clss.Din9021Washer
+        washer = make_fastener(washer_class,
+                               metric = metric,
+                               axis_h = self.axis_h,
+                               pos_h = -1, # base of cylinder
+                               pos = self.pos_o)
         self.append_part(washer)
         if group == 1:
             self.make_group()
@@ -824,6 +961,11 @@ class NemaMotorPulleySet (fc_clss.PartsSet):
         position in mm of the pulley along the shaft
         0:  it is at the base of the shaft
         -1: the top of the pulley will be aligned with the end of the shaft
+    pulley_fast : int
+        1: the pulley is made without 3D booleans, see comps.ShpGtPulley
+    pulley_proxy : int
+        1: the pulley is just a cylinder, when it is only a visual component
+           see comps.ShpGtPulley
 
     pos_d: int
         location of pos along the axis_d  see drawing
@@ -882,6 +1024,8 @@ class NemaMotorPulleySet (fc_clss.PartsSet):
                   pulley_base_d = 15.,
                   pulley_tol = 0,
                   pulley_pos_h = -1,
+                  pulley_fast = 0,
+                  pulley_proxy = 0,
                   # general parameters
                   axis_d = VX,
                   axis_w = None,
@@ -963,6 +1107,8 @@ class NemaMotorPulleySet (fc_clss.PartsSet):
                               pos_w = 0,
                               pos_h = 0,
                               pos = pos,
+                              fast = pulley_fast,
+                              proxy = pulley_proxy,
                               model_type = 1) # dimensional model
 
         if pulley_pos_h < 0: #top of the pulley aligned with top of the shaft
@@ -1230,6 +1376,8 @@ class NemaMotorPulleyHolderSet (fc_clss.PartsSet):
                   pulley_base_d = 15.,
                   pulley_tol = 0,
                   pulley_pos_h = -1,
+                  pulley_fast = 0,
+                  pulley_proxy = 0,
                   # holder parameters
                   hold_wall_thick = 4.,
                   hold_motorside_thick = 4.,
@@ -1298,6 +1446,8 @@ class NemaMotorPulleyHolderSet (fc_clss.PartsSet):
                   pulley_base_d = pulley_base_d,
                   pulley_tol = pulley_tol,
                   pulley_pos_h = pulley_pos_h,
+                  pulley_fast = pulley_fast,
+                  pulley_proxy = pulley_proxy,
                   # general parameters
                   axis_d = axis_d,
                   axis_w = axis_w,
@@ -1404,7 +1554,7 @@ class NemaMotorPulleyHolderSet (fc_clss.PartsSet):
         """ gets the nema holder"""
         part_list = self.get_parts()
         for part_i in part_list:
-            if isinstance(part_i, PartNemaMotorHolder):
+            if isinstance(part_i, parts.PartNemaMotorHolder):
                 return part_i
 
     def get_nema_motor_pulley(self):
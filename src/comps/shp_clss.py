@@ -34,6 +34,46 @@ from fcfun import VXN, VYN, VZN
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# 1: the classes that support it (they call set_shp_builder) calculate
+#    their dimensions and positions (d_o, w_o, h_o) when they are created,
+#    but the shape is built the first time self.shp is used
+# 0: the shape is built when the object is created
+LAZY_SHP = 0
+
+
+def set_lazy_shp (lazy = 1):
+    """ Sets the lazy mode of the shapes, see LAZY_SHP
+    """
+    global LAZY_SHP
+    LAZY_SHP = lazy
+
+
+# Level of detail of the purchased components (motors, rails, profiles,
+# pulleys, bolts, nuts, washers), that are not printed.
+# The Part classes of these components take LOD, their Shp classes have
+# the argument lod, LOD_FULL by default, since they can be used to cut
+# 0: full detail
+# 1: simplified: without holes, chamfers, sockets, teeth, ... few or
+#    no booleans
+# 2: envelope: a box (or cylinder) with the outer dimensions of the
+#    component, or a compound of them if the component is not convex (as
+#    the motors, with their shafts). To check the layout and the
+#    interferences
+LOD_FULL = 0
+LOD_SIMPLE = 1
+LOD_BOX = 2
+LOD = LOD_FULL
+
+
+def set_lod (lod = LOD_FULL):
+    """ Sets the level of detail of the purchased components, see LOD
+    """
+    global LOD
+    if lod not in (LOD_FULL, LOD_SIMPLE, LOD_BOX):
+        logger.error('level of detail not valid: ' + str(lod))
+        lod = LOD_FULL
+    LOD = lod
+
 
 class Obj3D (object):
     """ This is the the basic class, that provides reference axes and 
@@ -57,6 +97,10 @@ class Obj3D (object):
     pos_o_adjustment : FreeCAD.Vector
         if not V0 indicates that shape has not been placed at pos_o, so the FreeCAD object
         will need to be placed at pos_o_adjust
+
+    shp : TopoShape
+        the shape. If it has a shape builder (see set_shp_builder) and
+        LAZY_SHP, it is built the first time it is used
             
     """
     def __init__(self, axis_d = None, axis_w = None, axis_h = None):
@@ -92,6 +136,46 @@ class Obj3D (object):
         
         self.pos_o_adjust = V0
 
+    @property
+    def shp(self):
+        build_shp = getattr(self, '_shp_builder', None)
+        if build_shp is not None:
+            self._shp_builder = None
+            # the document is recomputed once, at the end
+            with fcfun.pure_shp():
+                build_shp()
+        try:
+            return self._shp
+        except AttributeError:
+            raise AttributeError(type(self).__name__
+                                 + ' object has no attribute shp')
+
+    @shp.setter
+    def shp(self, shp):
+        self._shp = shp
+
+    def set_shp_builder(self, build_shp):
+        """ Sets the function that builds the shape (it sets self.shp).
+        If LAZY_SHP is 0, it is called now, if not, it will be called the
+        first time self.shp is used.
+        The shape is built in pure shape mode (see fcfun.pure_shp), the
+        document is not recomputed by each shape function, only once at the end
+
+        Parameters:
+        -----------
+        build_shp : function with no arguments
+        """
+        if LAZY_SHP:
+            self._shp_builder = build_shp
+        else:
+            with fcfun.pure_shp():
+                build_shp()
+
+    def is_shp_built(self):
+        """ returns True if the shape has been built
+        """
+        return (getattr(self, '_shp_builder', None) is None
+                and hasattr(self, '_shp'))
 
 
     def vec_d(self, d):
@@ -620,6 +704,10 @@ class ShpCylHole (Obj3D):
         It can be negative, so this outer radius would be smaller
     pos : FreeCAD.Vector
         Position of the cylinder, taking into account where the center is
+    lod : int
+        level of detail, see LOD
+        LOD_FULL, LOD_SIMPLE: hollow cylinder
+        LOD_BOX: the cylinder without the hole
 
     Attributes:
     -----------
@@ -708,7 +796,8 @@ class ShpCylHole (Obj3D):
                  pos_h = 0, pos_d = 0, pos_w = 0,
                  xtr_top=0, xtr_bot=0,
                  xtr_r_out=0, xtr_r_in=0,
-                 pos = V0):
+                 pos = V0,
+                 lod = LOD_FULL):
 
 
         Obj3D.__init__(self, axis_d, axis_w, axis_h)
@@ -749,7 +838,14 @@ class ShpCylHole (Obj3D):
         # calculates the position of the origin, and keeps it in attribute pos_o
         self.set_pos_o()
 
-        shpcyl = fcfun.shp_cylholedir (r_out = r_out + xtr_r_out, #ext radius
+        if lod == LOD_BOX:
+            shpcyl = fcfun.shp_cyl (r      = r_out + xtr_r_out,
+                                    h      = h+xtr_bot+xtr_top,
+                                    normal = self.axis_h,
+                                    pos    = self.pos_o)
+        else:
+            shpcyl = fcfun.shp_cylholedir (
+                                       r_out = r_out + xtr_r_out, #ext radius
                                        r_in  = r_in + xtr_r_in, #internal radius
                                        h     = h+xtr_bot+xtr_top, # height
                                        normal= self.axis_h,       # direction
@@ -844,6 +940,10 @@ class ShpPrismHole (Obj3D):
            circle center (not at r_out + xtr_r_out)
     pos : FreeCAD.Vector
         Position of the prism, taking into account where the center is
+    lod : int
+        level of detail, see LOD
+        LOD_FULL: prism with the hole
+        LOD_SIMPLE, LOD_BOX: the prism without the hole, no boolean
 
     Attributes:
     -----------
@@ -907,7 +1007,8 @@ class ShpPrismHole (Obj3D):
                  axis_d_apo = 0,
                  axis_h = VZ, axis_d = None, axis_w = None,
                  pos_h = 0, pos_d = 0, pos_w = 0,
-                 pos = V0):
+                 pos = V0,
+                 lod = LOD_FULL):
 
 
         Obj3D.__init__(self, axis_d, axis_w, axis_h)
@@ -967,7 +1068,7 @@ class ShpPrismHole (Obj3D):
                                               fc_verx1 = self.axis_apo,
                                               centered = 0,
                                               pos=self.get_pos_h(-1))
-        if r_in > 0:
+        if r_in > 0 and lod == LOD_FULL:
             shp_cyl = fcfun.shp_cylcenxtr (r       = r_in + xtr_r_in,
                                            h       = h,
                                            normal  = self.axis_h,
@@ -1079,6 +1180,11 @@ class ShpBolt (Obj3D):
     pos : FreeCAD.Vector
         Position of the bolt, taking into account where the pos_h, pos_d, pos_w
         are
+    lod : int
+        level of detail, see LOD
+        LOD_FULL: head with socket, shank with the threaded part
+        LOD_SIMPLE: compound of the head and the shank, no booleans
+        LOD_BOX: a cylinder with the radius of the head and the total length
 
     Attributes:
     -----------
@@ -1131,7 +1237,8 @@ class ShpBolt (Obj3D):
                  head_out = 0,
                  axis_h = VZ, axis_d = None, axis_w = None,
                  pos_h = 0, pos_d = 0, pos_w = 0,
-                 pos = V0):
+                 pos = V0,
+                 lod = LOD_FULL):
 
 
         Obj3D.__init__(self, axis_d, axis_w, axis_h)
@@ -1180,6 +1287,17 @@ class ShpBolt (Obj3D):
         # calculates the position of the origin, and keeps it in attribute pos_o
         self.set_pos_o()
 
+        # no axis would be good to print, and it is not a piece to print
+        # however, this would be the best
+        self.prnt_ax = self.axis_h
+
+        if lod == LOD_BOX:
+            self.shp = fcfun.shp_cyl (r = max(head_r, shank_r),
+                                      h = self.tot_l,
+                                      normal = self.axis_h,
+                                      pos = self.pos_o)
+            return
+
         if head_type == 0: # cylindrical
             shp_head = fcfun.shp_cylcenxtr (r = head_r, h = head_l,
                                   normal = self.axis_h,
@@ -1203,6 +1321,16 @@ class ShpBolt (Obj3D):
                                   xtr_top = 0, xtr_bot = 0,
                                   pos = self.pos_o)
 
+        if lod == LOD_SIMPLE:
+            shp_shank = fcfun.shp_cylcenxtr (r = shank_r, h = shank_l,
+                                             normal = self.axis_h,
+                                             ch=0, # not centered
+                                             xtr_top = 0,
+                                             xtr_bot = 0,
+                                             pos = self.get_pos_h(3))
+            self.shp = Part.makeCompound([shp_head, shp_shank])
+            return
+
         if socket_l > 0 and socket_2ap > 0 : # there is socket
             # diameter of the socket (circumdiameter)
             self.cos30 = 0.86603
@@ -1255,9 +1383,6 @@ class ShpBolt (Obj3D):
         shp_bolt = shp_head.fuse(shp_shank)
 
         self.shp = shp_bolt
-        # no axis would be good to print, and it is not a piece to print
-        # however, this would be the best
-        self.prnt_ax = self.axis_h 
                                   
 
 #metric = 3
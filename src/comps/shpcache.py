@@ -0,0 +1,247 @@
+# ----------------------------------------------------------------------------
+# -- Cache on disk of the shapes of the parts
+# -- comps library
+# ----------------------------------------------------------------------------
+# -- (c) Felipe Machado
+# -- Area of Electronic Technology. Rey Juan Carlos University (urjc.es)
+# -- https://github.com/felipe-m/fcad-comps
+# -- October-2026
+# ----------------------------------------------------------------------------
+# --- LGPL Licence
+# ----------------------------------------------------------------------------
+
+# The shapes of the parametric parts (shp_clss.Obj3D children) are saved
+# as BREP files in a directory. The name of the file is a hash of:
+#  - the name and the source code of the class (and its parent classes)
+#  - the arguments of the constructor
+#  - CACHE_VERSION
+# So if a part is created again with the same arguments, the shape is read
+# from the file instead of doing again all the fuse/cut/removeSplitter.
+# If the class is changed, the hash is different and the shape is built again
+# If a function of fcfun used by the class changes the shapes, increment
+# CACHE_VERSION or clear the cache.
+#
+# The cache is disabled until a directory is set:
+#
+#        shpcache.set_cache_dir(filepath + '/../shpcache/')
+#
+# or with the environment variable FCAD_SHPCACHE_DIR.
+#
+# Inside the constructor of the class, after the dimensions are calculated:
+#
+#        self.shp_key = shpcache.get_key(ShpIdlerTensioner, args, values)
+#        shp = shpcache.load_shp(self.shp_key)
+#        if shp is not None:
+#            self.shp = shp
+#            return
+#        ...  building of the piece
+#        self.shp = shp09_final
+#        shpcache.save_shp(self.shp_key, self.shp)
+
+import os
+import json
+import inspect
+import hashlib
+import logging
+
+import FreeCAD
+import Part
+
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+# increment it to discard the shapes saved before
+CACHE_VERSION = 1
+
+# number of decimals of the float arguments to calculate the hash
+FLOAT_DECIMALS = 9
+
+# directory of the cache. None: cache disabled
+_cache_dir = os.environ.get('FCAD_SHPCACHE_DIR')
+
+# source code hash of each class, to avoid reading the source each time
+_class_src_hash = {}
+
+# number of shapes read from the cache (hits), not found (misses),
+# and saved
+stats = {'hits' : 0, 'misses' : 0, 'saves' : 0}
+
+
+def set_cache_dir (cache_dir):
+    """ Sets the directory of the cache. The directory is created if it
+    doesnt exist
+
+    Parameters:
+    -----------
+    cache_dir : str
+        path of the directory. None: disables the cache
+    """
+    global _cache_dir
+    if cache_dir is not None and not os.path.isdir(cache_dir):
+        try:
+            os.makedirs(cache_dir)
+        except OSError:
+            logger.error('cache directory cannot be created: ' + cache_dir)
+            cache_dir = None
+    _cache_dir = cache_dir
+
+
+def get_cache_dir ():
+    """ returns the directory of the cache, None if disabled
+    """
+    return _cache_dir
+
+
+def canon_value (value):
+    """ Returns a canonical value of an argument, that can be saved in JSON
+    and that is the same for equivalent arguments: 20 and 20.,
+    FreeCAD.Vector(0,0,0) and a different FreeCAD.Vector(0,0,0), ...
+    """
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    elif isinstance(value, (int, float)):
+        # -0. and 0. are the same
+        return round(float(value), FLOAT_DECIMALS) + 0.
+    elif isinstance(value, FreeCAD.Vector):
+        return ['Vector', canon_value(value.x), canon_value(value.y),
+                canon_value(value.z)]
+    elif isinstance(value, FreeCAD.Rotation):
+        return ['Rotation'] + [canon_value(q) for q in value.Q]
+    elif isinstance(value, dict):
+        return dict((str(key), canon_value(val))
+                    for key, val in value.items())
+    elif isinstance(value, (list, tuple)):
+        return [canon_value(val) for val in value]
+    else:
+        # the repr of other objects usually includes their address, so
+        # they are not going to be found in the cache
+        logger.debug('argument with no canonical value: ' + repr(value))
+        return repr(value)
+
+
+def get_class_src_hash (cls):
+    """ Returns the hash of the source code of the class and of its parent
+    classes
+    """
+    try:
+        return _class_src_hash[cls]
+    except KeyError:
+        pass
+    src_hash = hashlib.sha256()
+    for mro_cls in cls.__mro__:
+        if mro_cls is object:
+            continue
+        src_hash.update((mro_cls.__module__ + '.'
+                         + mro_cls.__name__).encode('utf-8'))
+        try:
+            src_hash.update(inspect.getsource(mro_cls).encode('utf-8'))
+        except (OSError, TypeError):
+            logger.warning('source of the class not found: '
+                           + mro_cls.__name__)
+    _class_src_hash[cls] = src_hash.hexdigest()
+    return _class_src_hash[cls]
+
+
+def get_key (cls, args, values):
+    """ Returns the key of the shape in the cache
+
+    Parameters:
+    -----------
+    cls : class
+        class whose constructor builds the shape
+    args : list
+        names of the arguments of the constructor, as returned by
+        inspect.getargvalues. 'self' is not taken
+    values : dict
+        local variables of the constructor, as returned by
+        inspect.getargvalues
+
+    Returns:
+    --------
+    str with the hexadecimal hash. None if the cache is disabled
+    """
+    if _cache_dir is None:
+        return None
+    arg_dict = dict((name, canon_value(values[name])) for name in args
+                    if name != 'self')
+    key_dict = {'version' : CACHE_VERSION,
+                'class'   : cls.__module__ + '.' + cls.__name__,
+                'source'  : get_class_src_hash(cls),
+                'args'    : arg_dict}
+    key_json = json.dumps(key_dict, sort_keys = True)
+    return hashlib.sha256(key_json.encode('utf-8')).hexdigest()
+
+
+def get_path (key):
+    """ returns the path of the BREP file of the key
+    """
+    return os.path.join(_cache_dir, key + '.brep')
+
+
+def load_shp (key):
+    """ Reads the shape of the key from the cache
+
+    Parameters:
+    -----------
+    key : str
+        key returned by get_key. None: the cache is disabled
+
+    Returns:
+    --------
+    TopoShape, None if it is not in the cache
+    """
+    if key is None or _cache_dir is None:
+        return None
+    path = get_path(key)
+    if not os.path.isfile(path):
+        stats['misses'] += 1
+        return None
+    shp = Part.Shape()
+    try:
+        shp.importBrep(path)
+    except Exception:  # Part raises different exceptions
+        logger.warning('shape in the cache cannot be read: ' + path)
+        stats['misses'] += 1
+        return None
+    if shp.isNull():
+        logger.warning('null shape in the cache: ' + path)
+        stats['misses'] += 1
+        return None
+    stats['hits'] += 1
+    return shp
+
+
+def save_shp (key, shp):
+    """ Saves the shape of the key in the cache. It is first written in a
+    temporal file, and then renamed, so there will not be half written
+    files
+
+    Parameters:
+    -----------
+    key : str
+        key returned by get_key. None: the cache is disabled
+    shp : TopoShape
+        shape to save
+    """
+    if key is None or _cache_dir is None:
+        return
+    path = get_path(key)
+    tmp_path = path + '.' + str(os.getpid()) + '.tmp'
+    try:
+        shp.exportBrep(tmp_path)
+        os.replace(tmp_path, path)
+        stats['saves'] += 1
+    except Exception:  # Part raises different exceptions
+        logger.warning('shape cannot be saved in the cache: ' + path)
+        if os.path.isfile(tmp_path):
+            os.remove(tmp_path)
+
+
+def clear ():
+    """ removes all the shapes of the cache
+    """
+    if _cache_dir is None:
+        return
+    for filename in os.listdir(_cache_dir):
+        if filename.endswith('.brep') or filename.endswith('.tmp'):
+            os.remove(os.path.join(_cache_dir, filename))
@@ -0,0 +1,426 @@
+# ----------------------------------------------------------------------------
+# -- Parallel export to STL of the pieces to print
+# -- comps library
+# ----------------------------------------------------------------------------
+# -- (c) Felipe Machado
+# -- Area of Electronic Technology. Rey Juan Carlos University (urjc.es)
+# -- https://github.com/felipe-m/fcad-comps
+# -- October-2026
+# ----------------------------------------------------------------------------
+# --- LGPL Licence
+# ----------------------------------------------------------------------------
+
+# SinglePart.export_stl meshes the shape in the FreeCAD process, one piece
+# after the other. Here, the shape of each piece (already in its print
+# position) is serialized as a BREP string, and the meshing and writing of
+# the STL files is done in a pool of processes:
+#
+#        manifest = stlexport.export_stl_parallel(
+#                                [filter_holder,
+#                                 tensioner.get_tensioner_holder()],
+#                                stl_path = stl_path)
+#
+# The processes are created with multiprocessing, so it is intended to be
+# run with FreeCADCmd or python, not from the FreeCAD GUI
+#
+# The STL files can also be written in binary with NumPy, from the points
+# and the triangles of the mesh (Mesh.Topology), without the Mesh writer
+# (see set_numpy_stl and write_stl_binary). The shape is meshed the same
+# way, with the linear and angular deflections:
+#
+#        stlexport.set_numpy_stl(1)
+#        stlexport.write_stl_binary(shp, 'filter_holder.stl')
+#
+# The deflections of the meshes can be the same for all the pieces
+# (kparts.LIN_DEFL and kparts.ANG_DEFL) or calculated for each piece from
+# its size and its smallest curved feature (see set_adapt_defl and
+# get_adaptive_defl)
+
+import os
+import math
+import json
+import logging
+import concurrent.futures
+
+import Part
+import MeshPart
+# NumPy is optional, it is used to write the binary STL files
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+import kparts
+import fcprof
+
+logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+# 1: the STL files are written in binary from the points and triangles of
+#    the mesh with NumPy, see write_stl_binary
+# 0: the shape is meshed with MeshPart.meshFromShape and written by Mesh
+NUMPY_STL = 0
+
+# 1: the deflections of the mesh of each piece are calculated from its size
+#    and its smallest radius, see get_adaptive_defl
+# 0: kparts.LIN_DEFL and kparts.ANG_DEFL for all the pieces
+ADAPT_DEFL = 0
+
+# record of a triangle of a binary STL file (50 bytes): normal, vertexes
+# and attribute byte count
+if numpy is not None:
+    STL_DTYPE = numpy.dtype([('normal', '<f4', (3,)),
+                             ('vertex', '<f4', (3,3)),
+                             ('attr', '<u2')])
+
+
+def set_numpy_stl (numpy_stl = 1):
+    """ Sets how the STL files are written, see NUMPY_STL.
+    If NumPy is not available, they are written by Mesh
+
+    Parameters:
+    -----------
+    numpy_stl : int
+        1: binary STL written with NumPy from the points and triangles
+        0: MeshPart and Mesh
+    """
+    global NUMPY_STL
+    if numpy_stl and numpy is None:
+        logger.warning('NumPy not available, STL files written by Mesh')
+        numpy_stl = 0
+    NUMPY_STL = numpy_stl
+
+
+def set_adapt_defl (adapt_defl = 1):
+    """ Sets how the deflections of the meshes are calculated, see
+    ADAPT_DEFL
+
+    Parameters:
+    -----------
+    adapt_defl : int
+        1: for each piece, see get_adaptive_defl
+        0: kparts.LIN_DEFL and kparts.ANG_DEFL
+    """
+    global ADAPT_DEFL
+    ADAPT_DEFL = adapt_defl
+
+
+def get_min_radius (shp):
+    """ returns the smallest radius of the curved edges (circles, ellipses)
+    and faces (cylinders, spheres, cones, tori) of a shape: bolt holes,
+    fillets, posts...
+    None if the shape has no curved edges or faces
+    """
+    min_radius = None
+    geom_list = ([edge.Curve for edge in shp.Edges]
+                 + [face.Surface for face in shp.Faces])
+    for geom in geom_list:
+        # a torus or an ellipse have MinorRadius
+        radius = getattr(geom, 'MinorRadius', None)
+        if radius is None:
+            radius = getattr(geom, 'Radius', None)
+        if radius is not None and radius > 0:
+            if min_radius is None or radius < min_radius:
+                min_radius = radius
+    return min_radius
+
+
+def get_adaptive_defl (shp, chord_err = kparts.CHORD_ERR):
+    """ Calculates the deflections of the mesh of a piece to print:
+    - the linear deflection is the chord error, but not larger than
+      kparts.REL_DEFL of the diagonal of its bounding box, for small pieces
+    - the angular deflection is the angle of the segments of the smallest
+      radius that have that chord error, between kparts.ANG_DEFL_MIN and
+      kparts.ANG_DEFL. So the small holes have enough segments, and the
+      flat faces and the large arcs are not meshed finer than needed
+
+                  chord
+              ___________     ...
+             /     :     \     : chord error
+            /      :...........:
+           /  ang  :       \   = radius * (1 - cos(ang/2))
+          /    :   :        \
+         /____:____:radius___\
+
+    Parameters:
+    -----------
+    shp : TopoShape
+        shape of the piece
+    chord_err : float
+        maximum chord error (mm)
+
+    Returns:
+    --------
+    Tuple (lin_defl, ang_defl, min_radius), the angular deflection is in
+    radians, min_radius is None if there are no curved features
+    """
+    lin_defl = min(chord_err, kparts.REL_DEFL * shp.BoundBox.DiagonalLength)
+    min_radius = get_min_radius(shp)
+    if min_radius is None or lin_defl >= min_radius:
+        ang_defl = kparts.ANG_DEFL
+    else:
+        ang_defl = 2 * math.acos(1 - lin_defl / min_radius)
+        ang_defl = max(kparts.ANG_DEFL_MIN, min(ang_defl, kparts.ANG_DEFL))
+    return lin_defl, ang_defl, min_radius
+
+
+def get_defl (shp):
+    """ returns the linear and angular deflections of the mesh of the shape
+    of a piece, depending on ADAPT_DEFL
+    """
+    if ADAPT_DEFL:
+        return get_adaptive_defl(shp)[:2]
+    return kparts.LIN_DEFL, kparts.ANG_DEFL
+
+
+def get_stl_array (shp, lin_defl = kparts.LIN_DEFL,
+                   ang_defl = kparts.ANG_DEFL):
+    """ Meshes the shape and returns the records of its triangles for
+    a binary STL file. The vertexes and the normals are calculated for all
+    the triangles at once (NumPy arrays).
+    The shape is meshed with MeshPart.meshFromShape, like when the STL
+    file is written by Mesh, so the meshes are the same. Shape.tessellate
+    is not used because it doesnt have angular deflection and it may take
+    the triangulation that the shape already has
+
+    Parameters:
+    -----------
+    shp : TopoShape
+        shape to mesh
+    lin_defl : float
+        linear deflection (tolerance) of the mesh
+    ang_defl : float
+        angular deflection of the mesh (radians)
+
+    Returns:
+    --------
+    Tuple of the NumPy array of STL_DTYPE records, and the number of points
+    of the mesh
+    """
+    mesh_shp = MeshPart.meshFromShape(shp,
+                                      LinearDeflection = lin_defl,
+                                      AngularDeflection = ang_defl)
+    pt_list, tri_list = mesh_shp.Topology
+    del mesh_shp
+    pt_arr = numpy.array([(pt.x, pt.y, pt.z) for pt in pt_list],
+                         dtype = numpy.float32).reshape(-1,3)
+    tri_arr = numpy.array(tri_list, dtype = numpy.int64).reshape(-1,3)
+    stl_arr = numpy.zeros(len(tri_arr), dtype = STL_DTYPE)
+    vtx_arr = stl_arr['vertex']
+    vtx_arr[:] = pt_arr[tri_arr]
+    # normal of each triangle, from the order of its vertexes
+    norm_arr = numpy.cross(vtx_arr[:,1] - vtx_arr[:,0],
+                           vtx_arr[:,2] - vtx_arr[:,0])
+    len_arr = numpy.linalg.norm(norm_arr, axis = 1)
+    # degenerated triangles: normal (0,0,0)
+    len_arr[len_arr == 0] = 1.
+    stl_arr['normal'] = norm_arr / len_arr[:, numpy.newaxis]
+    return stl_arr, len(pt_list)
+
+
+def write_stl_array (stl_arr, filename, name = ''):
+    """ Writes a binary STL file from the records of the triangles
+    (see get_stl_array)
+    """
+    # the header cannot start with 'solid', that is the ASCII format
+    header = ('binary STL ' + name).encode('ascii', 'replace')[:80]
+    with open(filename, 'wb') as stl_file:
+        stl_file.write(header.ljust(80, b' '))
+        stl_file.write(numpy.uint32(len(stl_arr)).astype('<u4').tobytes())
+        stl_arr.tofile(stl_file)
+
+
+def write_stl_binary (shp, filename, lin_defl = kparts.LIN_DEFL,
+                      ang_defl = kparts.ANG_DEFL, name = ''):
+    """ Writes the binary STL file of a shape, from the points and
+    triangles of its mesh, without the Mesh writer
+
+    Parameters:
+    -----------
+    shp : TopoShape
+        shape, in its print position
+    filename : str
+        name of the STL file
+    lin_defl : float
+        linear deflection (tolerance) of the mesh
+    ang_defl : float
+        angular deflection of the mesh (radians)
+    name : str
+        name of the piece, written in the header of the file
+
+    Returns:
+    --------
+    Dictionary with the size of the mesh: 'points', 'facets'
+    """
+    stl_arr, points = get_stl_array(shp, lin_defl = lin_defl,
+                                    ang_defl = ang_defl)
+    write_stl_array(stl_arr, filename, name = name)
+    return {'points' : points, 'facets' : len(stl_arr)}
+
+
+def mesh_brep (job):
+    """ Reads the shape from a BREP string, meshes it and writes the STL file
+    It is executed in the processes of the pool, so it is a module function
+
+    Parameters:
+    -----------
+    job : dict
+        'name' : name of the piece
+        'brep' : str with the BREP of the shape
+        'file' : name of the STL file
+        'lin_defl' : linear deflection of the mesh
+        'ang_defl' : angular deflection of the mesh
+        'numpy_stl' : 1: binary STL written with NumPy, see NUMPY_STL
+
+    Returns:
+    --------
+    Dictionary with the name, the file, the size of the mesh (points and
+    facets), the size of the file in bytes (size), the deflections, and
+    the time of each step (seconds): time_read, time_mesh, time_write.
+    It also has the process id: pid
+    """
+    time_0 = fcprof.clock()
+    shp = Part.Shape()
+    shp.importBrepFromString(job['brep'])
+    time_read = fcprof.clock()
+    if job.get('numpy_stl', 0):
+        stl_arr, points = get_stl_array(shp, lin_defl = job['lin_defl'],
+                                        ang_defl = job['ang_defl'])
+        facets = len(stl_arr)
+        time_mesh = fcprof.clock()
+        write_stl_array(stl_arr, job['file'], name = job['name'])
+    else:
+        mesh_shp = MeshPart.meshFromShape(shp,
+                                          LinearDeflection = job['lin_defl'],
+                                          AngularDeflection = job['ang_defl'])
+        points = mesh_shp.CountPoints
+        facets = mesh_shp.CountFacets
+        time_mesh = fcprof.clock()
+        mesh_shp.write(job['file'])
+    time_write = fcprof.clock()
+    return {'name'       : job['name'],
+            'file'       : job['file'],
+            'points'     : points,
+            'facets'     : facets,
+            'size'       : os.path.getsize(job['file']),
+            'lin_defl'   : job['lin_defl'],
+            'ang_defl'   : job['ang_defl'],
+            'time_read'  : time_read - time_0,
+            'time_mesh'  : time_mesh - time_read,
+            'time_write' : time_write - time_mesh,
+            'pid'        : os.getpid()}
+
+
+def export_stl_parallel (part_list, stl_path = '', prefix = '',
+                         processes = None,
+                         lin_defl = kparts.LIN_DEFL,
+                         ang_defl = kparts.ANG_DEFL,
+                         numpy_stl = None,
+                         adapt_defl = None,
+                         manifest_file = ''):
+    """ Exports to STL a list of pieces, meshing them in a pool of processes
+
+    Parameters:
+    -----------
+    part_list : list of fc_clss.SinglePart
+        pieces to print
+    stl_path : str
+        path to save the STL files
+    prefix : str
+        prefix of the STL files, see SinglePart.get_stl_filename
+    processes : int
+        number of processes of the pool. None: the number of CPUs
+        1: no pool, everything is done in this process
+    lin_defl, ang_defl : float
+        linear and angular deflection of the meshes
+    numpy_stl : int
+        1: binary STL written with NumPy, 0: Mesh, None: NUMPY_STL
+    adapt_defl : int
+        1: the deflections of each piece are calculated from its shape
+        (see get_adaptive_defl), lin_defl and ang_defl are not used
+        0: lin_defl and ang_defl, None: ADAPT_DEFL
+    manifest_file : str
+        if not empty, name of the JSON file to save the manifest
+
+    Returns:
+    --------
+    Dictionary (manifest):
+    {'processes' : number of processes,
+     'time'      : total time (seconds),
+     'parts'     : [ {'name', 'file', 'points', 'facets', 'size',
+                      'lin_defl', 'ang_defl', 'time_brep',
+                      'time_read', 'time_mesh', 'time_write', 'pid'} ]}
+    time_brep is the time to get the shape and serialize it (in this process)
+    """
+    time_0 = fcprof.clock()
+    if numpy_stl is None:
+        numpy_stl = NUMPY_STL
+    elif numpy_stl and numpy is None:
+        logger.warning('NumPy not available, STL files written by Mesh')
+        numpy_stl = 0
+    if adapt_defl is None:
+        adapt_defl = ADAPT_DEFL
+    job_list = []
+    time_brep_list = []
+    for part in part_list:
+        if not hasattr(part, 'get_print_shp'):
+            logger.error('not a piece to print: ' + str(part))
+            continue
+        time_brep_0 = fcprof.clock()
+        shp = part.get_print_shp()
+        if adapt_defl:
+            part_lin_defl, part_ang_defl, _ = get_adaptive_defl(shp)
+        else:
+            part_lin_defl, part_ang_defl = lin_defl, ang_defl
+        job_list.append({'name'     : part.name,
+                         'brep'     : shp.exportBrepToString(),
+                         'file'     : part.get_stl_filename(
+                                                    prefix = prefix,
+                                                    stl_path = stl_path),
+                         'lin_defl' : part_lin_defl,
+                         'ang_defl' : part_ang_defl,
+                         'numpy_stl' : numpy_stl})
+        time_brep_list.append(fcprof.clock() - time_brep_0)
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+    processes = max(1, min(processes, len(job_list)))
+    if processes == 1:
+        result_list = [mesh_brep(job) for job in job_list]
+    else:
+        try:
+            with concurrent.futures.ProcessPoolExecutor(
+                                    max_workers = processes) as executor:
+                result_list = list(executor.map(mesh_brep, job_list))
+        except (OSError, concurrent.futures.process.BrokenProcessPool):
+            logger.warning('pool of processes failed, exporting in this '
+                           'process')
+            processes = 1
+            result_list = [mesh_brep(job) for job in job_list]
+
+    for result, time_brep in zip(result_list, time_brep_list):
+        result['time_brep'] = time_brep
+        logger.debug(result['file'] + ': ' + str(result['facets'])
+                     + ' facets, ' + str(round(result['time_mesh'], 3)) + ' s')
+    manifest = {'processes' : processes,
+                'time'      : fcprof.clock() - time_0,
+                'parts'     : result_list}
+    if manifest_file:
+        with open(manifest_file, 'w') as json_file:
+            json.dump(manifest, json_file, indent = 2, sort_keys = True)
+    return manifest
+
+
+def print_manifest (manifest):
+    """ prints a table with the deflections, the size of the mesh and the
+    size of the file of each piece exported by export_stl_parallel
+    """
+    print ('%-36s%10s%10s%10s%12s' % ('piece', 'lin_defl', 'ang_defl',
+                                      'facets', 'size (kB)'))
+    for result in manifest['parts']:
+        ang_deg = math.degrees(result['ang_defl'])
+        print ('%-36s%10.4f%10.2f%10d%12.1f' % (result['name'],
+                                                result['lin_defl'],
+                                                ang_deg,
+                                                result['facets'],
+                                                result['size'] / 1024.))
@@ -94,6 +94,8 @@ import shp_clss # import my TopoShapes classes
 import fc_clss # import my freecad classes 
 import comps   # import my CAD components
 import partgroup 
+import fcprof  # timing of the construction stages
+import shpcache # cache of the shapes
 
 from fcfun import V0, VX, VY, VZ, V0ROT
 from fcfun import VXN, VYN, VZN
@@ -312,6 +314,12 @@ class ShpFilterHolder (shp_clss.Obj3D):
         9: at the top of the piece
     pos : FreeCAD.Vector
         Position of the cylinder, taking into account where the center is
+    batch_bool : int
+        1: the holes for the filter and for the bolts are cut all at once,
+           and the piece is refined (removeSplitter) only at the end.
+           Faster, the shape is the same
+        0: the holes are cut one group after the other, refining the piece
+           after each cut
 
     Attributes:
     -----------
@@ -399,7 +407,8 @@ class ShpFilterHolder (shp_clss.Obj3D):
                  pos_d = 0,
                  pos_w = 0,
                  pos_h = 0,
-                 pos = V0):
+                 pos = V0,
+                 batch_bool = 0):
         
         shp_clss.Obj3D.__init__(self, axis_d, axis_w, axis_h)
 
@@ -564,231 +573,278 @@ class ShpFilterHolder (shp_clss.Obj3D):
         # calculates the position of the origin, and keeps it in attribute pos_o
         self.set_pos_o()
 
-        # -------- building of the piece
-        # the base
-        shp_base = fcfun.shp_box_dir (box_w = self.tot_w,
-                                      box_d = self.tot_d,
-                                      box_h = base_h,
-                                      fc_axis_w = self.axis_w,
-                                      fc_axis_d = self.axis_d,
-                                      fc_axis_h = self.axis_h,
-                                      cw = 1, cd = 0, ch = 0,
-                                      pos = self.pos_o)
-
-
-        shp_base = fcfun.shp_filletchamfer_dir (shp_base, self.axis_h,
-                                                fillet = 1, radius = fillet_r)
-        shp_base = shp_base.removeSplitter()
-
-        # the holder to attach to a linear guide
-
-        shp_holder = fcfun.shp_boxdir_fillchmfplane (
-                                        box_w = self.tot_w,
-                                        box_d = hold_d,
-                                        box_h = self.hold_h,
-                                        axis_d = self.axis_d,
-                                        axis_h = self.axis_h,
-                                        cw = 1, cd = 0, ch = 0,
-                                        fillet = 1,
-                                        radius = fillet_r,
-                                        plane_fill = self.axis_d.negative(),
-                                        both_planes = 0,
-                                        edge_dir = self.axis_h,
-                                        pos = self.pos_o)
-
-        #shp_holder = fcfun.shp_box_dir (box_w = self.tot_w,
-                                        #box_d = hold_d,
-                                        #box_h = self.hold_h,
-                                        #fc_axis_w = self.axis_w,
-                                        #fc_axis_d = self.axis_d,
-                                        #fc_axis_h = self.axis_h,
-                                        #cw = 1, cd = 0, ch = 1,
-                                        #pos = self.pos_o)
-        #shp_base = fcfun.shp_filletchamfer_dir (shp_base, self.axis_h,
-                                                #fillet = 1, radius = fillet_r)
-        shp_base = shp_base.removeSplitter()
-
-        shp_l = shp_base.fuse(shp_holder)
-        shp_l = shp_l.removeSplitter()
-        # pos (6,0,2): position at the corner of the L
-        shp_l = fcfun.shp_filletchamfer_dirpt (shp_l,
-                                            fc_axis= self.axis_w,
-                                            fc_pt = self.get_pos_dwh(6,0,2),
-                                            fillet = 0, radius = fillet_r)
-        shp_l = shp_l.removeSplitter()
-        # now we have the L shape with its chamfers and fillets
-
-        # ------------------- Holes for the filter
-        # include tolerances, along nh: only half of it, along h= 1 to make
-        # the cut
-        # pos (9,0,1) position at the center of the porta, at its bottom
-        shp_filter_hole = fcfun.shp_box_dir_xtr (box_w = self.filt_hole_w,
-                                             box_d = self.filt_hole_d,
-                                             box_h = self.filt_hole_h,
-                                             fc_axis_h = self.axis_h,
-                                             fc_axis_d = self.axis_d,
-                                             cw = 1, cd = 1, ch = 0,
-                                             xtr_h = 1, xtr_nh = tol/2.,
-                                             xtr_d = tol, xtr_nd = tol,
-                                             xtr_w = tol, xtr_nw = tol,
-                                             pos = self.get_pos_dwh(9,0,1))
-        # pos (9,0,0) position at the center of the porta, at the bottom of the
-        # piece
-        # no extra on top because it will be fused with shp_filter_hole
-        shp_filter_thruhole = fcfun.shp_box_dir_xtr (box_w = self.filt_supp_w,
-                                             box_d = self.filt_supp_d,
-                                             box_h = base_h,
-                                             fc_axis_h = self.axis_h,
-                                             fc_axis_d = self.axis_d,
-                                             cw = 1, cd = 1, ch = 0,
-                                             xtr_h = 0, xtr_nh = 1,
-                                             xtr_d = tol, xtr_nd = tol,
-                                             xtr_w = tol, xtr_nw = tol,
-                                             pos = self.get_pos_dwh(9,0,0))
-        shp_fuse_filter_hole = shp_filter_hole.fuse(shp_filter_thruhole)
-        shp_l = shp_l.cut(shp_fuse_filter_hole)
-        shp_l = shp_l.removeSplitter()
-        # the L with the hole in the base is done
-
-        # ---------------- Holes for the bolts
-
-        bolt_list = []
-
-        shp_cen_bolt = fcfun.shp_bolt_dir (r_shank = self.bolt_cen_r_tol,
-                                           l_bolt = hold_d,
-                                           r_head = self.bolt_cen_head_r_tol,
-                                           l_head = self.bolt_cen_head_l_tol,
-                                           xtr_head = 1,
-                                           xtr_shank = 1,
-                                           support = 0, #not at printing directi
-                                           fc_normal = self.axis_d.negative(),
-                                           pos_n = 2,
-                                           pos = self.get_pos_dwh(0,0,3))
-        bolt_list.append (shp_cen_bolt)
-        # the rest of the bolts come in pairs:
-        for w_side in [-1,1]:
-            # the wider bolts (although can be smaller)
-            for cen_col, cen_row in zip([2,3], [4,3]):
-                boltpos = self.get_pos_dwh(0,w_side*cen_col, cen_row)
-                shp_cen_bolt = fcfun.shp_bolt_dir ( 
-                                           r_shank = self.bolt_cen_r_tol,
+        # key of the shape in the cache, calculated now, when the arguments
+        # are known
+        self.shp_key = shpcache.get_key(ShpFilterHolder, args, values)
+
+        def build_shp():
+            """ builds the shape, now or the first time it is used,
+            see shp_clss.Obj3D.set_shp_builder
+            """
+            # if it has been built before with the same arguments,
+            # take the shape from the cache
+            shp = shpcache.load_shp(self.shp_key)
+            if shp is not None:
+                self.shp = shp
+                return
+
+            # -------- building of the piece
+            # steps of the construction, see fcprof.StageSteps
+            steps = fcprof.StageSteps('ShpFilterHolder')
+            steps.step('base')
+            # the base
+            shp_base = fcfun.shp_box_dir (box_w = self.tot_w,
+                                          box_d = self.tot_d,
+                                          box_h = base_h,
+                                          fc_axis_w = self.axis_w,
+                                          fc_axis_d = self.axis_d,
+                                          fc_axis_h = self.axis_h,
+                                          cw = 1, cd = 0, ch = 0,
+                                          pos = self.pos_o)
+
+
+            shp_base = fcfun.shp_filletchamfer_dir (shp_base, self.axis_h,
+                                                    fillet = 1, radius = fillet_r)
+            with fcprof.stage('boolean'):
+                shp_base = shp_base.removeSplitter()
+
+            # the holder to attach to a linear guide
+
+            shp_holder = fcfun.shp_boxdir_fillchmfplane (
+                                            box_w = self.tot_w,
+                                            box_d = hold_d,
+                                            box_h = self.hold_h,
+                                            axis_d = self.axis_d,
+                                            axis_h = self.axis_h,
+                                            cw = 1, cd = 0, ch = 0,
+                                            fillet = 1,
+                                            radius = fillet_r,
+                                            plane_fill = self.axis_d.negative(),
+                                            both_planes = 0,
+                                            edge_dir = self.axis_h,
+                                            pos = self.pos_o)
+
+            #shp_holder = fcfun.shp_box_dir (box_w = self.tot_w,
+                                            #box_d = hold_d,
+                                            #box_h = self.hold_h,
+                                            #fc_axis_w = self.axis_w,
+                                            #fc_axis_d = self.axis_d,
+                                            #fc_axis_h = self.axis_h,
+                                            #cw = 1, cd = 0, ch = 1,
+                                            #pos = self.pos_o)
+            #shp_base = fcfun.shp_filletchamfer_dir (shp_base, self.axis_h,
+                                                    #fillet = 1, radius = fillet_r)
+            with fcprof.stage('boolean'):
+                shp_base = shp_base.removeSplitter()
+
+                shp_l = shp_base.fuse(shp_holder)
+                shp_l = shp_l.removeSplitter()
+            # pos (6,0,2): position at the corner of the L
+            shp_l = fcfun.shp_filletchamfer_dirpt (shp_l,
+                                                fc_axis= self.axis_w,
+                                                fc_pt = self.get_pos_dwh(6,0,2),
+                                                fillet = 0, radius = fillet_r)
+            with fcprof.stage('boolean'):
+                shp_l = shp_l.removeSplitter()
+            # now we have the L shape with its chamfers and fillets
+
+            # ------------------- Holes for the filter
+            steps.step('filter_pocket')
+            # include tolerances, along nh: only half of it, along h= 1 to make
+            # the cut
+            # pos (9,0,1) position at the center of the porta, at its bottom
+            shp_filter_hole = fcfun.shp_box_dir_xtr (box_w = self.filt_hole_w,
+                                                 box_d = self.filt_hole_d,
+                                                 box_h = self.filt_hole_h,
+                                                 fc_axis_h = self.axis_h,
+                                                 fc_axis_d = self.axis_d,
+                                                 cw = 1, cd = 1, ch = 0,
+                                                 xtr_h = 1, xtr_nh = tol/2.,
+                                                 xtr_d = tol, xtr_nd = tol,
+                                                 xtr_w = tol, xtr_nw = tol,
+                                                 pos = self.get_pos_dwh(9,0,1))
+            # pos (9,0,0) position at the center of the porta, at the bottom of the
+            # piece
+            # no extra on top because it will be fused with shp_filter_hole
+            shp_filter_thruhole = fcfun.shp_box_dir_xtr (box_w = self.filt_supp_w,
+                                                 box_d = self.filt_supp_d,
+                                                 box_h = base_h,
+                                                 fc_axis_h = self.axis_h,
+                                                 fc_axis_d = self.axis_d,
+                                                 cw = 1, cd = 1, ch = 0,
+                                                 xtr_h = 0, xtr_nh = 1,
+                                                 xtr_d = tol, xtr_nd = tol,
+                                                 xtr_w = tol, xtr_nw = tol,
+                                                 pos = self.get_pos_dwh(9,0,0))
+            if batch_bool == 1:
+                # the holes will be cut together with the holes for the bolts
+                cut_list = [shp_filter_hole, shp_filter_thruhole]
+            else:
+                with fcprof.stage('boolean'):
+                    shp_fuse_filter_hole = shp_filter_hole.fuse(
+                                                         shp_filter_thruhole)
+                    shp_l = shp_l.cut(shp_fuse_filter_hole)
+                    shp_l = shp_l.removeSplitter()
+                # the L with the hole in the base is done
+
+            # ---------------- Holes for the bolts
+            steps.step('bolt_holes')
+
+            bolt_list = []
+
+            shp_cen_bolt = fcfun.shp_bolt_dir (r_shank = self.bolt_cen_r_tol,
+                                               l_bolt = hold_d,
+                                               r_head = self.bolt_cen_head_r_tol,
+                                               l_head = self.bolt_cen_head_l_tol,
+                                               xtr_head = 1,
+                                               xtr_shank = 1,
+                                               support = 0, #not at printing directi
+                                               fc_normal = self.axis_d.negative(),
+                                               pos_n = 2,
+                                               pos = self.get_pos_dwh(0,0,3))
+            bolt_list.append (shp_cen_bolt)
+            # the rest of the bolts come in pairs:
+            for w_side in [-1,1]:
+                # the wider bolts (although can be smaller)
+                for cen_col, cen_row in zip([2,3], [4,3]):
+                    boltpos = self.get_pos_dwh(0,w_side*cen_col, cen_row)
+                    shp_cen_bolt = fcfun.shp_bolt_dir (
+                                               r_shank = self.bolt_cen_r_tol,
+                                               l_bolt = hold_d,
+                                               r_head = self.bolt_cen_head_r_tol,
+                                               l_head = self.bolt_cen_head_l_tol,
+                                               xtr_head = 1,
+                                               xtr_shank = 1,
+                                               support = 0, #not at printing directi
+                                               fc_normal = self.axis_d.negative(),
+                                               pos_n = 2,
+                                               pos = boltpos)
+                    bolt_list.append (shp_cen_bolt)
+                # the smaller bolts (although can be larger). Linear guide
+                # first row:
+                boltpos = self.get_pos_dwh(0,w_side*1, 3)
+                shp_lin_bolt = fcfun.shp_bolt_dir (
+                                           r_shank = self.bolt_linguide_r_tol,
                                            l_bolt = hold_d,
-                                           r_head = self.bolt_cen_head_r_tol,
-                                           l_head = self.bolt_cen_head_l_tol,
+                                           r_head = self.bolt_linguide_head_r_tol,
+                                           l_head = self.bolt_linguide_head_l_tol,
                                            xtr_head = 1,
                                            xtr_shank = 1,
                                            support = 0, #not at printing directi
                                            fc_normal = self.axis_d.negative(),
                                            pos_n = 2,
                                            pos = boltpos)
-                bolt_list.append (shp_cen_bolt)
-            # the smaller bolts (although can be larger). Linear guide
-            # first row:
-            boltpos = self.get_pos_dwh(0,w_side*1, 3)
-            shp_lin_bolt = fcfun.shp_bolt_dir ( 
-                                       r_shank = self.bolt_linguide_r_tol,
-                                       l_bolt = hold_d,
-                                       r_head = self.bolt_linguide_head_r_tol,
-                                       l_head = self.bolt_linguide_head_l_tol,
-                                       xtr_head = 1,
-                                       xtr_shank = 1,
-                                       support = 0, #not at printing directi
-                                       fc_normal = self.axis_d.negative(),
-                                       pos_n = 2,
-                                       pos = boltpos)
-            bolt_list.append (shp_lin_bolt)
-            # 3rd and 4th row. Just 2 shanks and a stadium per side
-            for linrow in [5, 6]:
-                boltpos = self.get_pos_dwh(0,w_side*1, linrow)
-                shp_lin_shank = fcfun.shp_cylcenxtr ( 
-                                       r = self.bolt_linguide_r_tol,
-                                       h = hold_d,
-                                       normal = self.axis_d,
-                                       ch = 0,
-                                       xtr_top = 0, #no need: stadium
-                                       xtr_bot = 1,
-                                       pos = boltpos)
-                bolt_list.append (shp_lin_shank)
-            # the stadium for both bolts head (they are too close)
-            stadpos = self.get_pos_dwh(6,w_side*1, 5)
-            shp_stad = fcfun.shp_stadium_dir (
-                                 length = boltrow1_4_dist - boltrow1_3_dist,
-                                 radius = self.bolt_linguide_head_r_tol,
-                                 height = self.bolt_linguide_head_l_tol,
-                                 fc_axis_h = self.axis_d.negative(),
-                                 fc_axis_l = self.axis_h,
-                                 ref_l = 2,
-                                 ref_h = 2,
-                                 xtr_h = 0, xtr_nh = 1,
-                                 pos = stadpos)
-            bolt_list.append (shp_stad)
+                bolt_list.append (shp_lin_bolt)
+                # 3rd and 4th row. Just 2 shanks and a stadium per side
+                for linrow in [5, 6]:
+                    boltpos = self.get_pos_dwh(0,w_side*1, linrow)
+                    shp_lin_shank = fcfun.shp_cylcenxtr (
+                                           r = self.bolt_linguide_r_tol,
+                                           h = hold_d,
+                                           normal = self.axis_d,
+                                           ch = 0,
+                                           xtr_top = 0, #no need: stadium
+                                           xtr_bot = 1,
+                                           pos = boltpos)
+                    bolt_list.append (shp_lin_shank)
+                # the stadium for both bolts head (they are too close)
+                stadpos = self.get_pos_dwh(6,w_side*1, 5)
+                shp_stad = fcfun.shp_stadium_dir (
+                                     length = boltrow1_4_dist - boltrow1_3_dist,
+                                     radius = self.bolt_linguide_head_r_tol,
+                                     height = self.bolt_linguide_head_l_tol,
+                                     fc_axis_h = self.axis_d.negative(),
+                                     fc_axis_l = self.axis_h,
+                                     ref_l = 2,
+                                     ref_h = 2,
+                                     xtr_h = 0, xtr_nh = 1,
+                                     pos = stadpos)
+                bolt_list.append (shp_stad)
                                  
-        shp_bolts = fcfun.fuseshplist(bolt_list)
-        shp_l = shp_l.cut(shp_bolts)
-
-        # ---------------- Belt clamps
-        # at both sides
-        clamp_list = []
-        for w_side in [-1,1]:
-            clamp_pos = self.get_pos_dwh(0, w_side*7,7)
-            if w_side == 1:
-                clamp_axis_w = self.axis_w.negative()
+            if batch_bool == 1:
+                # a single cut with all the tools, no need to fuse them before
+                cut_list.extend(bolt_list)
+                with fcprof.stage('boolean'):
+                    shp_l = shp_l.cut(cut_list)
             else:
-                clamp_axis_w = self.axis_w
-            shp_clamp = fcfun.shp_box_dir_xtr (
-                                      box_w = beltclamp_l,
-                                      box_d = self.beltclamp_blk_t,
-                                      box_h = beltclamp_h,
-                                      fc_axis_h = self.axis_h,
-                                      fc_axis_d = self.axis_d,
-                                      fc_axis_w = clamp_axis_w,
-                                      cw = 0, cd = 0, ch = 0,
-                                      xtr_nh = 1,
-                                      pos = clamp_pos)
-
-
-            # fillet the corner
-            shp_clamp = fcfun.shp_filletchamfer_dirpt (shp_clamp, self.axis_h,
-                                               fc_pt = clamp_pos,
-                                               fillet = 1, radius = fillet_r)
-            shp_clamp = shp_clamp.removeSplitter()
-            clamp_list.append (shp_clamp)
-
-            # the other clamp, with no fillet
-            clamp_pos = self.get_pos_dwh(6, w_side*7,7)
-            shp_clamp = fcfun.shp_box_dir_xtr (
-                                      box_w = beltclamp_l,
-                                      box_d = self.beltclamp_blk_t,
-                                      box_h = beltclamp_h,
-                                      fc_axis_h = self.axis_h,
-                                      fc_axis_d = self.axis_d.negative(),
-                                      fc_axis_w = clamp_axis_w,
-                                      cw = 0, cd = 0, ch = 0,
-                                      xtr_nh = 1,
-                                      pos = clamp_pos)
-            clamp_list.append (shp_clamp)
-
-            # the belt post
-            beltpost_pos = self.get_pos_dwh(2, w_side*5,7)
-            shp_beltpost = fcfun.shp_belt_dir(
-                                       center_sep = 2 * self.lr_beltpost_r,
-                                       rad1 = sm_beltpost_r,
-                                       rad2 = self.lr_beltpost_r,
-                                       height = beltclamp_h,
-                                       fc_axis_h = self.axis_h,
-                                       fc_axis_l = clamp_axis_w,
-                                       ref_l = 3,
-                                       ref_h = 2,
-                                       xtr_h = 0, xtr_nh = 1,
-                                       pos = beltpost_pos)
+                with fcprof.stage('boolean'):
+                    shp_bolts = fcfun.fuseshplist(bolt_list)
+                    shp_l = shp_l.cut(shp_bolts)
+
+            # ---------------- Belt clamps
+            # at both sides
+            steps.step('clamps')
+            clamp_list = []
+            for w_side in [-1,1]:
+                clamp_pos = self.get_pos_dwh(0, w_side*7,7)
+                if w_side == 1:
+                    clamp_axis_w = self.axis_w.negative()
+                else:
+                    clamp_axis_w = self.axis_w
+                shp_clamp = fcfun.shp_box_dir_xtr (
+                                          box_w = beltclamp_l,
+                                          box_d = self.beltclamp_blk_t,
+                                          box_h = beltclamp_h,
+                                          fc_axis_h = self.axis_h,
+                                          fc_axis_d = self.axis_d,
+                                          fc_axis_w = clamp_axis_w,
+                                          cw = 0, cd = 0, ch = 0,
+                                          xtr_nh = 1,
+                                          pos = clamp_pos)
+
+
+                # fillet the corner
+                shp_clamp = fcfun.shp_filletchamfer_dirpt (shp_clamp, self.axis_h,
+                                                   fc_pt = clamp_pos,
+                                                   fillet = 1, radius = fillet_r)
+                if batch_bool == 0:
+                    # if batch_bool, it will be refined with the whole piece
+                    with fcprof.stage('boolean'):
+                        shp_clamp = shp_clamp.removeSplitter()
+                clamp_list.append (shp_clamp)
+
+                # the other clamp, with no fillet
+                clamp_pos = self.get_pos_dwh(6, w_side*7,7)
+                shp_clamp = fcfun.shp_box_dir_xtr (
+                                          box_w = beltclamp_l,
+                                          box_d = self.beltclamp_blk_t,
+                                          box_h = beltclamp_h,
+                                          fc_axis_h = self.axis_h,
+                                          fc_axis_d = self.axis_d.negative(),
+                                          fc_axis_w = clamp_axis_w,
+                                          cw = 0, cd = 0, ch = 0,
+                                          xtr_nh = 1,
+                                          pos = clamp_pos)
+                clamp_list.append (shp_clamp)
+
+                # the belt post
+                beltpost_pos = self.get_pos_dwh(2, w_side*5,7)
+                shp_beltpost = fcfun.shp_belt_dir(
+                                           center_sep = 2 * self.lr_beltpost_r,
+                                           rad1 = sm_beltpost_r,
+                                           rad2 = self.lr_beltpost_r,
+                                           height = beltclamp_h,
+                                           fc_axis_h = self.axis_h,
+                                           fc_axis_l = clamp_axis_w,
+                                           ref_l = 3,
+                                           ref_h = 2,
+                                           xtr_h = 0, xtr_nh = 1,
+                                           pos = beltpost_pos)
             
-            clamp_list.append (shp_beltpost)
-        shp_filterholder = shp_l.multiFuse(clamp_list)
-        shp_filterholder = shp_filterholder.removeSplitter()
-        #Part.show (shp_filterholder)
+                clamp_list.append (shp_beltpost)
+            # union of the clamps and refine of the whole piece
+            steps.step('refine')
+            with fcprof.stage('boolean'):
+                shp_filterholder = shp_l.multiFuse(clamp_list)
+                shp_filterholder = shp_filterholder.removeSplitter()
+            steps.end()
+            #Part.show (shp_filterholder)
             
         
-        self.shp = shp_filterholder
+            self.shp = shp_filterholder
+            shpcache.save_shp(self.shp_key, self.shp)
+
+        self.set_shp_builder(build_shp)
 
 
 #shp = ShpFilterHolder(
@@ -877,6 +933,7 @@ class PartFilterHolder (fc_clss.SinglePart, ShpFilterHolder):
                  pos_w = 0,
                  pos_h = 0,
                  pos = V0,
+                 batch_bool = 0,
                  model_type = 0, # exact
                  name = ''):
 
@@ -917,7 +974,8 @@ class PartFilterHolder (fc_clss.SinglePart, ShpFilterHolder):
                  pos_d = pos_d,
                  pos_w = pos_w,
                  pos_h = pos_h,
-                 pos = pos)
+                 pos = pos,
+                 batch_bool = batch_bool)
 
 
         # Then the Part
@@ -118,6 +118,43 @@ fcad_path = filepath + '/../freecad/'
 
 # path to save the STL files
 stl_path = filepath + '/../stl/'
+# 1: the STL files of the pieces to print are meshed in parallel processes
+# 0: they are exported one after the other
+parallel_stl = 1
+# 1: the STL files are binary, written with NumPy from the points and
+#    triangles of the meshes, without the Mesh writer, see
+#    stlexport.NUMPY_STL
+# 0: they are written by Mesh
+numpy_stl = 0
+# 1: the deflections of the mesh of each piece are calculated from its size
+#    and its smallest radius, see stlexport.get_adaptive_defl
+# 0: kparts.LIN_DEFL and kparts.ANG_DEFL
+adapt_defl = 0
+# 1: the pieces to print are also saved in one 3MF file, see export3mf
+file_3mf = 0
+# 1: the assembly is saved in a GLB file, to be seen outside FreeCAD,
+#    see exportglb
+glb_file = 0
+# path of the GLB file
+glb_path = filepath + '/../freecad/'
+# 1: each different bolt, nut and washer is built once, the rest are copies
+#    placed at their positions, see partset.make_fastener
+# 0: all of them are built
+instance_fasteners = 1
+# level of detail of the purchased components: motors, rails, profiles,
+# pulleys, bolts, nuts and washers, see shp_clss.LOD
+# 0: full detail, 1: simplified, 2: envelope (box), for layout checks
+lod = 0
+# 1: the parts of the assembly that intersect each other are printed
+check_interf = 0
+# 1: the filter holder is moved along all its travel (mov_distance) and the
+#    clearance to the static parts is printed at each step
+check_travel = 0
+# number of steps of the travel
+travel_steps = 12
+
+# path of the cache of the shapes (BREP files). None: no cache
+shpcache_path = filepath + '/../shpcache/'
 
 import kcomp   # import material constants and other constants
 import fcfun   # import my functions for freecad. FreeCad Functions
@@ -130,6 +167,11 @@ import partgroup
 import parts
 import partset
 import beltcl
+import shpcache # cache of the shapes
+import stlexport # parallel export to STL
+import export3mf # export to a 3MF file
+import exportglb # export to a GLB file
+import interference # interferences between the parts
 
 from fcfun import V0, VX, VY, VZ, V0ROT
 from fcfun import VXN, VYN, VZN
@@ -137,9 +179,18 @@ from fcfun import VXN, VYN, VZN
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+# the parts that have already been built with the same arguments are
+# taken from the cache
+shpcache.set_cache_dir(shpcache_path)
 
 doc = FreeCAD.newDocument()
 
+# the shape functions dont recompute the document each time, it is
+# recomputed once at the end
+fcfun.set_recompute_shp(0)
+partset.set_instance_fasteners(instance_fasteners)
+shp_clss.set_lod(lod)
+
 # definition of the axes
 #axis_mov   = VX # the filter will move along axis X
 #axis_front = VYN
@@ -219,8 +270,6 @@ filter_holder = filter_holder_clss.PartFilterHolder(
                  name = 'filter_holder')
 
 filter_holder.set_color(fcfun.YELLOW_05)
-
-filter_holder.export_stl(stl_path=stl_path)
  
 
 
@@ -239,20 +288,25 @@ partLinGuideBlock = comps.PartLinGuideBlock (
 # 4 bolts to attach the filter holder to the linear guide
 # the bolt head has to be touching the hole for the bolt: pos_d = 5
 bolt_head_pos = filter_holder.get_o_to_d(5)
+filter_bolt_list = []
 for w_i in [-2, 2]:
     for d_i in [-1, 1]:
         # positions of the bolts at the linear guide
         filter_bolt_pos_i = (  partLinGuideBlock.get_pos_dwh(d_i, w_i, 3)
                              + bolt_head_pos)
-        fc_clss.Din912Bolt(metric = bolt_linguide_mtr,
-                           shank_l = (  bolt_head_pos.Length
-                                      + partLinGuideBlock.bolt_l),
-                           shank_l_adjust = -1, # shorter to shank_l
-                           axis_h = axis_front.negative(),
-                           pos_h = 3,
-                           pos = filter_bolt_pos_i,
-                           name = 'filter_bolt_w' + str(w_i) + '_d' + str(d_i)
-                           )
+        filter_bolt = partset.make_fastener(
+                              fc_clss.Din912Bolt,
+                              metric = bolt_linguide_mtr,
+                              shank_l = (  bolt_head_pos.Length
+                                         + partLinGuideBlock.bolt_l),
+                              shank_l_adjust = -1, # shorter to shank_l
+                              axis_h = axis_front.negative(),
+                              pos_h = 3,
+                              pos = filter_bolt_pos_i,
+                              name = ('filter_bolt_w' + str(w_i)
+                                      + '_d' + str(d_i))
+                              )
+        filter_bolt_list.append(filter_bolt)
 
           
  
@@ -401,6 +455,7 @@ aluprof_tens = comps.PartAluProf(depth = aluprof_tens_l,
 max_tens_bolt_l = (aluprof_tens.get_h_ab(3,1).Length # space for bolt in profile
                 + tensioner.get_tensioner_holder().hold_bas_h) # base thickness
 print ('shank_l ' + str(max_tens_bolt_l))
+tens_bolt_list = []
 for w_i in [-3, 3]: # position of bolts
     tens_bolt_i_pos = tensioner.get_pos_dwh(2,w_i,1)
     tens_bolt_i = partset.Din912BoltWashSet(
@@ -413,6 +468,7 @@ for w_i in [-3, 3]: # position of bolts
                                          pos_d   = 0,
                                          pos_w   = 0,
                                          pos     = tens_bolt_i_pos)
+    tens_bolt_list.append(tens_bolt_i)
 
 
 # set with:
@@ -446,6 +502,7 @@ nemaholder_w_motor = partset.NemaMotorPulleyHolderSet(
                         pulley_base_d = 15.,
                         #pulley_tol = 0,
                         pulley_pos_h = 5.,                        
+                        pulley_fast = 1, # no booleans, same shape
                         hold_wall_thick = 4.,
                         hold_motorside_thick = 3.,
                         hold_reinf_thick = 3.,
@@ -535,11 +592,12 @@ for w_i in [-1, 1]:
                         + aluprof_motor.get_w_pos_w(-2) # axis_mov
                         + aluprof_motor.get_h_pos_h(0)) #axis_up
 
-    nut_mothold = fc_clss.Din934Nut(metric= hold_bolt_wall_d,
-                                  axis_h = axis_mov,
-                                  axis_d = axis_up,
-                                  pos_h = -1,
-                                  pos = nut_mothold_pos)
+    nut_mothold = partset.make_fastener(fc_clss.Din934Nut,
+                                        metric= hold_bolt_wall_d,
+                                        axis_h = axis_mov,
+                                        axis_d = axis_up,
+                                        pos_h = -1,
+                                        pos = nut_mothold_pos)
     bolt_mothold_list.append(nut_mothold)
 
 
@@ -620,4 +678,63 @@ belt.set_color(fcfun.GRAY_08)
 
 
 
-doc.recompute()
+# recomputes the document (once) if the shape functions left it pending
+fcfun.set_recompute_shp(1)
+if instance_fasteners == 1:
+    partset.print_fastener_registry()
+
+if check_interf == 1:
+    assembly_list = ([filter_holder, partLinGuideBlock, partLinGuideRail,
+                      tensioner, aluprof_tens, nemaholder_w_motor,
+                      aluprof_motor, aluprof_linguide]
+                     + filter_bolt_list + tens_bolt_list + bolt_motor_list
+                     + bolt_mothold_list)
+    interference.print_interferences(
+                      interference.find_interferences(assembly_list,
+                                                      processes = None))
+
+if check_travel == 1:
+    # the filter holder and the block of the linear guide move together.
+    # The rail is not included because the block slides on it, and the belt
+    # because it moves with the filter holder
+    moving_list = [filter_holder, partLinGuideBlock] + filter_bolt_list
+    static_list = [tensioner, nemaholder_w_motor,
+                   aluprof_tens, aluprof_motor, aluprof_linguide]
+    # the offsets are relative to the current position (filter_mov)
+    cur_mov = filter_mov.dot(axis_mov)
+    travel_offset_list = interference.get_offsets(
+                                          - mov_distance/2. - cur_mov,
+                                            mov_distance/2. - cur_mov,
+                                          travel_steps)
+    interference.print_sweep(
+                 interference.sweep_clearance(moving_list, static_list,
+                                              axis_mov = axis_mov,
+                                              offset_list = travel_offset_list))
+
+# ------ export to STL the pieces to print
+print_part_list = [filter_holder,
+                   tensioner.get_tensioner_holder(),
+                   tensioner.get_idler_tensioner().get_idler_tensioner(),
+                   nemaholder_w_motor.get_nema_holder()]
+stlexport.set_numpy_stl(numpy_stl)
+stlexport.set_adapt_defl(adapt_defl)
+if parallel_stl == 1:
+    stlexport.print_manifest(
+              stlexport.export_stl_parallel(
+                                  print_part_list,
+                                  stl_path = stl_path,
+                                  manifest_file = stl_path + 'manifest.json'))
+else:
+    for print_part in print_part_list:
+        print_part.export_stl(stl_path = stl_path)
+if file_3mf == 1:
+    export3mf.export_3mf(print_part_list,
+                         filename = stl_path + 'filter_stage.3mf')
+
+if glb_file == 1:
+    exportglb.export_glb([filter_holder, partLinGuideBlock, partLinGuideRail,
+                          tensioner, aluprof_tens, nemaholder_w_motor,
+                          aluprof_motor, aluprof_linguide, belt]
+                         + filter_bolt_list + tens_bolt_list
+                         + bolt_motor_list + bolt_mothold_list,
+                         filename = glb_path + 'filter_stage.glb')
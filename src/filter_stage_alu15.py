@@ -116,6 +116,15 @@ fcad_path = filepath + '/../freecad/'
 
 # path to save the STL files
 stl_path = filepath + '/../stl/'
+# level of detail of the purchased components: motors, rails, profiles,
+# pulleys, bolts, nuts and washers, see shp_clss.LOD
+# 0: full detail, 1: simplified, 2: envelope (box), for layout checks
+lod = 0
+# 1: the assembly is saved in a GLB file, to be seen outside FreeCAD,
+#    see exportglb
+glb_file = 0
+# path of the GLB file
+glb_path = filepath + '/../freecad/'
 
 import kcomp   # import material constants and other constants
 import fcfun   # import my functions for freecad. FreeCad Functions
@@ -128,6 +137,7 @@ import partgroup
 import parts
 import partset
 import beltcl
+import exportglb # export to a GLB file
 
 from fcfun import V0, VX, VY, VZ, V0ROT
 from fcfun import VXN, VYN, VZN
@@ -138,6 +148,8 @@ logger = logging.getLogger(__name__)
 
 doc = FreeCAD.newDocument()
 
+shp_clss.set_lod(lod)
+
 # definition of the axes
 #axis_mov   = VX # the filter will move along axis X
 #axis_front = VYN
@@ -513,3 +525,9 @@ belt.set_color(fcfun.YELLOW_095)
 
 
 doc.recompute()
+
+if glb_file == 1:
+    exportglb.export_glb([filter_holder, partLinGuideBlock, partLinGuideRail,
+                          tensioner, aluprof_tens, nemaholder_w_motor,
+                          aluprof_motor, aluprof_linguide, belt],
+                         filename = glb_path + 'filter_stage_alu15.glb')
@@ -0,0 +1,709 @@
+# ----------------------------------------------------------------------------
+# -- Benchmark of the generation of the parts of the filter stage
+# ----------------------------------------------------------------------------
+# -- (c) Felipe Machado
+# -- Area of Electronic Technology. Rey Juan Carlos University (urjc.es)
+# -- https://github.com/felipe-m/freecad_filter_stage
+# -- October-2026
+# ----------------------------------------------------------------------------
+# --- LGPL Licence
+# ----------------------------------------------------------------------------
+#
+# Builds each part of the filter stage a number of times and measures
+# separately (in seconds):
+#  - shape: construction of the part (the class constructor)
+#  - boolean: time of the boolean operations inside the constructor
+#             (stages 'boolean' marked with fcprof.stage)
+#  - mesh: MeshPart.meshFromShape of the printable shapes, with the default
+#          deflections of kparts
+#  - total: shape + mesh
+# For each stage the median and the 95th percentile are reported, and also
+# the size of the mesh. The results can be saved in a JSON file.
+#
+# The results can be saved as a baseline, and later results can be compared
+# with it. The comparison fails (exit code 1) if the median of a stage of
+# any part is slower than the baseline more than a threshold (30% by
+# default), or if the size of the mesh (points or facets) has changed:
+#   python3 part_bench.py --save-baseline
+#   python3 part_bench.py --compare --threshold 0.3
+#
+# It doesnt need the GUI. Execute it from this directory (src), either
+# with FreeCAD command line:
+#   FreeCADCmd part_bench.py
+# or with python, having the FreeCAD lib directory in the PYTHONPATH:
+#   python3 part_bench.py --runs 10 --output bench.json
+#   python3 part_bench.py --parts filter_holder tensioner_set
+#
+# To compare the boolean strategies of the parts (see batch_bool):
+#   python3 part_bench.py --save-baseline
+#   python3 part_bench.py --batch-bool --compare
+#
+# To know which functions of fcfun and which constructors are taking the
+# time (see fcprof.collect_funcs), it saves prof.json and prof.folded
+# (for flamegraph.pl):
+#   python3 part_bench.py --parts tensioner_holder --profile prof
+#
+# To see the steps of the construction of the parts in a timeline
+# (chrome://tracing or https://ui.perfetto.dev), see fcprof.StageSteps:
+#   python3 part_bench.py --runs 1 --trace trace.json
+
+import os
+import sys
+import json
+import math
+import platform
+import argparse
+import statistics
+import contextlib
+import logging
+from datetime import datetime
+
+import FreeCAD
+import MeshPart
+
+# to get the current directory. Freecad has to be executed from the same
+# directory this file is
+filepath = os.getcwd()
+# to get the components
+sys.path.append(filepath)
+sys.path.append(filepath + '/' + 'comps')
+
+# path to save the benchmark baseline
+bench_path = filepath + '/../bench/'
+BASELINE_FILE = bench_path + 'part_bench_baseline.json'
+
+import kcomp   # import material constants and other constants
+import kparts  # default values for exporting to STL
+import fcprof  # timing of the construction stages
+import fcfun   # memoization of the primitive shapes
+import shpcache # cache of the shapes, disabled in the benchmark
+
+from fcfun import V0, VX, VY, VZ
+from fcfun import VXN, VYN, VZN
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# stages that are measured for each part
+STAGE_LIST = ['shape', 'boolean', 'mesh', 'total']
+
+# default relative slowdown of the median to be a regression: 30%
+SLOW_THRESHOLD = 0.3
+# default relative change of the mesh size to be a regression: any change
+MESH_THRESHOLD = 0.
+# stages faster than this (seconds) in the baseline and in the result
+# are not compared, they are just noise
+MIN_STAGE_TIME = 0.005
+
+
+# ---------- arguments of the parts, the same as in filter_stage.py
+
+def args_filter_holder():
+    return dict(filter_l = 60.,
+                filter_w = 25.,
+                filter_t = 2.5,
+                base_h = 6.,
+                hold_d = 12.,
+                filt_supp_in = 2.,
+                filt_rim = 3.,
+                filt_cen_d = 30,
+                fillet_r = 1.,
+                boltcol1_dist = 20/2.,
+                boltcol2_dist = 12.5,
+                boltcol3_dist = 25,
+                boltrow1_h = 0,
+                boltrow1_2_dist = 12.5,
+                boltrow1_3_dist = 20.,
+                boltrow1_4_dist = 25.,
+                bolt_cen_mtr = 4,
+                bolt_linguide_mtr = kcomp.SEB15A['block']['boltd'],
+                beltclamp_t = 3.,
+                beltclamp_l = 12.,
+                beltclamp_h = 8.,
+                clamp_post_dist = 4.,
+                sm_beltpost_r = 1.,
+                tol = kcomp.TOL,
+                axis_d = VX,
+                axis_w = VY,
+                axis_h = VZ,
+                pos_d = 9,
+                pos_w = 0,
+                pos_h = 1,
+                pos = V0)
+
+def args_idler_tensioner():
+    # idler pulley of partset.BearWashSet for M3 bolts:
+    # bearing 603, large washer DIN9021 M4 and regular washer DIN125 M3
+    lwash_dict = kcomp.D9021[4]
+    rwash_dict = kcomp.D125[3]
+    bear_dict = kcomp.BEARING[603]
+    return dict(idler_h = 2 * (lwash_dict['t'] + rwash_dict['t'])
+                          + bear_dict['t'],
+                idler_r_in = bear_dict['do']/2.,
+                idler_r_ext = lwash_dict['do']/2.,
+                in_fillet = 2.,
+                wall_thick = 3.,
+                tens_stroke = 15.,
+                pulley_stroke_dist = 0,
+                nut_holder_thick = 4.,
+                boltidler_mtr = 3,
+                bolttens_mtr = 3,
+                opt_tens_chmf = 1,
+                tol = kcomp.TOL,
+                axis_d = VYN,
+                axis_w = VXN,
+                axis_h = VZ,
+                pos_d = 0,
+                pos_w = 0,
+                pos_h = 0,
+                pos = V0)
+
+def args_tensioner_holder():
+    import tensioner_clss
+    import shp_clss
+    # the holder takes the dimensions of the idler tensioner, its shape
+    # is not needed
+    lazy_shp = shp_clss.LAZY_SHP
+    shp_clss.set_lazy_shp(1)
+    idler_tens = tensioner_clss.ShpIdlerTensioner(**args_idler_tensioner())
+    shp_clss.set_lazy_shp(lazy_shp)
+    return dict(aluprof_w = 20.,
+                belt_pos_h = 20.,
+                tens_h = idler_tens.tens_h,
+                tens_w = idler_tens.tens_w,
+                tens_d_inside = idler_tens.tens_d_inside,
+                wall_thick = 3.,
+                in_fillet = 2.,
+                boltaluprof_mtr = 4,
+                bolttens_mtr = 3,
+                hold_bas_h = 0,
+                opt_tens_chmf = 1,
+                hold_hole_2sides = 1,
+                min_width = 0,
+                tol = kcomp.TOL,
+                axis_d = VYN,
+                axis_w = VXN,
+                axis_h = VZ,
+                pos_d = 0,
+                pos_w = 0,
+                pos_h = 0,
+                pos = V0)
+
+def args_nema_motor_holder():
+    return dict(nema_size = 11,
+                wall_thick = 4.,
+                motorside_thick = 3.,
+                reinf_thick = 3.,
+                motor_min_h = 3.,
+                motor_max_h = 20.,
+                rail = 1,
+                motor_xtr_space = 2.,
+                bolt_wall_d = 3,
+                bolt_wall_sep = 0,
+                chmf_r = 1.,
+                axis_h = VZN,
+                axis_d = VYN,
+                axis_w = VX,
+                pos_h = 0,
+                pos_d = 0,
+                pos_w = 0,
+                pos = V0)
+
+def args_tensioner_set():
+    return dict(aluprof_w = 20.,
+                belt_pos_h = 20.,
+                hold_bas_h = 0,
+                hold_hole_2sides = 1,
+                boltidler_mtr = 3,
+                bolttens_mtr = 3,
+                boltaluprof_mtr = 4,
+                tens_stroke = 15.,
+                wall_thick = 3.,
+                in_fillet = 2.,
+                pulley_stroke_dist = 0,
+                nut_holder_thick = 4.,
+                opt_tens_chmf = 1,
+                min_width = 0,
+                tol = kcomp.TOL,
+                axis_d = VYN,
+                axis_w = VXN,
+                axis_h = VZ,
+                pos_d = 0,
+                pos_w = 0,
+                pos_h = 0,
+                pos = V0,
+                name = 'tensioner_set')
+
+
+def get_part_dict():
+    """ returns a dictionary with the parts that can be benchmarked
+    key: name of the part
+    value: tuple (class, function that returns the arguments of the class,
+                  function that returns the list of the shapes to mesh)
+
+    The modules are imported here because filter_holder_clss creates a part
+    when it is imported, so it needs an active document
+    """
+    if FreeCAD.ActiveDocument is None:
+        FreeCAD.newDocument()
+    import filter_holder_clss
+    import tensioner_clss
+    import parts
+
+    def shapes_set (tens_set):
+        return [tens_set.get_tensioner_holder().shp,
+                tens_set.get_idler_tensioner().get_idler_tensioner().shp]
+
+    part_dict = {
+        'filter_holder'     : (filter_holder_clss.ShpFilterHolder,
+                               args_filter_holder,
+                               lambda part: [part.shp]),
+        'idler_tensioner'   : (tensioner_clss.ShpIdlerTensioner,
+                               args_idler_tensioner,
+                               lambda part: [part.shp]),
+        'tensioner_holder'  : (tensioner_clss.ShpTensionerHolder,
+                               args_tensioner_holder,
+                               lambda part: [part.shp]),
+        'nema_motor_holder' : (parts.ShpNemaMotorHolder,
+                               args_nema_motor_holder,
+                               lambda part: [part.shp]),
+        'tensioner_set'     : (tensioner_clss.TensionerSet,
+                               args_tensioner_set,
+                               shapes_set),
+        }
+    return part_dict
+
+# the parts in the order they are benchmarked
+PART_LIST = ['filter_holder', 'idler_tensioner', 'tensioner_holder',
+             'nema_motor_holder', 'tensioner_set']
+
+# the parts that have the argument batch_bool (boolean strategy)
+BATCH_BOOL_PARTS = ['filter_holder', 'idler_tensioner', 'tensioner_holder',
+                    'tensioner_set']
+
+
+# prefixes of the functions of fcfun that are profiled
+PROF_FCFUN_PREFIXES = ['shp_', 'wire_', 'fuseshplist']
+
+
+def instrument_parts ():
+    """ instruments the functions of fcfun that build shapes and the
+    constructors of the Obj3D and SinglePart children, to be profiled
+    with fcprof.collect_funcs
+
+    Returns:
+    --------
+    Number of functions and constructors instrumented
+    """
+    get_part_dict() # to import the modules of the parts
+    import shp_clss
+    import fc_clss
+    import parts
+    import filter_holder_clss
+    import tensioner_clss
+
+    func_num = fcprof.instrument_funcs(fcfun,
+                                       prefix_list = PROF_FCFUN_PREFIXES)
+    for module in [shp_clss, fc_clss, parts, filter_holder_clss,
+                   tensioner_clss]:
+        func_num += fcprof.instrument_classes(module,
+                                              [shp_clss.Obj3D,
+                                               fc_clss.SinglePart])
+    return func_num
+
+
+def percentile (samples, perc):
+    """ returns the percentile perc (0 to 100) of a list of numbers,
+    using the nearest rank
+    """
+    sorted_samples = sorted(samples)
+    rank = int(math.ceil(perc / 100. * len(sorted_samples)))
+    return sorted_samples[max(rank, 1) - 1]
+
+def get_stats (samples):
+    """ returns a dictionary with the statistics of a list of times
+    """
+    return {'median' : statistics.median(samples),
+            'p95'    : percentile(samples, 95),
+            'min'    : min(samples),
+            'max'    : max(samples),
+            'samples': samples}
+
+
+@contextlib.contextmanager
+def bench_caches (memo = 0):
+    """ Context manager to measure the construction of the shapes: inside
+    it the cache of the shapes (shpcache) is disabled, otherwise after the
+    first run the shapes would be read from the BREP files. The primitive
+    shapes of fcfun are memoized only if memo is 1.
+    When it exits, the cache and the memoization are restored
+
+    Parameters:
+    -----------
+    memo : int
+        1: memoize the primitive shapes, see fcfun.set_memo_shp
+    """
+    cache_dir = shpcache.get_cache_dir()
+    memo_shp = fcfun.MEMO_SHP
+    memo_shp_max = fcfun.MEMO_SHP_MAX
+    shpcache.set_cache_dir(None)
+    fcfun.set_memo_shp(memo)
+    try:
+        yield
+    finally:
+        shpcache.set_cache_dir(cache_dir)
+        fcfun.set_memo_shp(memo_shp, max_size = memo_shp_max)
+
+
+def bench_run (part_class, part_args, get_shapes):
+    """ builds the part once, in a new document, and meshes its shapes
+
+    Returns:
+    --------
+    Tuple with a dictionary of the time of each stage in seconds,
+    and a dictionary with the size of the mesh
+    """
+    doc = FreeCAD.newDocument()
+    with fcprof.collect_stages() as stage_times:
+        time_0 = fcprof.clock()
+        part = part_class(**part_args)
+        time_shape = fcprof.clock()
+        mesh_size = {'points' : 0, 'facets' : 0}
+        for shp in get_shapes(part):
+            mesh_shp = MeshPart.meshFromShape(
+                                       shp,
+                                       LinearDeflection=kparts.LIN_DEFL,
+                                       AngularDeflection=kparts.ANG_DEFL)
+            mesh_size['points'] += mesh_shp.CountPoints
+            mesh_size['facets'] += mesh_shp.CountFacets
+            del mesh_shp
+        time_mesh = fcprof.clock()
+    FreeCAD.closeDocument(doc.Name)
+    run_times = {'shape'   : time_shape - time_0,
+                 'boolean' : stage_times.get_time('boolean'),
+                 'mesh'    : time_mesh - time_shape,
+                 'total'   : time_mesh - time_0}
+    return run_times, mesh_size
+
+
+def bench_part (name, runs = 5, warmup = 1, batch_bool = 0):
+    """ benchmarks the part name
+
+    Parameters:
+    -----------
+    name : str
+        name of the part, one of PART_LIST
+    runs : int
+        number of times the part is built and meshed
+    warmup : int
+        number of runs that are done before, and are not measured
+    batch_bool : int
+        boolean strategy of the parts of BATCH_BOOL_PARTS
+        1: all the holes are cut at once, 0: step by step
+
+    Returns:
+    --------
+    Dictionary with the statistics of each stage and the mesh size
+    """
+    part_class, get_args, get_shapes = get_part_dict()[name]
+    part_args = get_args()
+    if name in BATCH_BOOL_PARTS:
+        part_args['batch_bool'] = batch_bool
+    for run_i in range(warmup):
+        bench_run(part_class, part_args, get_shapes)
+    stage_samples = dict((stage, []) for stage in STAGE_LIST)
+    for run_i in range(runs):
+        run_times, mesh_size = bench_run(part_class, part_args, get_shapes)
+        for stage in STAGE_LIST:
+            stage_samples[stage].append(run_times[stage])
+    part_result = {'runs'  : runs,
+                   'stages': {},
+                   'mesh'  : mesh_size}
+    for stage in STAGE_LIST:
+        part_result['stages'][stage] = get_stats(stage_samples[stage])
+    return part_result
+
+
+def bench_parts (part_list = None, runs = 5, warmup = 1, batch_bool = 0,
+                 memo = 0):
+    """ benchmarks a list of parts
+
+    Parameters:
+    -----------
+    part_list : list of str
+        names of the parts, if None, all the parts of PART_LIST
+    runs : int
+        number of times each part is built and meshed
+    warmup : int
+        number of runs that are done before, and are not measured
+    batch_bool : int
+        boolean strategy of the parts, see bench_part
+    memo : int
+        1: memoize the primitive shapes of fcfun. The cache of the shapes
+        is always disabled, see bench_caches
+
+    Returns:
+    --------
+    Dictionary that can be saved as JSON:
+    {'meta'  : {information of the benchmark},
+     'parts' : {name : {'runs'  : int,
+                        'stages': {stage : {'median', 'p95', 'min', 'max',
+                                            'samples'}},
+                        'mesh'  : {'points', 'facets'}}}}
+    """
+    if not part_list:
+        part_list = PART_LIST
+    result = {'meta' : {'date'     : datetime.now().isoformat(),
+                        'freecad'  : '.'.join(FreeCAD.Version()[:3]),
+                        'python'   : platform.python_version(),
+                        'platform' : platform.platform(),
+                        'runs'     : runs,
+                        'warmup'   : warmup,
+                        'lin_defl' : kparts.LIN_DEFL,
+                        'ang_defl' : kparts.ANG_DEFL,
+                        'memo_shp' : memo,
+                        'numpy' : int(fcfun.numpy is not None),
+                        'batch_bool' : batch_bool},
+              'parts' : {}}
+    with bench_caches(memo):
+        for name in part_list:
+            logger.info('benchmarking: ' + name)
+            result['parts'][name] = bench_part(name, runs = runs,
+                                               warmup = warmup,
+                                               batch_bool = batch_bool)
+        if memo:
+            result['meta']['memo_stats'] = dict(fcfun.memo_stats)
+    result['meta']['edge_index_stats'] = dict(fcfun.edge_index_stats)
+    return result
+
+
+def print_result (result):
+    """ prints a table with the median and p95 of each part and stage
+    """
+    header = '%-18s' % 'part'
+    for stage in STAGE_LIST:
+        header += '%12s%10s' % (stage + ' med', 'p95')
+    header += '%10s%10s' % ('points', 'facets')
+    print (header)
+    for name in sorted(result['parts']):
+        part_result = result['parts'][name]
+        line = '%-18s' % name
+        for stage in STAGE_LIST:
+            stats = part_result['stages'][stage]
+            line += '%12.4f%10.4f' % (stats['median'], stats['p95'])
+        line += '%10d%10d' % (part_result['mesh']['points'],
+                              part_result['mesh']['facets'])
+        print (line)
+
+
+def save_result (result, filename):
+    """ saves the result of the benchmark in a JSON file
+    """
+    with open(filename, 'w') as json_file:
+        json.dump(result, json_file, indent = 2, sort_keys = True)
+
+
+def load_result (filename):
+    """ loads the result of a benchmark saved by save_result
+    """
+    with open(filename) as json_file:
+        result = json.load(json_file)
+    return result
+
+
+def save_baseline (result, filename = BASELINE_FILE):
+    """ saves the result of the benchmark as the baseline.
+    If the baseline file already exists, only the parts in result are
+    replaced, so a baseline can be updated part by part
+    """
+    if os.path.isfile(filename):
+        baseline = load_result(filename)
+        baseline['meta'] = result['meta']
+        baseline['parts'].update(result['parts'])
+    else:
+        dirname = os.path.dirname(filename)
+        if dirname and not os.path.isdir(dirname):
+            os.makedirs(dirname)
+        baseline = result
+    save_result(baseline, filename)
+
+
+def compare_results (baseline, result,
+                     threshold = SLOW_THRESHOLD,
+                     mesh_threshold = MESH_THRESHOLD,
+                     min_time = MIN_STAGE_TIME):
+    """ compares the result of a benchmark with the baseline
+
+    Parameters:
+    -----------
+    baseline : dict
+        result of a previous benchmark (see bench_parts)
+    result : dict
+        result of the benchmark to compare
+    threshold : float
+        relative slowdown of the median of a stage to be a regression.
+        0.3: 30% slower than the baseline
+    mesh_threshold : float
+        relative change of the number of points or facets of the mesh to be
+        a regression. 0: any change
+    min_time : float
+        stages whose median is smaller than min_time (seconds), both in
+        the baseline and in the result, are not compared
+
+    Returns:
+    --------
+    Tuple of 2 lists of dictionaries, the regressions and all the
+    comparisons, each dictionary with keys:
+    'part', 'item' (stage or mesh size), 'baseline', 'current', 'ratio'
+    """
+    regressions = []
+    comparisons = []
+    for name in sorted(result['parts']):
+        part_result = result['parts'][name]
+        try:
+            part_base = baseline['parts'][name]
+        except KeyError:
+            logger.warning('part not in the baseline: ' + name)
+            continue
+        for stage in STAGE_LIST:
+            try:
+                base_med = part_base['stages'][stage]['median']
+            except KeyError:
+                logger.warning('stage not in the baseline: ' + name
+                               + ' ' + stage)
+                continue
+            cur_med = part_result['stages'][stage]['median']
+            if base_med < min_time and cur_med < min_time:
+                continue
+            if base_med > 0:
+                ratio = cur_med / base_med
+            else:
+                ratio = float('inf')
+            comp = {'part' : name, 'item' : stage,
+                    'baseline' : base_med, 'current' : cur_med,
+                    'ratio' : ratio}
+            comparisons.append(comp)
+            if ratio > 1. + threshold:
+                regressions.append(comp)
+        for mesh_item in ['points', 'facets']:
+            base_size = part_base['mesh'][mesh_item]
+            cur_size = part_result['mesh'][mesh_item]
+            if base_size > 0:
+                ratio = float(cur_size) / base_size
+            elif cur_size == 0:
+                ratio = 1.
+            else:
+                ratio = float('inf')
+            comp = {'part' : name, 'item' : mesh_item,
+                    'baseline' : base_size, 'current' : cur_size,
+                    'ratio' : ratio}
+            comparisons.append(comp)
+            if abs(ratio - 1.) > mesh_threshold:
+                regressions.append(comp)
+    return regressions, comparisons
+
+
+def print_comparison (regressions, comparisons):
+    """ prints the comparisons with the baseline, marking the regressions
+    """
+    print ('%-18s%10s%14s%14s%10s' % ('part', 'item', 'baseline', 'current',
+                                      'ratio'))
+    for comp in comparisons:
+        if comp in regressions:
+            mark = ' <-- REGRESSION'
+        else:
+            mark = ''
+        print ('%-18s%10s%14.6g%14.6g%10.3f%s' % (comp['part'], comp['item'],
+                                                  comp['baseline'],
+                                                  comp['current'],
+                                                  comp['ratio'], mark))
+    if regressions:
+        print (str(len(regressions)) + ' regressions')
+    else:
+        print ('no regressions')
+
+
+def get_arg_parser ():
+    parser = argparse.ArgumentParser(
+                description = 'Benchmark of the parts of the filter stage')
+    parser.add_argument('-n', '--runs', type = int, default = 5,
+                        help = 'number of measured runs per part')
+    parser.add_argument('-w', '--warmup', type = int, default = 1,
+                        help = 'number of runs not measured per part')
+    parser.add_argument('-p', '--parts', nargs = '+', choices = PART_LIST,
+                        help = 'parts to benchmark, all if not given')
+    parser.add_argument('-o', '--output',
+                        help = 'JSON file to save the results')
+    parser.add_argument('--memo', action = 'store_true',
+                        help = 'memoize the primitive shapes of fcfun')
+    parser.add_argument('--batch-bool', action = 'store_true',
+                        help = 'cut all the holes of the parts at once')
+    parser.add_argument('--profile', metavar = 'PREFIX',
+                        help = 'profile the functions of fcfun and the '
+                               'constructors (warmup runs included), and '
+                               'save PREFIX.json and PREFIX.folded')
+    parser.add_argument('--trace', metavar = 'FILE',
+                        help = 'save the steps of the construction of the '
+                               'parts in a Chrome trace JSON file')
+    parser.add_argument('--baseline', default = BASELINE_FILE,
+                        help = 'JSON file of the baseline')
+    parser.add_argument('--save-baseline', action = 'store_true',
+                        help = 'save the results as the baseline')
+    parser.add_argument('--compare', action = 'store_true',
+                        help = 'compare the results with the baseline')
+    parser.add_argument('--threshold', type = float,
+                        default = SLOW_THRESHOLD,
+                        help = 'relative slowdown to be a regression')
+    parser.add_argument('--mesh-threshold', type = float,
+                        default = MESH_THRESHOLD,
+                        help = 'relative mesh size change to be a regression')
+    parser.add_argument('--min-time', type = float,
+                        default = MIN_STAGE_TIME,
+                        help = 'stages faster than this are not compared')
+    return parser
+
+
+def main (argv = None):
+    if argv is None:
+        argv = sys.argv[1:]
+    # parse_known_args: FreeCADCmd may pass its own arguments
+    args, _ = get_arg_parser().parse_known_args(argv)
+    if args.profile:
+        logger.info(str(instrument_parts()) + ' functions profiled')
+    with contextlib.ExitStack() as prof_stack:
+        # only collecting if asked, not to add time to the benchmark
+        if args.profile:
+            func_prof = prof_stack.enter_context(fcprof.collect_funcs())
+        if args.trace:
+            span_trace = prof_stack.enter_context(fcprof.collect_spans())
+        result = bench_parts(args.parts, runs = args.runs,
+                             warmup = args.warmup,
+                             batch_bool = int(args.batch_bool),
+                             memo = int(args.memo))
+    if args.trace:
+        span_trace.save_chrome_trace(args.trace)
+    print_result(result)
+    if args.profile:
+        fcprof.uninstrument()
+        print (func_prof.report(limit = 40))
+        func_prof.save_json(args.profile + '.json')
+        func_prof.save_collapsed(args.profile + '.folded')
+    if args.output:
+        save_result(result, args.output)
+    if args.compare:
+        baseline = load_result(args.baseline)
+        regressions, comparisons = compare_results(
+                                          baseline, result,
+                                          threshold = args.threshold,
+                                          mesh_threshold = args.mesh_threshold,
+                                          min_time = args.min_time)
+        print_comparison(regressions, comparisons)
+        if regressions:
+            sys.exit(1)
+    if args.save_baseline:
+        save_baseline(result, args.baseline)
+    return result
+
+
+if __name__ == '__main__':
+    main()
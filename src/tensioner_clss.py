@@ -98,6 +98,8 @@ import shp_clss # import my TopoShapes classes
 import fc_clss # import my freecad classes 
 import comps   # import my CAD components
 import partset 
+import fcprof  # timing of the construction stages
+import shpcache # cache of the shapes
 
 from fcfun import V0, VX, VY, VZ, V0ROT
 from fcfun import VXN, VYN, VZN
@@ -205,6 +207,10 @@ class ShpIdlerTensioner (shp_clss.Obj3D):
         2: at the bottom of the piece (negative side of axis_h)
     pos : FreeCAD.Vector
         Position of the cylinder, taking into account where the center is
+    batch_bool : int
+        1: the holes (steps 05 to 08) are cut all at once, without fusing
+           them before. The shape is the same
+        0: the holes are fused and then cut
 
     Attributes:
     -----------
@@ -250,7 +256,8 @@ class ShpIdlerTensioner (shp_clss.Obj3D):
                  pos_d = 0,
                  pos_w = 0,
                  pos_h = 0,
-                 pos = V0):
+                 pos = V0,
+                 batch_bool = 0):
         
         shp_clss.Obj3D.__init__(self, axis_d, axis_w, axis_h)
 
@@ -323,261 +330,293 @@ class ShpIdlerTensioner (shp_clss.Obj3D):
         # calculates the position of the origin, and keeps it in attribute pos_o
         self.set_pos_o()
 
-        # ------------- building of the piece --------------------
-
-        #  --------------- step 01-04 ------------------------      
-        #  rectangular cuboid with basic dimensions, but chamfered
-        #  at the inner end
-        # 
-        #       axis_h
-        #          : .....tens_d.......
-        #          : : ________________:
-        #          : /               /|
-        #           /               / |
-        #       .. /_______________/  |.......
-        #       : /                |  /     . 
-        # tens_h  |                | /     . tens_w
-        #       :. \_______________|/......
-        #
-        #
-        #     o: shows the position of the origin: pos_o
-        #
-        #                axis_h       axis_h
-        #                  :            :
-        #         .... ____:____        : ______________________
-        #         :   |.........|     ch2/                      |
-        #         :   |:       :|       |                       |      
-        #  tens_h +   |:   o   :|       o                       |-----> axis_d
-        #         :   |:.......:|       |                       |
-        #         :...|_________|     ch1\______________________|
-        #             :         :       :                       :
-        #             :.tens_h..:       :...... tens_d .........:
-        #
-        #              ____o____ ....> axis_w
-        #          ch3/_________\ch4
-        #             |         |          chamfer ch3 and ch4 are optional
-        #             |         |          Depending on opt_tens_chmf
-        #             |         |
-        #             |         |
-        #             |         |
-        #             |         |
-        #             |.........|
-        #             |         |
-        #             |         |
-        #             |         |
-        #             |_________|
-        #                  :
-        #                  :
-        #                  V
-        #                 axis_d
-
-        if opt_tens_chmf == 0: # no optional chamfer, only along axis_w
-            edge_dir = self.axis_w
-        else:
-            edge_dir = V0
+        # key of the shape in the cache, calculated now, when the arguments
+        # are known
+        self.shp_key = shpcache.get_key(ShpIdlerTensioner, args, values)
+
+        def build_shp():
+            """ builds the shape, now or the first time it is used,
+            see shp_clss.Obj3D.set_shp_builder
+            """
+            # if it has been built before with the same arguments,
+            # take the shape from the cache
+            shp = shpcache.load_shp(self.shp_key)
+            if shp is not None:
+                self.shp = shp
+                return
+
+            # ------------- building of the piece --------------------
+            # steps of the construction, see fcprof.StageSteps
+            steps = fcprof.StageSteps('ShpIdlerTensioner')
+
+            #  --------------- step 01-04 ------------------------
+            steps.step('base')
+            #  rectangular cuboid with basic dimensions, but chamfered
+            #  at the inner end
+            #
+            #       axis_h
+            #          : .....tens_d.......
+            #          : : ________________:
+            #          : /               /|
+            #           /               / |
+            #       .. /_______________/  |.......
+            #       : /                |  /     .
+            # tens_h  |                | /     . tens_w
+            #       :. \_______________|/......
+            #
+            #
+            #     o: shows the position of the origin: pos_o
+            #
+            #                axis_h       axis_h
+            #                  :            :
+            #         .... ____:____        : ______________________
+            #         :   |.........|     ch2/                      |
+            #         :   |:       :|       |                       |
+            #  tens_h +   |:   o   :|       o                       |-----> axis_d
+            #         :   |:.......:|       |                       |
+            #         :...|_________|     ch1\______________________|
+            #             :         :       :                       :
+            #             :.tens_h..:       :...... tens_d .........:
+            #
+            #              ____o____ ....> axis_w
+            #          ch3/_________\ch4
+            #             |         |          chamfer ch3 and ch4 are optional
+            #             |         |          Depending on opt_tens_chmf
+            #             |         |
+            #             |         |
+            #             |         |
+            #             |         |
+            #             |.........|
+            #             |         |
+            #             |         |
+            #             |         |
+            #             |_________|
+            #                  :
+            #                  :
+            #                  V
+            #                 axis_d
+
+            if opt_tens_chmf == 0: # no optional chamfer, only along axis_w
+                edge_dir = self.axis_w
+            else:
+                edge_dir = V0
    
-        shp01chmf = fcfun.shp_boxdir_fillchmfplane(
-                               box_w = self.tens_w,
-                               box_d = self.tens_d,
-                               box_h = self.tens_h,
-                               axis_d = self.axis_d,
-                               axis_h = self.axis_h,
-                               cd=0, cw=1, ch=1,
-                               # no tolerances, this is the piece
-                               fillet = 0, # chamfer
-                               radius = 2*in_fillet,
-                               plane_fill = self.axis_d.negative(),
-                               both_planes = 0,
-                               edge_dir = edge_dir,
-                               pos = self.pos_o)
-        #  --------------- step 02 ---------------------------  
-        # Space for the idler pulley
-        #    axis_h
-        #      :
-        #      : ______________________
-        #       /               _______|....
-        #      |               |           + idler_h
-        #      |               |       5   :----------->axis_d
-        #      |               |_______....:
-        #       \______________________|...wall_thick
-        #                      :       :
-        #                      :.......:
-        #                         +
-        #                       2 * idler_r_xtr
-        #
-        # the position is pos_d = 5
-        # maybe should be advisable to have tolerance, but usually, the 
-        # washers have tolerances, and usually are less thick than the nominal
-        idler_h_hole =  idler_h # + tol
-        if idler_h_hole != idler_h:
-            self.idler_h_hole = idler_h_hole
-        # NO CHAMFER to be able to fit the pulley well
-        shp02cut = fcfun.shp_box_dir_xtr(
-                               box_w = self.tens_w,
-                               box_d = idler_r_in + idler_r_ext,
-                               box_h = idler_h_hole,
-                               fc_axis_d = self.axis_d.negative(),
-                               fc_axis_h = self.axis_h,
-                               cd=0, cw=1, ch=1,
-                               xtr_w = 1,
-                               xtr_nw = 1,
-                               xtr_d = tol, # tol to fit the large washer
-                               xtr_nd = 1, # extra along axis_d (positive)
-                               pos = self.get_pos_d(5))
-        shp02 = shp01chmf.cut(shp02cut)
-        shp02 = shp02.removeSplitter() # refine shape
-        #  --------------- step 03 --------------------------- 
-        # Fillets at the idler end:
-        #
-        #    axis_h
-        #      :
-        #      :_______________________f2
-        #      |                 ______|
-        #      |                /      f4
-        #      |               |       5    ------> axis_d
-        #      |                \______f3...
-        #      |_______________________|....+ wall_thick.....> Y
-        #      :                       f1
-        #      :...... tens_d .........:
-        #
-        pt_f1 = self.get_pos_d(5) + self.vec_h( -self.tens_h/2.)
-        pt_f2 = self.get_pos_d(5) + self.vec_h(  self.tens_h/2.)
-        pt_f3 = self.get_pos_d(5) + self.vec_h( -idler_h_hole/2.)
-        pt_f4 = self.get_pos_d(5) + self.vec_h(  idler_h_hole/2.)
-
-        if wall_thick/2. <= in_fillet:
-            msg1 = 'Radius of fillet is larger than 2 x wall thick'
-            msg2 = ' making fillet smaller: '
-            wall_fillet_r = self.wall_thick /2. - 0.1
-            logger.warning(msg1 + msg2 + str(wall_fillet_r))
-        else:
-            wall_fillet_r = in_fillet
-        shp03 = fcfun.shp_filletchamfer_dirpts (
-                                            shp=shp02,
-                                            fc_axis=self.axis_w,
-                                            fc_pts=[pt_f1,pt_f2, pt_f3, pt_f4],
-                                            fillet = 1,
-                                            radius=wall_fillet_r)
-        #  --------------- step 04 done at step 01 ------------------------ 
-
-        #  --------------- step 05 --------------------------- 
-        # Shank hole for the idler pulley:
-
-        #    axis_h                  idler_r_xtr
-        #      :                    .+..
-        #      : ___________________:__:
-        #       /                __:_:_|
-        #      |                /             
-        #      |               |    4   ----------> axis_d
-        #      |                \______
-        #       \__________________:_:_|
-        #      :                       :
-        #      :...... tens_d .........:
-        #                     
-        # pos_d = 4
-        shp05 = fcfun.shp_cylcenxtr (r = self.boltidler_r_tol,
-                                     h = self.tens_h,
-                                     normal = self.axis_h,
-                                     ch = 1, xtr_top = 1, xtr_bot = 1,
-                                     pos = self.get_pos_d(4))
-        #  --------------- step 06 --------------------------- 
-        # Hole for the leadscrew (stroke):
-
-        #    axis_h
-        #      :
-        #      : ______________________
-        #       /      _____     __:_:_|
-        #      |    f2/     \f4 /             
-        #      |     2       | |        -------> axis_d
-        #      |    f1\_____/f3 \______
-        #       \__________________:_:_|
-        #      :     :       :         :
-        #      :     :.......:         :
-        #      :     :   +             :
-        #      :.....:  tens_stroke    :
-        #      :  +                    :
-        #      : nut_holder_tot        :
-        #      :                       :
-        #      :...... tens_d .........:
-        # 
-        #  pos_d = 2
-        shp06a = fcfun.shp_box_dir_xtr(box_w = self.tens_w,
-                                       box_d = self.tens_stroke,
-                                       box_h = self.idler_h,
-                                       fc_axis_h = self.axis_h,
-                                       fc_axis_d = self.axis_d,
-                                       xtr_w = 1, xtr_nw = 1,
-                                       cw=1, cd=0, ch=1,
-                                       pos=self.get_pos_d(2))
-        shp06 =  fcfun.shp_filletchamfer_dir (shp=shp06a,
-                                              fc_axis=self.axis_w,
-                                              fillet = 0, radius=self.in_fillet)
-
-        #  --------------- step 07 --------------------------- 
-        # Hole for the leadscrew shank at the beginning
-
-        #    axis_h
-        #      :
-        #      : ______________________
-        #       /      _____     __:_:_|
-        #      |      /     \   /
-        #      |:::::|       | |        ---->axis_d
-        #      |      \_____/   \______
-        #       \__________________:_:_|
-        #      :     :                 :
-        #      :     :                 :
-        #      :     :                 :
-        #      :.....:                 :
-        #      :  +                    :
-        #      : nut_holder_tot        :
-        #      :                       :
-        #      :...... tens_d .........:
-        #
-        shp07 = fcfun.shp_cylcenxtr (r = self.bolttens_r_tol,
-                                     h = self.nut_holder_tot,
-                                     normal = self.axis_d,
-                                     ch = 0, xtr_top = 1, xtr_bot = 1,
-                                     pos = self.pos_o)
-        #  --------------- step 08 --------------------------- 
-        # Hole for the leadscrew nut
-
-        #    axis_h
-        #      :
-        #      : ______________________
-        #       /      _____     __:_:_|
-        #      |  _   /     \   /
-        #      |:1_|:|       | |       -----> axis_d
-        #      |      \_____/   \______
-        #       \__________________:_:_|
-        #      : :   :                 :
-        #      :+    :                 :
-        #      :nut_holder_thick       :
-        #      :.....:                 :
-        #      :  +                    :
-        #      : nut_holder_total      :
-        #      :                       :
-        #      :...... tens_d .........:
-        #
-        # position at pos_d = 1
-
-        shp08 = fcfun.shp_nuthole (
-                               nut_r = self.tensnut_circ_r_tol,
-                               nut_h = self.nut_space,
-                               hole_h = self.tens_w/2,
-                               xtr_nut = 1, xtr_hole = 1, 
-                               fc_axis_nut = self.axis_d,
-                               fc_axis_hole = self.axis_w,
-                               ref_nut_ax = 2, # pos not centered on axis nut 
-                               # pos at center of nut on axis hole 
-                               ref_hole_ax = 1, 
-                               pos = self.get_pos_d(1))
-
-        # --------- step 09:
-        # --------- Last step, union and cut of the steps 05, 06, 07, 08
-        shp09cut = fcfun.fuseshplist([shp05, shp06, shp07, shp08])
-        shp09_final = shp03.cut(shp09cut)
-
-        self.shp = shp09_final
+            shp01chmf = fcfun.shp_boxdir_fillchmfplane(
+                                   box_w = self.tens_w,
+                                   box_d = self.tens_d,
+                                   box_h = self.tens_h,
+                                   axis_d = self.axis_d,
+                                   axis_h = self.axis_h,
+                                   cd=0, cw=1, ch=1,
+                                   # no tolerances, this is the piece
+                                   fillet = 0, # chamfer
+                                   radius = 2*in_fillet,
+                                   plane_fill = self.axis_d.negative(),
+                                   both_planes = 0,
+                                   edge_dir = edge_dir,
+                                   pos = self.pos_o)
+            #  --------------- step 02 ---------------------------
+            # Space for the idler pulley
+            #    axis_h
+            #      :
+            #      : ______________________
+            #       /               _______|....
+            #      |               |           + idler_h
+            #      |               |       5   :----------->axis_d
+            #      |               |_______....:
+            #       \______________________|...wall_thick
+            #                      :       :
+            #                      :.......:
+            #                         +
+            #                       2 * idler_r_xtr
+            #
+            # the position is pos_d = 5
+            # maybe should be advisable to have tolerance, but usually, the
+            # washers have tolerances, and usually are less thick than the nominal
+            idler_h_hole =  idler_h # + tol
+            if idler_h_hole != idler_h:
+                self.idler_h_hole = idler_h_hole
+            # NO CHAMFER to be able to fit the pulley well
+            shp02cut = fcfun.shp_box_dir_xtr(
+                                   box_w = self.tens_w,
+                                   box_d = idler_r_in + idler_r_ext,
+                                   box_h = idler_h_hole,
+                                   fc_axis_d = self.axis_d.negative(),
+                                   fc_axis_h = self.axis_h,
+                                   cd=0, cw=1, ch=1,
+                                   xtr_w = 1,
+                                   xtr_nw = 1,
+                                   xtr_d = tol, # tol to fit the large washer
+                                   xtr_nd = 1, # extra along axis_d (positive)
+                                   pos = self.get_pos_d(5))
+            with fcprof.stage('boolean'):
+                shp02 = shp01chmf.cut(shp02cut)
+                shp02 = shp02.removeSplitter() # refine shape
+            #  --------------- step 03 ---------------------------
+            # Fillets at the idler end:
+            #
+            #    axis_h
+            #      :
+            #      :_______________________f2
+            #      |                 ______|
+            #      |                /      f4
+            #      |               |       5    ------> axis_d
+            #      |                \______f3...
+            #      |_______________________|....+ wall_thick.....> Y
+            #      :                       f1
+            #      :...... tens_d .........:
+            #
+            pt_f1 = self.get_pos_d(5) + self.vec_h( -self.tens_h/2.)
+            pt_f2 = self.get_pos_d(5) + self.vec_h(  self.tens_h/2.)
+            pt_f3 = self.get_pos_d(5) + self.vec_h( -idler_h_hole/2.)
+            pt_f4 = self.get_pos_d(5) + self.vec_h(  idler_h_hole/2.)
+
+            if wall_thick/2. <= in_fillet:
+                msg1 = 'Radius of fillet is larger than 2 x wall thick'
+                msg2 = ' making fillet smaller: '
+                wall_fillet_r = self.wall_thick /2. - 0.1
+                logger.warning(msg1 + msg2 + str(wall_fillet_r))
+            else:
+                wall_fillet_r = in_fillet
+            shp03 = fcfun.shp_filletchamfer_dirpts (
+                                                shp=shp02,
+                                                fc_axis=self.axis_w,
+                                                fc_pts=[pt_f1,pt_f2, pt_f3, pt_f4],
+                                                fillet = 1,
+                                                radius=wall_fillet_r)
+            #  --------------- step 04 done at step 01 ------------------------
+
+            #  --------------- step 05 ---------------------------
+            # holes for the idler bolt, the tensioner, its bolt and nut
+            steps.step('holes')
+            # Shank hole for the idler pulley:
+
+            #    axis_h                  idler_r_xtr
+            #      :                    .+..
+            #      : ___________________:__:
+            #       /                __:_:_|
+            #      |                /
+            #      |               |    4   ----------> axis_d
+            #      |                \______
+            #       \__________________:_:_|
+            #      :                       :
+            #      :...... tens_d .........:
+            #
+            # pos_d = 4
+            shp05 = fcfun.shp_cylcenxtr (r = self.boltidler_r_tol,
+                                         h = self.tens_h,
+                                         normal = self.axis_h,
+                                         ch = 1, xtr_top = 1, xtr_bot = 1,
+                                         pos = self.get_pos_d(4))
+            #  --------------- step 06 ---------------------------
+            # Hole for the leadscrew (stroke):
+
+            #    axis_h
+            #      :
+            #      : ______________________
+            #       /      _____     __:_:_|
+            #      |    f2/     \f4 /
+            #      |     2       | |        -------> axis_d
+            #      |    f1\_____/f3 \______
+            #       \__________________:_:_|
+            #      :     :       :         :
+            #      :     :.......:         :
+            #      :     :   +             :
+            #      :.....:  tens_stroke    :
+            #      :  +                    :
+            #      : nut_holder_tot        :
+            #      :                       :
+            #      :...... tens_d .........:
+            #
+            #  pos_d = 2
+            shp06a = fcfun.shp_box_dir_xtr(box_w = self.tens_w,
+                                           box_d = self.tens_stroke,
+                                           box_h = self.idler_h,
+                                           fc_axis_h = self.axis_h,
+                                           fc_axis_d = self.axis_d,
+                                           xtr_w = 1, xtr_nw = 1,
+                                           cw=1, cd=0, ch=1,
+                                           pos=self.get_pos_d(2))
+            shp06 =  fcfun.shp_filletchamfer_dir (shp=shp06a,
+                                                  fc_axis=self.axis_w,
+                                                  fillet = 0, radius=self.in_fillet)
+
+            #  --------------- step 07 ---------------------------
+            # Hole for the leadscrew shank at the beginning
+
+            #    axis_h
+            #      :
+            #      : ______________________
+            #       /      _____     __:_:_|
+            #      |      /     \   /
+            #      |:::::|       | |        ---->axis_d
+            #      |      \_____/   \______
+            #       \__________________:_:_|
+            #      :     :                 :
+            #      :     :                 :
+            #      :     :                 :
+            #      :.....:                 :
+            #      :  +                    :
+            #      : nut_holder_tot        :
+            #      :                       :
+            #      :...... tens_d .........:
+            #
+            shp07 = fcfun.shp_cylcenxtr (r = self.bolttens_r_tol,
+                                         h = self.nut_holder_tot,
+                                         normal = self.axis_d,
+                                         ch = 0, xtr_top = 1, xtr_bot = 1,
+                                         pos = self.pos_o)
+            #  --------------- step 08 ---------------------------
+            # Hole for the leadscrew nut
+
+            #    axis_h
+            #      :
+            #      : ______________________
+            #       /      _____     __:_:_|
+            #      |  _   /     \   /
+            #      |:1_|:|       | |       -----> axis_d
+            #      |      \_____/   \______
+            #       \__________________:_:_|
+            #      : :   :                 :
+            #      :+    :                 :
+            #      :nut_holder_thick       :
+            #      :.....:                 :
+            #      :  +                    :
+            #      : nut_holder_total      :
+            #      :                       :
+            #      :...... tens_d .........:
+            #
+            # position at pos_d = 1
+
+            shp08 = fcfun.shp_nuthole (
+                                   nut_r = self.tensnut_circ_r_tol,
+                                   nut_h = self.nut_space,
+                                   hole_h = self.tens_w/2,
+                                   xtr_nut = 1, xtr_hole = 1,
+                                   fc_axis_nut = self.axis_d,
+                                   fc_axis_hole = self.axis_w,
+                                   ref_nut_ax = 2, # pos not centered on axis nut
+                                   # pos at center of nut on axis hole
+                                   ref_hole_ax = 1,
+                                   pos = self.get_pos_d(1))
+
+            # --------- step 09:
+            # --------- Last step, union and cut of the steps 05, 06, 07, 08
+            steps.step('cut')
+            if batch_bool == 1:
+                # a single cut with all the tools
+                with fcprof.stage('boolean'):
+                    shp09_final = shp03.cut([shp05, shp06, shp07, shp08])
+            else:
+                with fcprof.stage('boolean'):
+                    shp09cut = fcfun.fuseshplist([shp05, shp06, shp07, shp08])
+                    shp09_final = shp03.cut(shp09cut)
+            steps.end()
+
+            self.shp = shp09_final
+            shpcache.save_shp(self.shp_key, self.shp)
+
+        self.set_shp_builder(build_shp)
 
         # normal axes to print without support
         self.prnt_ax = self.axis_w
@@ -628,6 +667,7 @@ class PartIdlerTensioner (fc_clss.SinglePart, ShpIdlerTensioner):
                  pos_w = 0,
                  pos_h = 0,
                  pos = V0,
+                 batch_bool = 0,
                  model_type = 0, # exact
                  name = ''):
 
@@ -653,7 +693,8 @@ class PartIdlerTensioner (fc_clss.SinglePart, ShpIdlerTensioner):
                                   pos_d = pos_d,
                                   pos_w = pos_w,
                                   pos_h = pos_h,
-                                  pos = pos)
+                                  pos = pos,
+                                  batch_bool = batch_bool)
 
         # Then the Part
         fc_clss.SinglePart.__init__(self)
@@ -716,6 +757,8 @@ class IdlerTensionerSet (fc_clss.PartsSet):
         2: at the bottom of the piece
     pos : FreeCAD.Vector
         position of the piece
+    batch_bool : int
+        boolean strategy of the idler tensioner, see ShpIdlerTensioner
     See drawing:
 
                       nut_holder_thick:  :nut_holder_thick
@@ -794,6 +837,7 @@ class IdlerTensionerSet (fc_clss.PartsSet):
                  pos_w = 0,
                  pos_h = 0,
                  pos = V0,
+                 batch_bool = 0,
                  group = 0,
                  name = ''):
 
@@ -852,7 +896,8 @@ class IdlerTensionerSet (fc_clss.PartsSet):
                                      pos_d  = 0,
                                      pos_w  = 0,
                                      pos_h  = 0,
-                                     pos    = pos)
+                                     pos    = pos,
+                                     batch_bool = batch_bool)
         self.append_part(idler_tens_part)
         idler_tens_part.parent = self
 
@@ -1167,6 +1212,12 @@ class ShpTensionerHolder (shp_clss.Obj3D):
         4: at the top of the holder
     pos : FreeCAD.Vector
         position of the piece
+    batch_bool : int
+        1: the holes are cut all at once, without fusing them before, and
+           the piece is refined (removeSplitter) after fusing the base and
+           at the end. The shape is the same
+        0: the holes are fused and then cut, and the piece is refined after
+           each step
 
     Parameters for the set
 
@@ -1215,7 +1266,8 @@ class ShpTensionerHolder (shp_clss.Obj3D):
                  pos_d = 0,
                  pos_w = 0,
                  pos_h = 0,
-                 pos = V0):
+                 pos = V0,
+                 batch_bool = 0):
         
         shp_clss.Obj3D.__init__(self, axis_d, axis_w, axis_h)
 
@@ -1307,357 +1359,401 @@ class ShpTensionerHolder (shp_clss.Obj3D):
         # calculates the position of the origin, and keeps it in attribute pos_o
         self.set_pos_o()
 
-
-        # --------------- step 01 --------------------------- 
-        #    the base, to attach it to the aluminum profiles
-        #    
-        #
-        #                         axis_h                axis_h
-        #                            :                  :
-        #              .. ___________:___________       :________
-        #  hold_bas_h.+..|___________:___________|      |________|...axis_d
-        #
-        #                 .... hold_bas_w ........
-        #                :                        :
-        #                :________________________:......axis_w
-        #                |           :            |    :
-        #                |           :            |    + hold_bas_d
-        #                |___________:____________|....:
-        #                            :            :
-        #                          axis_d
-        shp01 = fcfun.shp_box_dir(box_w = self.hold_bas_w,
-                                  box_d = self.hold_bas_d,
-                                  box_h = self.hold_bas_h,
-                                  fc_axis_h = self.axis_h,
-                                  fc_axis_d = self.axis_d,
-                                  cw=1, cd=0, ch=0, pos=self.pos_o)
-        #    --------------- step 02 --------------------------- 
-        #    Fillet the base
-        #    The piece will be printed on the h w plane, so this fillet will be 
-        #    raising
-        #  
-        #                          axis_h
-        #                             :
-        #                f4___________:___________f2
-        #                 (_______________________)... axis_w
-        #                f3                        f1
-        #
-        bas_fil_r = self.in_fillet
-        if self.hold_bas_h/2. <= self.in_fillet:
-            msg1 = 'Radius of holder base fillet is larger than 2 x base height'
-            msg2 = ' making fillet smaller: '
-            bas_fil_r = self.hold_bas_h /2. - 0.1
-            logger.warning(msg1 + msg2 + str(bas_fil_r))
-        # fillet along axis_d :
-        shp02 = fcfun.shp_filletchamfer_dir (shp=shp01, fc_axis=self.axis_d,
-                                             fillet = 1, radius=bas_fil_r)
-
-        #    --------------- step 03 --------------------------- 
-        #    The main box
-        #                          axis_h              axis_h
-        #                             :    rim_w         :
-        #                             :    ..+....       :
-        #           .............. ___:___:       :      :____________
-        #           :             |       |       :      |            |
-        #           :             |       |       :      |            |
-        #   hold_h +:             |       |       :      |            |
-        #           :             |       |       :      |            |     
-        #           :      _______|       |_______:      |________    |
-        #           :.....(_______|_______|_______)      |________|___|...axis_d
-        #                                                :            :
-        #                  .... hold_bas_w ........      :.. hold_d...:
-        #                 :                        :
-        #                 :        .hold_w.        :
-        #                 :       :       :        :
-        #                 :_______:_______:________:.......axis_w
-        #                 |       |       |        |    :
-        #                 |       |       |        |    + hold_bas_d
-        #                 |_______|       |________|....:
-        #                         |       |
-        #                         |_______|
-        #                             :
-        #                             :
-        #                           axis_d 
-
-        shp03 = fcfun.shp_box_dir(box_w = self.hold_w,
-                                  box_d = self.hold_d,
-                                  box_h = self.hold_h,
-                                  fc_axis_h = self.axis_h,
-                                  fc_axis_d = self.axis_d,
-                                  cw=1, cd=0, ch=0, pos=self.pos_o)
-        #    --------------- step 04 --------------------------- 
-        #    Fillets on top
-        #                          axis_h   rim_w
-        #                             :    ..+....:
-        #           .............  ___4___        : 
-        #           :             /       \       :
-        #           :             |       |       :
-        #   hold_h +:             |       |       :
-        #           :             |       |       :
-        #           :      _______|       |_______:
-        #           :.....(_______|_______|_______).... axis_w
+        # key of the shape in the cache, calculated now, when the arguments
+        # are known
+        self.shp_key = shpcache.get_key(ShpTensionerHolder, args, values)
+
+        def build_shp():
+            """ builds the shape, now or the first time it is used,
+            see shp_clss.Obj3D.set_shp_builder
+            """
+            # if it has been built before with the same arguments,
+            # take the shape from the cache
+            shp = shpcache.load_shp(self.shp_key)
+            if shp is not None:
+                self.shp = shp
+                return
+
+
+            # steps of the construction, see fcprof.StageSteps
+            steps = fcprof.StageSteps('ShpTensionerHolder')
+
+            # --------------- step 01 ---------------------------
+            #    the base, to attach it to the aluminum profiles
+            steps.step('base')
+            #
+            #
+            #                         axis_h                axis_h
+            #                            :                  :
+            #              .. ___________:___________       :________
+            #  hold_bas_h.+..|___________:___________|      |________|...axis_d
+            #
+            #                 .... hold_bas_w ........
+            #                :                        :
+            #                :________________________:......axis_w
+            #                |           :            |    :
+            #                |           :            |    + hold_bas_d
+            #                |___________:____________|....:
+            #                            :            :
+            #                          axis_d
+            shp01 = fcfun.shp_box_dir(box_w = self.hold_bas_w,
+                                      box_d = self.hold_bas_d,
+                                      box_h = self.hold_bas_h,
+                                      fc_axis_h = self.axis_h,
+                                      fc_axis_d = self.axis_d,
+                                      cw=1, cd=0, ch=0, pos=self.pos_o)
+            #    --------------- step 02 ---------------------------
+            #    Fillet the base
+            #    The piece will be printed on the h w plane, so this fillet will be
+            #    raising
+            #
+            #                          axis_h
+            #                             :
+            #                f4___________:___________f2
+            #                 (_______________________)... axis_w
+            #                f3                        f1
+            #
+            bas_fil_r = self.in_fillet
+            if self.hold_bas_h/2. <= self.in_fillet:
+                msg1 = 'Radius of holder base fillet is larger than 2 x base height'
+                msg2 = ' making fillet smaller: '
+                bas_fil_r = self.hold_bas_h /2. - 0.1
+                logger.warning(msg1 + msg2 + str(bas_fil_r))
+            # fillet along axis_d :
+            shp02 = fcfun.shp_filletchamfer_dir (shp=shp01, fc_axis=self.axis_d,
+                                                 fillet = 1, radius=bas_fil_r)
+
+            #    --------------- step 03 ---------------------------
+            #    The main box
+            steps.step('box')
+            #                          axis_h              axis_h
+            #                             :    rim_w         :
+            #                             :    ..+....       :
+            #           .............. ___:___:       :      :____________
+            #           :             |       |       :      |            |
+            #           :             |       |       :      |            |
+            #   hold_h +:             |       |       :      |            |
+            #           :             |       |       :      |            |
+            #           :      _______|       |_______:      |________    |
+            #           :.....(_______|_______|_______)      |________|___|...axis_d
+            #                                                :            :
+            #                  .... hold_bas_w ........      :.. hold_d...:
+            #                 :                        :
+            #                 :        .hold_w.        :
+            #                 :       :       :        :
+            #                 :_______:_______:________:.......axis_w
+            #                 |       |       |        |    :
+            #                 |       |       |        |    + hold_bas_d
+            #                 |_______|       |________|....:
+            #                         |       |
+            #                         |_______|
+            #                             :
+            #                             :
+            #                           axis_d
+
+            shp03 = fcfun.shp_box_dir(box_w = self.hold_w,
+                                      box_d = self.hold_d,
+                                      box_h = self.hold_h,
+                                      fc_axis_h = self.axis_h,
+                                      fc_axis_d = self.axis_d,
+                                      cw=1, cd=0, ch=0, pos=self.pos_o)
+            #    --------------- step 04 ---------------------------
+            #    Fillets on top
+            #                          axis_h   rim_w
+            #                             :    ..+....:
+            #           .............  ___4___        :
+            #           :             /       \       :
+            #           :             |       |       :
+            #   hold_h +:             |       |       :
+            #           :             |       |       :
+            #           :      _______|       |_______:
+            #           :.....(_______|_______|_______).... axis_w
     
-        #                 :______-2___0___2________:.......axis_w
-        #                 |       |       |        |    :
-        #                 |       |       |        |    + hold_bas_d
-        #                 |_______|       |________|....:
-        #                         |       |
-        #                         |_______|
-
-        # fillet along axis_d and the vertex should contain points:
-        # d=0, w=(-2,2) , h = 4
-        pts_list = [self.get_pos_dwh(0,2,4), self.get_pos_dwh(0,-2,4)]
-        shp04 = fcfun.shp_filletchamfer_dirpts (shp=shp03,
-                                                fc_axis=self.axis_d,
-                                                fc_pts=pts_list,
-                                                fillet = 1,
-                                                radius=self.in_fillet)
-
-
-
-        #    --------------- step 05 --------------------------- 
-        #    large chamfer at the bottom
-        #                axis_h                 axis_h
-        #                  :                      :
-        #   Option A    ___:___                   :____________
-        #              /       \                  |            |
-        #              |       |                  |            |
-        #              |_______|                  |            |
-        #              |       |                  |           /       
-        #       _______|_______|_______           |________ /  
-        #      (___________C___________)..axis_w  |________|...C...axis_d
-
-        #  
-        #               axis_h                 axis_h
-        #                  :                      :
-        #   Option B    ___:___                   :____________
-        #              /       \                  |            |
-        #              |       |                  |            |
-        #              |       |                  |            |
-        #              |_______|                  |            |      
-        #       _______|       |_______           |________   /  
-        #      (_______|___4___|_______)..axis_w  |________|/..4...axis_d
-        #                                         :            :
-        #                                         :............:
-        #                                               +  
-        #                                             hold_d
-        #
-        # option B: using more material (probably sturdier)
-        #chmf_rad = min(self.hold_d - self.hold_bas_d,
-        #               self.hold_h - (self.tens_h + 2*wall_thick))
-        # option A: using less material
-        chmf_rad = min(self.hold_d-self.hold_bas_d + self.hold_bas_h,
-                       self.hold_h - (self.tens_h + 2*wall_thick))
+            #                 :______-2___0___2________:.......axis_w
+            #                 |       |       |        |    :
+            #                 |       |       |        |    + hold_bas_d
+            #                 |_______|       |________|....:
+            #                         |       |
+            #                         |_______|
+
+            # fillet along axis_d and the vertex should contain points:
+            # d=0, w=(-2,2) , h = 4
+            pts_list = [self.get_pos_dwh(0,2,4), self.get_pos_dwh(0,-2,4)]
+            shp04 = fcfun.shp_filletchamfer_dirpts (shp=shp03,
+                                                    fc_axis=self.axis_d,
+                                                    fc_pts=pts_list,
+                                                    fillet = 1,
+                                                    radius=self.in_fillet)
+
+
+
+            #    --------------- step 05 ---------------------------
+            #    large chamfer at the bottom
+            #                axis_h                 axis_h
+            #                  :                      :
+            #   Option A    ___:___                   :____________
+            #              /       \                  |            |
+            #              |       |                  |            |
+            #              |_______|                  |            |
+            #              |       |                  |           /
+            #       _______|_______|_______           |________ /
+            #      (___________C___________)..axis_w  |________|...C...axis_d
+
+            #
+            #               axis_h                 axis_h
+            #                  :                      :
+            #   Option B    ___:___                   :____________
+            #              /       \                  |            |
+            #              |       |                  |            |
+            #              |       |                  |            |
+            #              |_______|                  |            |
+            #       _______|       |_______           |________   /
+            #      (_______|___4___|_______)..axis_w  |________|/..4...axis_d
+            #                                         :            :
+            #                                         :............:
+            #                                               +
+            #                                             hold_d
+            #
+            # option B: using more material (probably sturdier)
+            #chmf_rad = min(self.hold_d - self.hold_bas_d,
+            #               self.hold_h - (self.tens_h + 2*wall_thick))
+            # option A: using less material
+            chmf_rad = min(self.hold_d-self.hold_bas_d + self.hold_bas_h,
+                           self.hold_h - (self.tens_h + 2*wall_thick))
         
-        #print (chmf_rad)
-        # Find a point along the vertex that is going to be chamfered.
-        # See drawings: Point C:
-        if chmf_rad > 0:
-            pt_c = self.get_pos_d(4)
-            shp05 = fcfun.shp_filletchamfer_dirpt (shp = shp04,
-                                                   fc_axis = self.axis_w,
-                                                   fc_pt = pt_c,
-                                                   fillet = 0,
-                                                   radius = chmf_rad)
-        else:
-            shp05 = shp04
-
-        #    --------------- step 06 --------------------------- 
-        #    Hole for the tensioner
-        #                                             axis_h
-        #                                                :
-        #                                                : tens_d_inside
-        #                        axis_h                  :  ....+.....
-        #                       ___:___                  :_:__________:
-        #                      /  ___  \                 |  ..........|
-        #                      | | 3 | | pos_d=1,pos_h=3 | 1          |
-        #            ..........| |___| |                 | :..........|
-        # tens_pos_h +         |_______|                 |            |      
-        #            :  _______|       |_______          |________   /  
-        #            :.(_______|_______|_______).axis_w  |________|/....axis_d
-        #                                                : :          :
-        #                                                :+           :
-        #                                                :wall_thick  :
-        #                                                :            :
-        #                                                :............:
-        #                                                      +
-        #                                                    hold_l
-        #
-
-        # position of point A is pos_tens0
-        if self.opt_tens_chmf == 0: # no optional chamfer, only along axis_w
-            edge_dir = self.axis_w
-        else:
-            edge_dir = V0
-
-        pos_06 = self.get_pos_dwh(1,0,3)
+            #print (chmf_rad)
+            # Find a point along the vertex that is going to be chamfered.
+            # See drawings: Point C:
+            if chmf_rad > 0:
+                pt_c = self.get_pos_d(4)
+                shp05 = fcfun.shp_filletchamfer_dirpt (shp = shp04,
+                                                       fc_axis = self.axis_w,
+                                                       fc_pt = pt_c,
+                                                       fillet = 0,
+                                                       radius = chmf_rad)
+            else:
+                shp05 = shp04
+
+            #    --------------- step 06 ---------------------------
+            #    Hole for the tensioner
+            steps.step('tensioner_hole')
+            #                                             axis_h
+            #                                                :
+            #                                                : tens_d_inside
+            #                        axis_h                  :  ....+.....
+            #                       ___:___                  :_:__________:
+            #                      /  ___  \                 |  ..........|
+            #                      | | 3 | | pos_d=1,pos_h=3 | 1          |
+            #            ..........| |___| |                 | :..........|
+            # tens_pos_h +         |_______|                 |            |
+            #            :  _______|       |_______          |________   /
+            #            :.(_______|_______|_______).axis_w  |________|/....axis_d
+            #                                                : :          :
+            #                                                :+           :
+            #                                                :wall_thick  :
+            #                                                :            :
+            #                                                :............:
+            #                                                      +
+            #                                                    hold_l
+            #
+
+            # position of point A is pos_tens0
+            if self.opt_tens_chmf == 0: # no optional chamfer, only along axis_w
+                edge_dir = self.axis_w
+            else:
+                edge_dir = V0
+
+            pos_06 = self.get_pos_dwh(1,0,3)
    
-        shp06 = fcfun.shp_boxdir_fillchmfplane(
-                               box_w = self.tens_w,
-                               box_d = self.hold_d,
-                               box_h = self.tens_h,
-                               axis_d = self.axis_d,
-                               axis_h = self.axis_h,
-                               cd=0, cw=1, ch=1,
-                               xtr_nd = tol,  #tolerance inside
-                               xtr_w  = tol/2.,  #tolerances on each side
-                               xtr_nw = tol/2.,
-                               xtr_h  = tol/2.,
-                               xtr_nh = tol/2.,
-                               fillet = 0, # chamfer
-                               radius = 2*self.in_fillet-kcomp.TOL,
-                               plane_fill = self.axis_d.negative(),
-                               both_planes = 0,
-                               edge_dir = edge_dir,
-                               pos = pos_06)
-
-        #    --------------- step 07 --------------------------- 
-        #    A hole to be able to see inside, could be on one side or both
-        #
-        #    hold_hole_2sides = 1:
-        #              axis_h                   axis_h
-        #                :                        :
-        #             ___:___                     :____________
-        #            /  ___  \                    |  ._______ .|
-        #            |:|   |:|                    | :|_______| |
-        #            | |___| |                    |  ..........|
-        #            |_______|                    |            |      
-        #     _______|       |_______             |________   /  
-        #    (_______|_______|_______)..>axis_w   |________|/......>axis_d
-        #
-        #    hold_hole_2sides = 0:
-        #              axis_h                   axis_h
-        #                :                        :
-        #             ___:___                     :____________
-        #            /  ___  \                    |  ._______ .|
-        #            2:|   | |<-Not a hole here   3 *________| |
-        #            | |___| |                    |  ..........|
-        #            |_______|                    |            |      
-        #     _______|       |_______             |________   /  
-        #    (_______|_______|_______)..>axis_w   |________|/......>axis_d
-        #           -2 pos_w                pos_d = 1
-
-        if self.hold_hole_2sides == 1:
-            hold_hole_w = self.hold_w
-        else:
-            hold_hole_w = self.wall_thick
-        # position of point 7:
-        # height of point 7, is the center of the tensioner:
-        pos_07 = self.get_pos_dwh(1,-2,3)
-        shp07 = fcfun.shp_box_dir_xtr (
-                                       box_w = hold_hole_w,
-                                       box_d =  self.hold_d
-                                              - 2*wall_thick,
-                                       box_h = tens_h/2.,
-                                       fc_axis_h = self.axis_h,
-                                       fc_axis_d = self.axis_d,
-                                       fc_axis_w = self.axis_w,
-                                       ch = 1, cd = 0, cw = 0,
-                                       xtr_w = 1, xtr_nw = 1,
-                                       pos=pos_07)
-        # chamfer the edges
-        shp07 = fcfun.shp_filletchamfer_dir (shp=shp07, fc_axis=self.axis_w,
-                                             fillet = 0, radius=tens_h/6)
-        # /* --------------- step 08 --------------------------- 
-        #    A hole for the leadscrew
-        #            axis_h             axis_h
-        #              :                  :
-        #           ___:___               :____________
-        #          /  ___  \              |  ._______ .|
-        #          |:| O |:|              |::|_______| |
-        #          | |___| |              |  ..........|
-        #          |_______|              |            |      
-        #   _______|       |_______       |________   /  
-        #  (_______|_______|_______)      |________|/......> axis_d
-        #
-        pos_08 = self.get_pos_h(3)
-        shp08 = fcfun.shp_cylcenxtr (r = self.bolttens_r_tol,
-                                     h = wall_thick,
-                                     normal = self.axis_d,
-                                     ch = 0, xtr_top=1, xtr_bot=1,
-                                     pos = pos_08)
-
-        #    --------------- step 09 --------------------------- 
-        #    09a: Fuse all the elements to cut
-        #    09b: Cut the box with the elements to cut
-        #    09c: Fuse the base with the holder
-        #    09d: chamfer the union
-        #            axis_h           axis_h
-        #              :               :
-        #           ___:___            :____________
-        #          /  ___  \           |  ._______ .|
-        #          |:| O |:|           |::|_______| |...
-        #         /| |___| |\          |  ..........|...belt_h/2 -tensnut_ap_tol
-        #        / |_______| \         |            |  :+tens_pos_h
-        #   ____/__A       B__\____    A________   /   :  ...
-        #  (_______|_______|_______)   |________|/.....:.....hold_bas_h
-        #
-        shp09a = fcfun.fuseshplist([shp06, shp07, shp08])
-        shp09b = shp05.cut(shp09a)
-        shp09c = shp09b.fuse(shp02) # fuse with the base
-        shp09c = shp09c.removeSplitter() # refine shape
-
-        # chamfer the union, points A and B:
-        # Radius of chamfer
-        chmf_rad = min(self.rim_w/2, self.belt_pos_h - tens_h/2.)
-        # add the points A,B to the list to have the edges chamfered
-        pts = [self.get_pos_dwh(0,2,1), self.get_pos_dwh(0,-2,1)]
-        shp09d = fcfun.shp_filletchamfer_dirpts (shp=shp09c,
-                                                 fc_axis=self.axis_d,
-                                                 fc_pts=pts,
-                                                 fillet = 0,
-                                                 radius=chmf_rad)
-        shp09d = shp09d.removeSplitter() # refine shape
-
-
-        #    --------------- step 10 --------------------------- 
-        #    Bolt holes to attach the piece to the aluminum profile
-        #                                
-        #             axis_h            axis_h
-        #            ___:___              :____________
-        #           /  ___  \             |  ._______ .|
-        #           |:| O |:|             |::|_______| |
-        #          /| |___| |\            |  ..........|
-        #         / |_______| \           |            |
-        #    ____/__|       |__\____      |________   /
-        #   (__::___|_______|___::__)     |___::___|/....axis_d
-        #      -3   pos_w        3      pos_d 2
-
-        #             hold_w   aluprof_w
-        #            ...+... ...+...
-        #    _______:_______:_______:.......axis_w
-        #   |       |       |       |    :
-        #   |   A   |       |   B   |    + hold_bas_d
-        #   |_______|       |_______|....:
-        #           |       |   :
-        #           |_______|   :
-        #               :       :
-        #               :.......:
-        #                   +
-        #               (hold_w+aluprof_w)/2
-
-        shp_bolt_list = []
-        for w_i in [-3,3]:
-            # points A and B
-            pt_i = self.get_pos_dwh(2,w_i,0)
-            shp_i = fcfun.shp_bolt_dir(
-                       r_shank = self.boltaluprof_r_tol,
-                       l_bolt = self.hold_bas_h +2*self.boltaluprof_head_r_tol,
-                       r_head = self.washer_aluprof_r_tol,
-                       # extra head, just in case
-                       l_head = 2*self.boltaluprof_head_l,
-                       xtr_head = 1, xtr_shank = 1,
-                       support = 0,
-                       fc_normal = self.axis_h.negative(),
-                       pos_n = 2, #at the end of the shank
-                       pos = pt_i)
-            shp_bolt_list.append(shp_i)
-        shp10_bolts = fcfun.fuseshplist(shp_bolt_list)
-        shp10_final = shp09d.cut(shp10_bolts)
-        shp10_final = shp10_final.removeSplitter()
-
-        self.shp = shp10_final
- 
+            shp06 = fcfun.shp_boxdir_fillchmfplane(
+                                   box_w = self.tens_w,
+                                   box_d = self.hold_d,
+                                   box_h = self.tens_h,
+                                   axis_d = self.axis_d,
+                                   axis_h = self.axis_h,
+                                   cd=0, cw=1, ch=1,
+                                   xtr_nd = tol,  #tolerance inside
+                                   xtr_w  = tol/2.,  #tolerances on each side
+                                   xtr_nw = tol/2.,
+                                   xtr_h  = tol/2.,
+                                   xtr_nh = tol/2.,
+                                   fillet = 0, # chamfer
+                                   radius = 2*self.in_fillet-kcomp.TOL,
+                                   plane_fill = self.axis_d.negative(),
+                                   both_planes = 0,
+                                   edge_dir = edge_dir,
+                                   pos = pos_06)
+
+            #    --------------- step 07 ---------------------------
+            #    A hole to be able to see inside, could be on one side or both
+            #
+            #    hold_hole_2sides = 1:
+            #              axis_h                   axis_h
+            #                :                        :
+            #             ___:___                     :____________
+            #            /  ___  \                    |  ._______ .|
+            #            |:|   |:|                    | :|_______| |
+            #            | |___| |                    |  ..........|
+            #            |_______|                    |            |
+            #     _______|       |_______             |________   /
+            #    (_______|_______|_______)..>axis_w   |________|/......>axis_d
+            #
+            #    hold_hole_2sides = 0:
+            #              axis_h                   axis_h
+            #                :                        :
+            #             ___:___                     :____________
+            #            /  ___  \                    |  ._______ .|
+            #            2:|   | |<-Not a hole here   3 *________| |
+            #            | |___| |                    |  ..........|
+            #            |_______|                    |            |
+            #     _______|       |_______             |________   /
+            #    (_______|_______|_______)..>axis_w   |________|/......>axis_d
+            #           -2 pos_w                pos_d = 1
+
+            if self.hold_hole_2sides == 1:
+                hold_hole_w = self.hold_w
+            else:
+                hold_hole_w = self.wall_thick
+            # position of point 7:
+            # height of point 7, is the center of the tensioner:
+            pos_07 = self.get_pos_dwh(1,-2,3)
+            shp07 = fcfun.shp_box_dir_xtr (
+                                           box_w = hold_hole_w,
+                                           box_d =  self.hold_d
+                                                  - 2*wall_thick,
+                                           box_h = tens_h/2.,
+                                           fc_axis_h = self.axis_h,
+                                           fc_axis_d = self.axis_d,
+                                           fc_axis_w = self.axis_w,
+                                           ch = 1, cd = 0, cw = 0,
+                                           xtr_w = 1, xtr_nw = 1,
+                                           pos=pos_07)
+            # chamfer the edges
+            shp07 = fcfun.shp_filletchamfer_dir (shp=shp07, fc_axis=self.axis_w,
+                                                 fillet = 0, radius=tens_h/6)
+            # /* --------------- step 08 ---------------------------
+            #    A hole for the leadscrew
+            #            axis_h             axis_h
+            #              :                  :
+            #           ___:___               :____________
+            #          /  ___  \              |  ._______ .|
+            #          |:| O |:|              |::|_______| |
+            #          | |___| |              |  ..........|
+            #          |_______|              |            |
+            #   _______|       |_______       |________   /
+            #  (_______|_______|_______)      |________|/......> axis_d
+            #
+            pos_08 = self.get_pos_h(3)
+            shp08 = fcfun.shp_cylcenxtr (r = self.bolttens_r_tol,
+                                         h = wall_thick,
+                                         normal = self.axis_d,
+                                         ch = 0, xtr_top=1, xtr_bot=1,
+                                         pos = pos_08)
+
+            #    --------------- step 09 ---------------------------
+            steps.step('union')
+            #    09a: Fuse all the elements to cut
+            #    09b: Cut the box with the elements to cut
+            #    09c: Fuse the base with the holder
+            #    09d: chamfer the union
+            #            axis_h           axis_h
+            #              :               :
+            #           ___:___            :____________
+            #          /  ___  \           |  ._______ .|
+            #          |:| O |:|           |::|_______| |...
+            #         /| |___| |\          |  ..........|...belt_h/2 -tensnut_ap_tol
+            #        / |_______| \         |            |  :+tens_pos_h
+            #   ____/__A       B__\____    A________   /   :  ...
+            #  (_______|_______|_______)   |________|/.....:.....hold_bas_h
+            #
+            with fcprof.stage('boolean'):
+                if batch_bool == 1:
+                    # a single cut with all the tools
+                    shp09b = shp05.cut([shp06, shp07, shp08])
+                else:
+                    shp09a = fcfun.fuseshplist([shp06, shp07, shp08])
+                    shp09b = shp05.cut(shp09a)
+                shp09c = shp09b.fuse(shp02) # fuse with the base
+                # refine shape, needed by the chamfer
+                shp09c = shp09c.removeSplitter()
+
+            # chamfer the union, points A and B:
+            # Radius of chamfer
+            chmf_rad = min(self.rim_w/2, self.belt_pos_h - tens_h/2.)
+            # add the points A,B to the list to have the edges chamfered
+            pts = [self.get_pos_dwh(0,2,1), self.get_pos_dwh(0,-2,1)]
+            shp09d = fcfun.shp_filletchamfer_dirpts (shp=shp09c,
+                                                     fc_axis=self.axis_d,
+                                                     fc_pts=pts,
+                                                     fillet = 0,
+                                                     radius=chmf_rad)
+            if batch_bool == 0:
+                # if batch_bool, it will be refined at the end
+                with fcprof.stage('boolean'):
+                    shp09d = shp09d.removeSplitter() # refine shape
+
+
+            #    --------------- step 10 ---------------------------
+            #    Bolt holes to attach the piece to the aluminum profile
+            steps.step('bolt_holes')
+            #
+            #             axis_h            axis_h
+            #            ___:___              :____________
+            #           /  ___  \             |  ._______ .|
+            #           |:| O |:|             |::|_______| |
+            #          /| |___| |\            |  ..........|
+            #         / |_______| \           |            |
+            #    ____/__|       |__\____      |________   /
+            #   (__::___|_______|___::__)     |___::___|/....axis_d
+            #      -3   pos_w        3      pos_d 2
+
+            #             hold_w   aluprof_w
+            #            ...+... ...+...
+            #    _______:_______:_______:.......axis_w
+            #   |       |       |       |    :
+            #   |   A   |       |   B   |    + hold_bas_d
+            #   |_______|       |_______|....:
+            #           |       |   :
+            #           |_______|   :
+            #               :       :
+            #               :.......:
+            #                   +
+            #               (hold_w+aluprof_w)/2
+
+            shp_bolt_list = []
+            for w_i in [-3,3]:
+                # points A and B
+                pt_i = self.get_pos_dwh(2,w_i,0)
+                shp_i = fcfun.shp_bolt_dir(
+                           r_shank = self.boltaluprof_r_tol,
+                           l_bolt = self.hold_bas_h +2*self.boltaluprof_head_r_tol,
+                           r_head = self.washer_aluprof_r_tol,
+                           # extra head, just in case
+                           l_head = 2*self.boltaluprof_head_l,
+                           xtr_head = 1, xtr_shank = 1,
+                           support = 0,
+                           fc_normal = self.axis_h.negative(),
+                           pos_n = 2, #at the end of the shank
+                           pos = pt_i)
+                shp_bolt_list.append(shp_i)
+            with fcprof.stage('boolean'):
+                if batch_bool == 1:
+                    shp10_final = shp09d.cut(shp_bolt_list)
+                else:
+                    shp10_bolts = fcfun.fuseshplist(shp_bolt_list)
+                    shp10_final = shp09d.cut(shp10_bolts)
+                shp10_final = shp10_final.removeSplitter()
+            steps.end()
+
+            self.shp = shp10_final
+            shpcache.save_shp(self.shp_key, self.shp)
+
+        self.set_shp_builder(build_shp)
+
+        # normal axes to print without support: the back of the holder
+        # (pos_d = 0) on the bed
+        self.prnt_ax = self.axis_d
+
         #Part.show(shp10_final)
 
 #doc = FreeCAD.newDocument()
@@ -1709,6 +1805,7 @@ class PartTensionerHolder (fc_clss.SinglePart, ShpTensionerHolder):
                  pos_w = 0,
                  pos_h = 0,
                  pos = V0,
+                 batch_bool = 0,
                  model_type = 0, #exact
                  name = ''):
 
@@ -1737,7 +1834,8 @@ class PartTensionerHolder (fc_clss.SinglePart, ShpTensionerHolder):
                                pos_d = pos_d,
                                pos_w = pos_w,
                                pos_h = pos_h,
-                               pos = pos)
+                               pos = pos,
+                               batch_bool = batch_bool)
         fc_clss.SinglePart.__init__(self)
 
 
@@ -1907,6 +2005,9 @@ class TensionerSet (fc_clss.PartsSet):
         4: at the top of the holder
     pos : FreeCAD.Vector
         position of the piece
+    batch_bool : int
+        boolean strategy of the idler tensioner and the tensioner holder,
+        see ShpIdlerTensioner and ShpTensionerHolder
 
     Paramenters for the set
 
@@ -1964,6 +2065,7 @@ class TensionerSet (fc_clss.PartsSet):
                  pos_w = 0,
                  pos_h = 0,
                  pos = V0,
+                 batch_bool = 0,
                  group = 0,
                  name = ''):
 
@@ -2004,7 +2106,8 @@ class TensionerSet (fc_clss.PartsSet):
                                  pos_d = 0,
                                  pos_w = 0,
                                  pos_h = 0,
-                                 pos = pos)
+                                 pos = pos,
+                                 batch_bool = batch_bool)
 
         self.append_part(idler_tensioner)
         idler_tensioner.parent = self
@@ -2032,6 +2135,7 @@ class TensionerSet (fc_clss.PartsSet):
                                pos_w = 0,
                                pos_h = 0,
                                pos = pos,
+                               batch_bool = batch_bool,
                                model_type = 0) #exact
 
         self.append_part(tensioner_holder)
@@ -0,0 +1,350 @@
+# ----------------------------------------------------------------------------
+# -- Parameter sweep of the tensioner set
+# ----------------------------------------------------------------------------
+# -- (c) Felipe Machado
+# -- Area of Electronic Technology. Rey Juan Carlos University (urjc.es)
+# -- https://github.com/felipe-m/freecad_filter_stage
+# -- October-2026
+# ----------------------------------------------------------------------------
+# --- LGPL Licence
+# ----------------------------------------------------------------------------
+#
+# Builds a family of tensioner_clss.TensionerSet variants, taking all the
+# combinations of a grid of parameters. Each variant is built in a process
+# of a pool, in its own document, and for each variant the tensioner holder
+# and the idler tensioner are saved as BREP and STL.
+# A summary table (CSV) has the parameters, the main dimensions, the volumes
+# and the times of each variant.
+#
+# The name of each variant is like the ones in the freecad directory:
+#   tensioner_set_aluprof20_h12_5_strk10
+#
+# Execute it from this directory (src), with FreeCADCmd or with python having
+# the FreeCAD lib directory in the PYTHONPATH:
+#   python3 tensioner_sweep.py belt_pos_h=12.5,22.5,47.5 tens_stroke=10,20
+#   python3 tensioner_sweep.py aluprof_w=15,20 --processes 8 --output sweep/
+#
+# or from python:
+#   rows = tensioner_sweep.sweep({'belt_pos_h': [12.5, 22.5],
+#                                 'tens_stroke' : [10., 20.]})
+
+import os
+import sys
+import csv
+import argparse
+import itertools
+import logging
+import concurrent.futures
+
+import FreeCAD
+import Part
+
+# to get the current directory. Freecad has to be executed from the same
+# directory this file is
+filepath = os.getcwd()
+# to get the components
+sys.path.append(filepath)
+sys.path.append(filepath + '/' + 'comps')
+
+# path to save the variants
+sweep_path = filepath + '/../sweep/'
+
+import kcomp   # import material constants and other constants
+import fcprof  # clock to measure the times
+
+from fcfun import V0, VX, VZ
+from fcfun import VYN
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# default arguments of the tensioner set, the same as tensioner_ex_*.py
+DEFAULT_ARGS = dict(aluprof_w = 20.,
+                    belt_pos_h = 20.,
+                    hold_bas_h = 0,
+                    hold_hole_2sides = 1,
+                    boltidler_mtr = 3,
+                    bolttens_mtr = 3,
+                    boltaluprof_mtr = 3,
+                    tens_stroke = 20.,
+                    wall_thick = 3.,
+                    in_fillet = 2.,
+                    pulley_stroke_dist = 0,
+                    nut_holder_thick = 3.,
+                    opt_tens_chmf = 0,
+                    min_width = 0,
+                    tol = kcomp.TOL)
+
+# errors of the variants that cannot be built: the operations of the
+# shapes fail (impossible dimensions), the values are out of range or
+# there is no constant in kcomp for them (e.g. a metric). The other
+# errors are programming errors, and they stop the sweep
+VARIANT_ERRORS = (Part.OCCError, RuntimeError, ArithmeticError, ValueError,
+                  KeyError)
+
+# parameters that can be swept and their abbreviation in the variant name,
+# in the order they are in the name
+SWEEP_PARAMS = [('aluprof_w', 'aluprof'),
+                ('belt_pos_h', 'h'),
+                ('tens_stroke', 'strk'),
+                ('wall_thick', 'wall'),
+                ('in_fillet', 'fillet'),
+                ('nut_holder_thick', 'nuthold'),
+                ('hold_bas_h', 'bash'),
+                ('hold_hole_2sides', 'hole2s'),
+                ('boltidler_mtr', 'mbidler'),
+                ('bolttens_mtr', 'mbtens'),
+                ('boltaluprof_mtr', 'mbaluprof'),
+                ('pulley_stroke_dist', 'pulldist'),
+                ('opt_tens_chmf', 'chmf'),
+                ('min_width', 'minw'),
+                ('tol', 'tol')]
+
+# columns of the summary, after the parameters
+SUMMARY_COLUMNS = ['tot_d', 'tot_d_extend', 'hold_bas_w', 'hold_h',
+                   'holder_volume', 'idler_volume',
+                   'time_build', 'time_export', 'error']
+
+
+def num_str (value):
+    """ returns the string of a number for a file name:
+    20. -> '20', 12.5 -> '12_5'
+    """
+    if float(value) == int(value):
+        return str(int(value))
+    return str(value).replace('.', '_')
+
+
+def get_variant_name (variant):
+    """ returns the name of the variant, only with the parameters that are
+    swept: tensioner_set_aluprof20_h12_5_strk10
+
+    Parameters:
+    -----------
+    variant : dict
+        parameters of the variant that are swept
+    """
+    name = 'tensioner_set'
+    for param, abbrev in SWEEP_PARAMS:
+        if param in variant:
+            name += '_' + abbrev + num_str(variant[param])
+    return name
+
+
+def get_variant_list (grid):
+    """ returns a list with all the combinations of the grid
+
+    Parameters:
+    -----------
+    grid : dict
+        key: parameter of TensionerSet, value: list of the values of the
+        parameter
+
+    Returns:
+    --------
+    List of dictionaries, each one with the swept parameters of a variant
+    """
+    param_list = [param for param, _ in SWEEP_PARAMS if param in grid]
+    for param in grid:
+        if param not in param_list:
+            logger.error('parameter cannot be swept: ' + param)
+    value_lists = [grid[param] for param in param_list]
+    return [dict(zip(param_list, values))
+            for values in itertools.product(*value_lists)]
+
+
+def build_variant (job):
+    """ Builds a variant in a new document and saves the BREP and STL
+    files of the tensioner holder and the idler tensioner
+    It is executed in the processes of the pool, so it is a module function
+
+    Parameters:
+    -----------
+    job : dict
+        'variant' : swept parameters of the variant
+        'out_path' : path to save the files
+
+    Returns:
+    --------
+    Dictionary with the swept parameters and the SUMMARY_COLUMNS
+    """
+    import tensioner_clss
+
+    variant = job['variant']
+    out_path = job['out_path']
+    name = get_variant_name(variant)
+    row = dict(variant)
+    row['name'] = name
+    row['error'] = ''
+
+    set_args = dict(DEFAULT_ARGS)
+    set_args.update(variant)
+    doc = FreeCAD.newDocument(name)
+    try:
+        time_0 = fcprof.clock()
+        tens_set = tensioner_clss.TensionerSet(axis_d = VX,
+                                               axis_w = VYN,
+                                               axis_h = VZ,
+                                               pos_d = 0,
+                                               pos_w = 0,
+                                               pos_h = 0,
+                                               pos = V0,
+                                               name = name,
+                                               **set_args)
+        time_build = fcprof.clock()
+        holder = tens_set.get_tensioner_holder()
+        idler_tens = tens_set.get_idler_tensioner().get_idler_tensioner()
+        for part in [holder, idler_tens]:
+            shp = part.get_print_shp()
+            shp.exportBrep(out_path + name + '_' + part.name + '.brep')
+            part.export_stl(prefix = name, stl_path = out_path)
+        time_export = fcprof.clock()
+
+        row['tot_d'] = tens_set.tot_d
+        row['tot_d_extend'] = tens_set.tot_d_extend
+        row['hold_bas_w'] = holder.hold_bas_w
+        row['hold_h'] = holder.hold_h
+        row['holder_volume'] = holder.shp.Volume
+        row['idler_volume'] = idler_tens.shp.Volume
+        row['time_build'] = time_build - time_0
+        row['time_export'] = time_export - time_build
+    except VARIANT_ERRORS as exc:
+        logger.error(name + ': ' + repr(exc))
+        row['error'] = repr(exc)
+    finally:
+        FreeCAD.closeDocument(doc.Name)
+    return row
+
+
+def sweep (grid, out_path = sweep_path, processes = None):
+    """ Builds all the variants of the grid, each one in a process of a pool
+
+    Parameters:
+    -----------
+    grid : dict
+        key: parameter of TensionerSet, value: list of the values of the
+        parameter
+    out_path : str
+        path to save the BREP and STL files
+    processes : int
+        number of processes of the pool. None: the number of CPUs
+        1: no pool, the variants are built in this process
+
+    Returns:
+    --------
+    List of dictionaries, one for each variant, see build_variant
+    """
+    if not os.path.isdir(out_path):
+        os.makedirs(out_path)
+    job_list = [{'variant' : variant, 'out_path' : out_path}
+                for variant in get_variant_list(grid)]
+    logger.info(str(len(job_list)) + ' variants')
+    if not job_list:
+        return []
+    if processes is None:
+        processes = os.cpu_count() or 1
+    processes = max(1, min(processes, len(job_list)))
+    if processes == 1:
+        return [build_variant(job) for job in job_list]
+    with concurrent.futures.ProcessPoolExecutor(
+                                    max_workers = processes) as executor:
+        return list(executor.map(build_variant, job_list))
+
+
+def get_summary_fields (rows):
+    """ returns the list of columns of the summary: name, swept parameters
+    and SUMMARY_COLUMNS
+    """
+    param_list = [param for param, _ in SWEEP_PARAMS
+                  if any(param in row for row in rows)]
+    return ['name'] + param_list + SUMMARY_COLUMNS
+
+
+def save_summary (rows, filename):
+    """ saves the summary table of the variants in a CSV file
+    """
+    with open(filename, 'w', newline = '') as csv_file:
+        writer = csv.DictWriter(csv_file,
+                                fieldnames = get_summary_fields(rows),
+                                restval = '')
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+
+
+def print_summary (rows):
+    """ prints the summary table of the variants
+    """
+    print ('%-44s%10s%14s%12s%12s%12s%8s' % ('name', 'tot_d', 'tot_d_extend',
+                                            'hold_bas_w', 'hold_h',
+                                            'build (s)', 'error'))
+    for row in rows:
+        if row['error']:
+            print ('%-44s%s' % (row['name'], row['error']))
+        else:
+            print ('%-44s%10.2f%14.2f%12.2f%12.2f%12.3f' % (
+                                    row['name'], row['tot_d'],
+                                    row['tot_d_extend'], row['hold_bas_w'],
+                                    row['hold_h'], row['time_build']))
+
+
+def parse_value (value):
+    """ gets the value of a parameter of the grid: int if it has no '.'
+    (sizes, number of teeth, metrics...), float if it has
+    """
+    if '.' in value:
+        return float(value)
+    try:
+        return int(value)
+    except ValueError:
+        return float(value) # like 1e3
+
+
+def parse_grid (grid_args):
+    """ gets the grid from a list of strings like 'belt_pos_h=12.5,22.5'
+    """
+    grid = {}
+    for grid_arg in grid_args:
+        try:
+            param, values = grid_arg.split('=')
+            grid[param] = [parse_value(value) for value in values.split(',')]
+        except ValueError:
+            logger.error('wrong parameter of the grid: ' + grid_arg)
+    return grid
+
+
+def get_arg_parser ():
+    parser = argparse.ArgumentParser(
+                description = 'Parameter sweep of the tensioner set')
+    parser.add_argument('grid', nargs = '+',
+                        help = 'parameter=value1,value2,... for example: '
+                               'belt_pos_h=12.5,22.5 tens_stroke=10,20')
+    parser.add_argument('-j', '--processes', type = int,
+                        help = 'number of processes, the CPUs if not given')
+    parser.add_argument('-o', '--output', default = sweep_path,
+                        help = 'path to save the files of the variants')
+    parser.add_argument('-s', '--summary',
+                        help = 'CSV file of the summary, by default: '
+                               'summary.csv in the output path')
+    return parser
+
+
+def main (argv = None):
+    if argv is None:
+        argv = sys.argv[1:]
+    # parse_known_args: FreeCADCmd may pass its own arguments
+    args, _ = get_arg_parser().parse_known_args(argv)
+    out_path = os.path.join(args.output, '')
+    rows = sweep(parse_grid(args.grid), out_path = out_path,
+                 processes = args.processes)
+    print_summary(rows)
+    if args.summary:
+        summary_file = args.summary
+    else:
+        summary_file = out_path + 'summary.csv'
+    save_summary(rows, summary_file)
+    return rows
+
+
+if __name__ == '__main__':
+    main()